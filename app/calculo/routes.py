@@ -4,25 +4,7 @@ from builtins import str as py_str
 import re
 import math
 
-def pretty_to_latex(pretty: str) -> str:
-    """Traduce la expresión "bonita" del usuario a código LaTeX."""
-    if not pretty: return ""
-    tex = pretty.strip()
-    tex = re.sub(r'\bsen\(', r'\\sin(', tex, flags=re.I)
-    tex = re.sub(r'\btg\(',  r'\\tan(', tex, flags=re.I)
-    tex = re.sub(r'\btan\(', r'\\tan(', tex, flags=re.I)
-    tex = re.sub(r'\bcos\(', r'\\cos(', tex, flags=re.I)
-    tex = re.sub(r'\bln\(', r'\\ln(', tex, flags=re.I)
-    tex = re.sub(r'log10\(', r'\\log_{10}(', tex, flags=re.I)
-    tex = re.sub(r'log_([0-9A-Za-z]+)\(', r'\\log_{\1}(', tex)
-    tex = re.sub(r'√\(([^)]+)\)', r'\\sqrt{\1}', tex)
-    tex = re.sub(r'√([A-Za-z0-9]+)', r'\\sqrt{\1}', tex)
-    tex = re.sub(r'π', r'\\pi', tex)
-    tex = re.sub(r'\(([^)]+)\)\s*/\s*\(([^)]+)\)', r'\\frac{\1}{\2}', tex)
-    tex = re.sub(r'(\d+)\s*/\s*(\d+)', r'\\frac{\1}{\2}', tex)
-    tex = re.sub(r'([A-Za-z0-9\)\]])\^\(([^)]+)\)', r'\1^{ \2 }', tex)
-    tex = re.sub(r'([A-Za-z0-9\)\]])\^(-?[A-Za-z0-9]+)', r'\1^{ \2 }', tex)
-    return tex
+from app.expresiones import a_latex
 
 def safe_sympify(expr_str):
     """Convierte una cadena a una expresión SymPy, manejando constantes."""
@@ -238,7 +220,7 @@ def integrales():
 
             datos.update({
                 "funcion": expr,
-                "funcion_latex": latex_input if latex_input else pretty_to_latex(expr),
+                "funcion_latex": latex_input if latex_input else a_latex(expr),
                 "tipo_integral": tipo_integral,
                 "limite_a": limite_a_str,
                 "limite_b": limite_b_str,
@@ -0,0 +1,28 @@
+# app/expresiones/__init__.py
+# -*- coding: utf-8 -*-
+"""
+Expresiones escritas por el usuario: reescritura de la sintaxis "bonita"
+(reescritura.py) y el motor que las analiza una vez y las evalúa con
+Fracciones, float o NumPy (motor.py).
+"""
+from .reescritura import reescribir, a_python, a_latex
+from .motor import (
+    HAY_NUMPY,
+    CACHE,
+    CacheExpresiones,
+    Expresion,
+    compilar,
+    valor_exacto,
+)
+
+__all__ = [
+    "reescribir",
+    "a_python",
+    "a_latex",
+    "HAY_NUMPY",
+    "CACHE",
+    "CacheExpresiones",
+    "Expresion",
+    "compilar",
+    "valor_exacto",
+]
@@ -0,0 +1,538 @@
+# app/expresiones/motor.py
+# -*- coding: utf-8 -*-
+"""
+Motor de expresiones compartido por todas las calculadoras.
+
+Una expresión se analiza (``ast``) y se valida contra la lista blanca una
+sola vez; de ese mismo árbol salen, cuando se piden, sus evaluadores:
+
+- ``exacta()``: Fraction para los números (matrices, vectores...);
+- ``flotante()``: float de Python, como el antiguo ``eval`` de f(x);
+- ``vectorial()``: arrays de NumPy, f(x) sobre una malla en una llamada;
+- ``con_derivada()``: (f(x), f'(x)) con números duales (derivación
+  automática hacia delante), para Newton-Raphson.
+
+Los evaluadores que se llaman muchas veces (flotante, vectorial, derivada)
+son el árbol validado compilado a bytecode (una ``lambda`` con las
+variables como argumentos) con otro espacio de nombres, así que evaluar
+cuesta lo mismo que una función escrita a mano. Las expresiones se guardan
+en una LRU (``CACHE``) con clave el texto y las opciones.
+
+``bonita=True`` reescribe antes la sintaxis "bonita" (sen, π, 2x, |x|...,
+ver reescritura.py); con ``bonita=False`` el texto ya es Python (así llega
+f(x) a los métodos numéricos) y ``^`` se lee igual como potencia.
+"""
+import ast
+import math
+import operator
+from collections import OrderedDict
+from fractions import Fraction
+from threading import Lock
+
+from .reescritura import a_python
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él no hay evaluador vectorial
+    np = None
+
+HAY_NUMPY = np is not None
+
+# Expresiones compiladas que se conservan (las más recientes)
+MAX_EXPRESIONES_CACHE = 4096
+
+
+def a_fraccion_si_aplica(x):
+    if isinstance(x, Fraction):
+        return x
+    if isinstance(x, int):
+        return Fraction(x, 1)
+    if isinstance(x, float):
+        return Fraction(x).limit_denominator(10_000)
+    if isinstance(x, str):
+        try:
+            return Fraction(x)
+        except Exception:
+            return float(x)
+    return x
+
+
+# ========= Espacios de nombres de cada evaluador =========
+
+def _sec(x):
+    return 1 / math.cos(x)
+
+
+def _csc(x):
+    return 1 / math.sin(x)
+
+
+def _cot(x):
+    return 1 / math.tan(x)
+
+
+def _ln(x):
+    return math.log(x)
+
+
+# nombres permitidos en expresiones (funciones y constantes); incluye los
+# que SymPy entendía en Newton-Raphson y secante (ln, sec, E...)
+NOMBRES_PERMITIDOS = {
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+    "sec": _sec,
+    "csc": _csc,
+    "cot": _cot,
+    "asin": math.asin,
+    "acos": math.acos,
+    "atan": math.atan,
+    "sinh": math.sinh,
+    "cosh": math.cosh,
+    "tanh": math.tanh,
+    "asinh": math.asinh,
+    "acosh": math.acosh,
+    "atanh": math.atanh,
+    "sqrt": math.sqrt,
+    "raiz": math.sqrt,
+    "exp": math.exp,
+    "pi": math.pi,
+    "e": math.e,
+    "E": math.e,
+    "log": math.log,  # log(x) o log(x, base)
+    "ln": _ln,
+    "log10": math.log10,
+    "abs": abs,
+    "frac": lambda a, b: Fraction(a, b),
+}
+
+NOMBRES_FLOTANTES = dict(NOMBRES_PERMITIDOS, frac=lambda a, b: a / b)
+
+if HAY_NUMPY:
+    def _log_np(x, base=None):
+        return np.log(x) if base is None else np.log(x) / np.log(base)
+
+    NOMBRES_NUMPY = {
+        "sin": np.sin,
+        "cos": np.cos,
+        "tan": np.tan,
+        "sec": lambda x: 1 / np.cos(x),
+        "csc": lambda x: 1 / np.sin(x),
+        "cot": lambda x: 1 / np.tan(x),
+        "asin": np.arcsin,
+        "acos": np.arccos,
+        "atan": np.arctan,
+        "sinh": np.sinh,
+        "cosh": np.cosh,
+        "tanh": np.tanh,
+        "asinh": np.arcsinh,
+        "acosh": np.arccosh,
+        "atanh": np.arctanh,
+        "sqrt": np.sqrt,
+        "raiz": np.sqrt,
+        "exp": np.exp,
+        "pi": math.pi,
+        "e": math.e,
+        "E": math.e,
+        "log": _log_np,
+        "ln": np.log,
+        "log10": np.log10,
+        "abs": np.abs,
+        "frac": np.true_divide,
+    }
+
+
+class _Dual:
+    """Número dual v + d·ε (ε² = 0): ``d`` es la derivada respecto de x."""
+
+    __slots__ = ("v", "d")
+
+    def __init__(self, v, d=0.0):
+        self.v = v
+        self.d = d
+
+    def __add__(self, o):
+        if isinstance(o, _Dual):
+            return _Dual(self.v + o.v, self.d + o.d)
+        return _Dual(self.v + o, self.d)
+
+    __radd__ = __add__
+
+    def __sub__(self, o):
+        if isinstance(o, _Dual):
+            return _Dual(self.v - o.v, self.d - o.d)
+        return _Dual(self.v - o, self.d)
+
+    def __rsub__(self, o):
+        return _Dual(o - self.v, -self.d)
+
+    def __mul__(self, o):
+        if isinstance(o, _Dual):
+            return _Dual(self.v * o.v, self.d * o.v + self.v * o.d)
+        return _Dual(self.v * o, self.d * o)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, o):
+        if isinstance(o, _Dual):
+            return _Dual(self.v / o.v, (self.d * o.v - self.v * o.d) / (o.v * o.v))
+        return _Dual(self.v / o, self.d / o)
+
+    def __rtruediv__(self, o):
+        return _Dual(o / self.v, -o * self.d / (self.v * self.v))
+
+    def __pow__(self, o):
+        if isinstance(o, _Dual) and o.d:
+            v = self.v ** o.v
+            return _Dual(v, v * (o.d * math.log(self.v) + o.v * self.d / self.v))
+        if isinstance(o, _Dual):
+            o = o.v
+        if o == 0:
+            return _Dual(self.v ** o, 0.0)
+        return _Dual(self.v ** o, o * self.v ** (o - 1) * self.d)
+
+    def __rpow__(self, o):
+        v = o ** self.v
+        return _Dual(v, v * math.log(o) * self.d if self.d else 0.0)
+
+    def __neg__(self):
+        return _Dual(-self.v, -self.d)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return _Dual(abs(self.v), self.d if self.v > 0 else -self.d if self.v < 0 else 0.0)
+
+
+def _dual(f, df):
+    """f aplicada a un número o a un dual (regla de la cadena con f')."""
+    def g(a):
+        if isinstance(a, _Dual):
+            return _Dual(f(a.v), df(a.v) * a.d if a.d else 0.0)
+        return f(a)
+    return g
+
+
+def _log_dual(x, base=None):
+    if base is None:
+        return _dual(math.log, lambda v: 1 / v)(x)
+    if not isinstance(x, _Dual) and not isinstance(base, _Dual):
+        return math.log(x, base)
+    return _log_dual(x) / _log_dual(base)
+
+
+NOMBRES_DUALES = dict(
+    NOMBRES_FLOTANTES,
+    sin=_dual(math.sin, math.cos),
+    cos=_dual(math.cos, lambda v: -math.sin(v)),
+    tan=_dual(math.tan, lambda v: 1 / math.cos(v) ** 2),
+    sec=_dual(_sec, lambda v: _sec(v) * math.tan(v)),
+    csc=_dual(_csc, lambda v: -_csc(v) * _cot(v)),
+    cot=_dual(_cot, lambda v: -1 / math.sin(v) ** 2),
+    asin=_dual(math.asin, lambda v: 1 / math.sqrt(1 - v * v)),
+    acos=_dual(math.acos, lambda v: -1 / math.sqrt(1 - v * v)),
+    atan=_dual(math.atan, lambda v: 1 / (1 + v * v)),
+    sinh=_dual(math.sinh, math.cosh),
+    cosh=_dual(math.cosh, math.sinh),
+    tanh=_dual(math.tanh, lambda v: 1 / math.cosh(v) ** 2),
+    asinh=_dual(math.asinh, lambda v: 1 / math.sqrt(v * v + 1)),
+    acosh=_dual(math.acosh, lambda v: 1 / math.sqrt(v * v - 1)),
+    atanh=_dual(math.atanh, lambda v: 1 / (1 - v * v)),
+    sqrt=_dual(math.sqrt, lambda v: 0.5 / math.sqrt(v)),
+    raiz=_dual(math.sqrt, lambda v: 0.5 / math.sqrt(v)),
+    exp=_dual(math.exp, math.exp),
+    log=_log_dual,
+    ln=_dual(_ln, lambda v: 1 / v),
+    log10=_dual(math.log10, lambda v: 1 / (v * math.log(10))),
+)
+
+
+# ========= Análisis y validación =========
+
+_OPS_BIN = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow)
+_OPS_UNI = (ast.UAdd, ast.USub)
+
+
+def _validar(node, variables, sinonimos):
+    """
+    Comprueba ``node`` contra la lista blanca y lo devuelve listo para
+    compilar (los sinónimos con el nombre de su variable). Cualquier otra
+    cosa lanza ValueError.
+    """
+    # Número literal
+    if isinstance(node, ast.Constant):
+        if isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+            return node
+        raise ValueError("Constante no permitida")
+
+    # Operaciones binarias: +, -, *, /, **
+    if isinstance(node, ast.BinOp):
+        if not isinstance(node.op, _OPS_BIN):
+            raise ValueError("Nodo no soportado en la expresión")
+        node.left = _validar(node.left, variables, sinonimos)
+        node.right = _validar(node.right, variables, sinonimos)
+        return node
+
+    # Operaciones unarias: +x, -x
+    if isinstance(node, ast.UnaryOp):
+        if not isinstance(node.op, _OPS_UNI):
+            raise ValueError("Nodo no soportado en la expresión")
+        node.operand = _validar(node.operand, variables, sinonimos)
+        return node
+
+    # Llamadas a funciones: sin(...), sqrt(...), log(...), frac(...)
+    if isinstance(node, ast.Call):
+        nombre = getattr(node.func, "id", "?")
+        if not isinstance(node.func, ast.Name) or nombre not in NOMBRES_PERMITIDOS:
+            raise ValueError(f"Función no permitida: {nombre}")
+        if node.keywords:
+            raise ValueError(f"Argumentos con nombre no permitidos en {nombre}")
+        node.args = [_validar(arg, variables, sinonimos) for arg in node.args]
+        return node
+
+    # Nombres sueltos: variables, pi, e, etc.
+    if isinstance(node, ast.Name):
+        if node.id in sinonimos:
+            node.id = sinonimos[node.id]
+        if node.id in variables or node.id in NOMBRES_PERMITIDOS:
+            return node
+        raise ValueError(f"Nombre no permitido: {node.id}")
+
+    # Cualquier otra cosa (incluido un * suelto de f(*args)): no lo soportamos
+    raise ValueError("Nodo no soportado en la expresión")
+
+
+_OPERADORES = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Pow: operator.pow,
+}
+
+
+def _cierre(node, variables):
+    """
+    Cierre ``f(valores)`` que evalúa ``node`` (ya validado) con Fracciones:
+    cada número se convierte una vez, al construirlo.
+    """
+    if isinstance(node, ast.Constant):
+        valor = a_fraccion_si_aplica(node.value)
+        return lambda v: valor
+
+    if isinstance(node, ast.BinOp):
+        op = _OPERADORES[type(node.op)]
+        izq = _cierre(node.left, variables)
+        der = _cierre(node.right, variables)
+        return lambda v: op(izq(v), der(v))
+
+    if isinstance(node, ast.UnaryOp):
+        operando = _cierre(node.operand, variables)
+        if isinstance(node.op, ast.USub):
+            return lambda v: -operando(v)
+        return operando
+
+    if isinstance(node, ast.Call):
+        func = NOMBRES_PERMITIDOS[node.func.id]
+        args = [_cierre(arg, variables) for arg in node.args]
+        return lambda v: func(*[a(v) for a in args])
+
+    if node.id in variables:
+        i = variables.index(node.id)
+        return lambda v: v[i]
+    valor = NOMBRES_PERMITIDOS[node.id]
+    return lambda v: valor
+
+
+def _lambda(cuerpo, variables, nombres):
+    """Función con las ``variables`` como argumentos que evalúa ``cuerpo``."""
+    argumentos = ast.arguments(
+        posonlyargs=[],
+        args=[ast.arg(arg=v) for v in variables],
+        kwonlyargs=[],
+        kw_defaults=[],
+        defaults=[],
+    )
+    arbol = ast.fix_missing_locations(ast.Expression(ast.Lambda(argumentos, cuerpo)))
+    return eval(compile(arbol, "<expresión>", "eval"), dict(nombres, __builtins__={}))
+
+
+_SIN_VALOR = object()
+
+
+class Expresion:
+    """
+    Forma analizada y validada de ``texto``. Si no es válida, ``error``
+    guarda el motivo y pedir cualquier evaluador lanza ValueError con él.
+    """
+
+    __slots__ = (
+        "texto", "python", "variables", "arbol", "error",
+        "_exacta", "_flotante", "_vectorial", "_derivada", "_valor",
+    )
+
+    def __init__(self, texto, variables=(), bonita=True, sinonimos=None):
+        texto = str(texto)
+        self.texto = texto
+        self.variables = tuple(variables)
+        # ^ se cambia antes de analizar: como BitXor tendría otra precedencia
+        self.python = a_python(texto) if bonita else texto.strip().replace("^", "**")
+        self.arbol = None
+        self.error = None
+        self._exacta = self._flotante = self._vectorial = self._derivada = None
+        self._valor = _SIN_VALOR
+        try:
+            self.arbol = _validar(
+                ast.parse(self.python, mode="eval").body, self.variables, sinonimos or {}
+            )
+        except SyntaxError:
+            self.error = f"Expresión no válida: {self.python}"
+        except Exception as e:
+            self.error = str(e) or f"Expresión no válida: {self.python}"
+
+    def _compilar(self, nombres):
+        if self.error is not None:
+            raise ValueError(self.error)
+        return _lambda(self.arbol, self.variables, nombres)
+
+    def exacta(self):
+        """
+        Evaluador con Fracciones (los float de las funciones quedan float).
+        Es un árbol de cierres y no bytecode: construirlo es mucho más
+        barato, y una celda de una matriz casi siempre se evalúa una vez.
+        """
+        if self._exacta is None:
+            if self.error is not None:
+                raise ValueError(self.error)
+            fn = _cierre(self.arbol, self.variables)
+            self._exacta = lambda *valores: fn(valores)
+        return self._exacta
+
+    def flotante(self):
+        """Evaluador escalar con float de Python."""
+        if self._flotante is None:
+            self._flotante = self._compilar(NOMBRES_FLOTANTES)
+        return self._flotante
+
+    def vectorial(self):
+        """
+        Evaluador con arrays de NumPy: los errores de dominio y los valores
+        complejos dan NaN (o ±inf) sin avisos y el resultado es un array
+        float con la forma de los argumentos aunque la expresión sea
+        constante.
+        """
+        if not HAY_NUMPY:
+            raise RuntimeError("El evaluador vectorial necesita NumPy.")
+        if self._vectorial is None:
+            fn = self._compilar(NOMBRES_NUMPY)
+
+            def evaluar(*valores):
+                with np.errstate(all="ignore"):
+                    y = np.asarray(fn(*valores))
+                if np.iscomplexobj(y):
+                    y = np.where(y.imag == 0, y.real, np.nan)
+                y = y.astype(float, copy=False)
+                forma = np.broadcast_shapes(*(np.shape(v) for v in valores))
+                if y.shape != forma:
+                    y = np.broadcast_to(y, forma).copy()
+                return y
+
+            self._vectorial = evaluar
+        return self._vectorial
+
+    def con_derivada(self):
+        """
+        Evaluador de (f(x), f'(x)) para una expresión de una variable, con
+        números duales: f' sale exacta (salvo redondeo) en la misma pasada.
+        """
+        if self._derivada is None:
+            if len(self.variables) != 1:
+                raise ValueError("La derivada necesita una sola variable.")
+            fn = self._compilar(NOMBRES_DUALES)
+
+            def evaluar(x):
+                y = fn(_Dual(x, 1.0))
+                if isinstance(y, _Dual):
+                    return y.v, y.d
+                return y, 0.0
+
+            self._derivada = evaluar
+        return self._derivada
+
+    def valor(self):
+        """
+        Valor exacto de una expresión sin variables, calculado una vez. Si
+        no compila o falla al evaluarse se usa el respaldo de ``float`` y si
+        no, ValueError("Expresión no válida: ...").
+        """
+        if self._valor is _SIN_VALOR:
+            try:
+                self._valor = self.exacta()()
+            except Exception:
+                try:
+                    self._valor = a_fraccion_si_aplica(float(self.python))
+                except Exception:
+                    self._valor = None
+        if self._valor is None:
+            raise ValueError(f"Expresión no válida: {self.python}")
+        return self._valor
+
+
+class CacheExpresiones:
+    """LRU de expresiones analizadas con clave el texto tal como llega."""
+
+    def __init__(self, max_entradas=MAX_EXPRESIONES_CACHE):
+        self.max_entradas = max_entradas
+        self.aciertos = 0
+        self.fallos = 0
+        self._datos = OrderedDict()
+        self._lock = Lock()
+
+    def obtener(self, texto, variables=(), bonita=True, sinonimos=None):
+        clave = (texto, tuple(variables), bonita,
+                 tuple(sorted(sinonimos.items())) if sinonimos else ())
+        with self._lock:
+            expr = self._datos.get(clave)
+            if expr is not None:
+                self._datos.move_to_end(clave)
+                self.aciertos += 1
+                return expr
+            self.fallos += 1
+
+        expr = Expresion(texto, variables, bonita, sinonimos)
+        with self._lock:
+            self._datos[clave] = expr
+            while len(self._datos) > self.max_entradas:
+                self._datos.popitem(last=False)
+        return expr
+
+    def limpiar(self):
+        with self._lock:
+            self._datos.clear()
+
+    def estadisticas(self):
+        return {
+            "entradas": len(self._datos),
+            "max_entradas": self.max_entradas,
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+        }
+
+
+# Caché compartida del proceso (todas las calculadoras)
+CACHE = CacheExpresiones()
+
+
+def compilar(texto, variables=(), bonita=True, sinonimos=None):
+    """
+    Expresion de ``texto`` (de la caché). ``variables`` son los argumentos
+    de sus evaluadores y ``sinonimos`` otros nombres aceptados para ellas
+    ({"y": "x"}).
+    """
+    return CACHE.obtener(str(texto), variables, bonita, sinonimos)
+
+
+def valor_exacto(texto):
+    """Valor de una expresión "bonita" sin variables (ver Expresion.valor)."""
+    return CACHE.obtener(texto).valor()
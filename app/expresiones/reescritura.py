@@ -0,0 +1,295 @@
+# app/expresiones/reescritura.py
+# -*- coding: utf-8 -*-
+"""
+Reescritura de expresiones "bonitas" (sen, tg, raiz, π, ln, log_n(x),
+|x|, ^, multiplicación implícita...) en una sola pasada.
+
+La entrada se parte en tokens con una única expresión regular y se recorre
+una vez, produciendo a la vez:
+
+- la expresión con sintaxis de Python que usa el evaluador seguro
+  (``normalizar_expresion`` en gauss/algebra.py), y
+- la forma LaTeX que muestran las vistas de cálculo.
+
+Reglas (las mismas que aplicaba la cadena de ``re.sub``):
+
+    sen, asen, tg → sin, asin, tan     ln(x) → log(x)     log₁₀(x) → log10(x)
+    log_n(x) → log(x, n)               √(x), √x → sqrt(x)  π → pi
+    ×, · → *     ÷ → /     ^ → **      |x| → abs(x)
+    2x, 2(x), x(2), (a)(b), (a)x → con * explícito
+
+y en LaTeX: \\sin, \\tan, \\cos, \\ln, \\log_{10}, \\log_{n}, \\sqrt{...},
+\\pi, \\frac{a}{b} para enteros y (a)/(b), y x^{ ... } para las potencias.
+
+A diferencia de las expresiones regulares, los paréntesis se emparejan de
+verdad: log_2(sqrt(4)), √(1+(2)) o (a+(b))/(c) se reescriben enteros.
+"""
+import re
+
+# cada token lleva delante los espacios que lo preceden:
+# (espacios, número, nombre, otro símbolo)
+_TOKEN = re.compile(
+    r"(\s*)(?:([0-9]+(?:\.[0-9]+)?|\.[0-9]+)|([A-Za-z_][A-Za-z0-9_]*(?:₁₀)?)|(\*\*|.))",
+    re.DOTALL,
+)
+_FIN = ("", "", "", "")
+_LOG_BASE = re.compile(r"log_([0-9A-Za-z]+)", re.IGNORECASE)
+
+# nombres en español o con otra grafía (en minúsculas) → Python
+NOMBRES_PYTHON = {
+    "sen": "sin",
+    "asen": "asin",
+    "acos": "acos",
+    "atan": "atan",
+    "tg": "tan",
+    "cos": "cos",
+    "log10": "log10",
+    "log₁₀": "log10",
+}
+# funciones con comando propio en LaTeX (solo seguidas de paréntesis)
+NOMBRES_LATEX = {
+    "sen": r"\sin",
+    "sin": r"\sin",
+    "tg": r"\tan",
+    "tan": r"\tan",
+    "cos": r"\cos",
+    "ln": r"\ln",
+    "log10": r"\log_{10}",
+    "log₁₀": r"\log_{10}",
+}
+SIMBOLOS_PYTHON = {"×": "*", "·": "*", "÷": "/", "^": "**"}
+
+# clases del último token significativo (para * implícito, ^ y \frac)
+_NUM, _NOMBRE, _LETRA, _CIERRE, _CORCHETE, _OP = range(6)
+# tras estas clases, π, √ y |x| se multiplican de forma implícita
+_FACTORES = (_NUM, _NOMBRE, _LETRA, _CIERRE)
+# símbolos que pasan igual a Python y a LaTeX
+_SIMPLES = frozenset("+-*,=<>!%&~") | {"**"}
+
+
+def _reescribir(toks):
+    """(python, latex) de una lista de tokens; ver el módulo."""
+    py, tex = [], []
+    # paréntesis abiertos: (cierre py, cierre tex, índice tex, plano); las
+    # barras de |x| abiertas son (None, None, índice py, False)
+    pila = []
+    previo = None           # clase del último token
+    num_tex = None          # índice en tex del último entero (para a/b)
+    grupo = None            # (inicio, fin) en tex del último (…) plano
+    frac = None             # "num" | "grupo": denominador de \frac pendiente
+    n = len(toks)
+    i = 0
+    while i < n:
+        esp, num, nombre, t = toks[i]
+        sig = toks[i + 1] if i + 1 < n else _FIN
+        i += 1
+        if esp and frac is None:
+            tex.append(esp)
+
+        if num:
+            py.append(esp)
+            py.append(num)
+            if frac == "num":
+                tex.append("{" + num + "}")
+                frac = num_tex = None
+            else:
+                tex.append(num)
+                num_tex = len(tex) - 1 if num.isdigit() else None
+            previo = _NUM
+            grupo = None
+            continue
+
+        if nombre:
+            # * implícito: 2x, (a)x
+            py.append("*" if previo == _NUM or previo == _CIERRE else esp)
+            llamada = sig[3] == "(" and not sig[0]
+            bajo = nombre.lower()
+            grupo = num_tex = None
+            if llamada and bajo.startswith("log_"):
+                base = _LOG_BASE.fullmatch(nombre)
+                if base:
+                    # log_n(x) -> log(x, n)
+                    py.append("log(")
+                    tex.append(r"\log_{" + base.group(1) + "}(")
+                    pila.append((f", {base.group(1)})", ")", None, False))
+                    previo = None
+                    i += 1
+                    continue
+            if llamada and bajo == "ln":
+                py.append("log")
+            else:
+                py.append(NOMBRES_PYTHON.get(bajo, nombre))
+            tex.append(NOMBRES_LATEX[bajo] if llamada and bajo in NOMBRES_LATEX else nombre)
+            previo = _LETRA if len(nombre) == 1 else _NOMBRE
+            continue
+
+        if t in _SIMPLES:
+            py.append(esp)
+            py.append(t)
+            tex.append(t)
+            previo = _OP
+            grupo = num_tex = None
+            continue
+
+        if t == "(":
+            # * implícito: 2(x), x(2), (a)(b)
+            py.append("*" if previo in (_NUM, _CIERRE, _LETRA) else esp)
+            py.append("(")
+            if frac == "grupo":
+                tex.append("{")
+                pila.append((")", "}", None, False))
+                frac = None
+            else:
+                tex.append("(")
+                pila.append((")", ")", len(tex) - 1, previo != _NOMBRE))
+            previo = None
+            grupo = num_tex = None
+            continue
+
+        if t == ")":
+            if pila and pila[-1][0] is not None:
+                cierre_py, cierre_tex, inicio, plano = pila.pop()
+            else:
+                cierre_py, cierre_tex, inicio, plano = ")", ")", None, False
+            py.append(esp)
+            py.append(cierre_py)
+            tex.append(cierre_tex)
+            grupo = (inicio, len(tex) - 1) if plano else None
+            previo = _CIERRE
+            num_tex = None
+            continue
+
+        if t == "/":
+            py.append(esp)
+            py.append("/")
+            if num_tex is not None and sig[1].isdigit():
+                # a/b con enteros -> \frac{a}{b}
+                del tex[num_tex + 1:]
+                tex[num_tex] = r"\frac{" + tex[num_tex] + "}"
+                frac = "num"
+            elif grupo is not None and sig[3] == "(":
+                # (a)/(b) -> \frac{a}{b}
+                inicio, fin = grupo
+                del tex[fin + 1:]
+                tex[inicio] = r"\frac{"
+                tex[fin] = "}"
+                frac = "grupo"
+            else:
+                tex.append("/")
+            previo = _OP
+            grupo = num_tex = None
+            continue
+
+        grupo = num_tex = None
+
+        if t == "^":
+            py.append(esp)
+            py.append("**")
+            if previo is not None and previo != _OP and not sig[0]:
+                if sig[3] == "(":
+                    # x^(n+1) -> x^{ n+1 }: los paréntesis no se muestran
+                    py.append("(")
+                    tex.append("^{ ")
+                    pila.append((")", " }", None, False))
+                    previo = None
+                    i += 1
+                    continue
+                signo = ""
+                k = i
+                if sig[3] == "-" and k + 1 < n:
+                    signo = "-"
+                    k += 1
+                _, a_num, a_nombre, _ = toks[k] if k < n else _FIN
+                a_esp = toks[k][0] if k < n else ""
+                # x^2, x^-1, x^n (no x^sen(...), que es una llamada)
+                a_llamada = k + 1 < n and toks[k + 1][3] == "(" and not toks[k + 1][0]
+                if not a_esp and (a_num or (a_nombre and not a_llamada)):
+                    atomo = a_num or a_nombre
+                    py.append(signo + NOMBRES_PYTHON.get(atomo.lower(), atomo))
+                    tex.append("^{ " + signo + atomo + " }")
+                    previo = _CIERRE
+                    i = k + 1
+                    continue
+            tex.append("^")
+            previo = _OP
+            continue
+
+        if t == "π":
+            py.append("*" if previo in _FACTORES else esp)
+            py.append("pi")
+            tex.append(r"\pi " if sig[2] and not sig[0] else r"\pi")
+            previo = _CIERRE
+            continue
+
+        if t == "√":
+            if sig[3] == "(" and not sig[0]:
+                py.append("*" if previo in _FACTORES else esp)
+                py.append("sqrt(")
+                tex.append(r"\sqrt{")
+                pila.append((")", "}", None, False))
+                previo = None
+                i += 1
+                continue
+            # radicando: números y nombres seguidos, sin espacios
+            j = i
+            while j < n and not toks[j][0] and (toks[j][1] or toks[j][2]):
+                j += 1
+            if j == i:
+                py.append(esp)
+                py.append(t)
+                tex.append(t)
+                previo = _OP
+                continue
+            py.append("*" if previo in _FACTORES else esp)
+            r_py, r_tex = _reescribir(toks[i:j])
+            py.append("sqrt(" + r_py + ")")
+            tex.append(r"\sqrt{" + r_tex + "}")
+            previo = _CIERRE
+            i = j
+            continue
+
+        if t == "|":
+            # cierra el |…| abierto si viene tras un factor; si no, abre otro
+            # (así |x + |y|| se anida)
+            if pila and pila[-1][0] is None and previo is not None and previo != _OP:
+                pila.pop()
+                py.append(esp)
+                py.append(")")
+                previo = _CIERRE
+            else:
+                py.append("*" if previo in _FACTORES else esp)
+                py.append("abs(")
+                pila.append((None, None, len(py) - 1, False))
+                previo = None
+            tex.append(t)
+            continue
+
+        py.append(esp)
+        py.append(SIMBOLOS_PYTHON.get(t, t))
+        tex.append(t)
+        previo = _CORCHETE if t == "]" else _OP
+
+    # una barra sin pareja se queda como estaba (y el evaluador la rechaza)
+    for cierre_py, _, inicio, _ in pila:
+        if cierre_py is None:
+            py[inicio] = "|"
+    return "".join(py), "".join(tex)
+
+
+def reescribir(expr):
+    """(expresión de Python, LaTeX) de una expresión "bonita", en una pasada."""
+    if not isinstance(expr, str):
+        expr = str(expr)
+    return _reescribir(_TOKEN.findall(expr.strip()))
+
+
+def a_python(expr):
+    """Solo la expresión con sintaxis de Python."""
+    return reescribir(expr)[0]
+
+
+def a_latex(expr):
+    """Solo la forma LaTeX ("" si la expresión está vacía)."""
+    if not expr:
+        return ""
+    return reescribir(expr)[1]
@@ -1,7 +1,6 @@
 from flask import Blueprint, render_template, request, jsonify
-from ..gauss.pygauss_ext import gauss_jordan_solve
+from ..gauss.pygauss_ext import solution_space, solution_spaces, fraction_fmt
 from ..gauss.algebra import EvaluadorSeguro
-from fractions import Fraction
 import re
 
 aplicaciones_bp = Blueprint("aplicaciones", __name__, template_folder="../../../templates")
@@ -34,53 +33,35 @@ def resolver_economia():
     try:
         n = len(tabla_raw)
         evaluador = EvaluadorSeguro()
+        M = evaluador.evaluar_tabla(tabla_raw)
         
         # 1. Construir sistema (M - I)
         A_sistema = []
         for i in range(n):
             fila = []
             for j in range(n):
-                val = evaluador.evaluar(str(tabla_raw[i][j]))
+                val = M[i][j]
                 if i == j: val -= 1
                 fila.append(val)
             A_sistema.append(fila)
 
-        b = [0] * n
-        
-        # 2. Resolver
-        res = gauss_jordan_solve(A_sistema, b, keep_steps=False)
-        
-        # 3. Extraer Vector de Proporciones (Base Numérica)
-        # Suponemos que la última columna es la variable libre (común en estos problemas)
-        # Si x_i + c*x_n = 0  ->  x_i = -c * x_n
-        rref = res.get("rref_matrix", []) # Matriz de cadenas fraccionarias
-        
-        vector_base = [0.0] * n
-        # Por defecto, asumimos que la última variable es la libre y vale 1
-        idx_libre = n - 1
-        vector_base[idx_libre] = 1.0
-        
-        if res["status"] == "infinite":
-            # Extraer coeficientes de la columna de la variable libre
-            for i in range(n):
-                if i != idx_libre and i < len(rref):
-                    # El valor en la columna libre (última)
-                    val_str = rref[i][idx_libre] # string "num/den"
-                    try:
-                        frac = Fraction(val_str)
-                        # En RREF: x_i + val * x_libre = 0  => x_i = -val * x_libre
-                        vector_base[i] = float(-frac)
-                    except:
-                        pass
-        elif res["status"] == "unique":
-            # Todo es cero
+        # 2. Resolver (M - I)x = 0: rango, pivotes y base del núcleo exactos
+        espacio = solution_space(A_sistema)
+        status = espacio.status
+
+        # 3. Vector de Proporciones (Base Numérica)
+        # Vector del núcleo de la última variable libre (vale 1; las demás
+        # libres valen 0). Si la solución es única, todo es cero.
+        if espacio.null_space:
+            vector_base = [float(v) for v in espacio.null_space[-1]]
+        else:
             vector_base = [0.0] * n
 
         # 4. Formatear Texto de Salida
         lineas_finales = []
         mapa_vars = {f"x{i+1}": f"P({nombres[i]})" for i in range(n)}
         
-        for linea in res["lines"]:
+        for linea in espacio.lines():
             txt = linea
             for k in range(n, 0, -1):
                 key = f"x{k}"
@@ -90,18 +71,16 @@ def resolver_economia():
 
         # Interpretación
         interpretacion = ""
-        if res["status"] == "infinite":
+        if status == "infinite":
             interpretacion = (
                 "<strong>Equilibrio Relativo:</strong> Los precios dependen unos de otros. "
                 "Usa la calculadora abajo para asignar un valor a un sector y ver cómo afecta a los demás."
             )
-        elif res["status"] == "unique":
+        elif status == "unique":
             interpretacion = "Solución trivial (todos ceros). Revisa si la suma de columnas es 1."
         else:
             interpretacion = "El sistema es inconsistente."
 
-        if "steps" in res: del res["steps"] # No queremos pasos
-
         return jsonify({
             "ok": True, 
             "resultado": { "lines": lineas_finales },
@@ -118,20 +97,48 @@ def resolver_economia():
 def vista_economia_abierto():
     return render_template("economia_abierto.html", title="Economía: Modelo Abierto")
 
+def _produccion_por_sector(espacio, mapa_vars):
+    """Solución exacta → [{"sector", "valor", "raw"}] (o líneas si no es única)."""
+    lineas_finales = []
+    if espacio.status == "unique":
+        # Valores numéricos directos de la solución particular
+        for i, valor in enumerate(espacio.particular):
+            var_key = f"x{i+1}"
+            valor_str = fraction_fmt(valor)
+
+            # Convertir a decimal para visualización monetaria
+            txt_valor = formatear_linea(valor_str, usar_decimales=True)
+
+            lineas_finales.append({
+                "sector": mapa_vars.get(var_key, var_key),
+                "valor": txt_valor,
+                "raw": valor_str
+            })
+    else:
+        # Caso raro en economía real (sistema singular), devolvemos las líneas crudas
+        for linea in espacio.lines():
+            lineas_finales.append({"sector": "Ecuación", "valor": linea})
+    return lineas_finales
+
 @aplicaciones_bp.route("/economia-abierto/resolver", methods=["POST"])
 def resolver_economia_abierto():
     datos = request.get_json(force=True)
     matriz_A_raw = datos.get("matriz_A", [])
     vector_d_raw = datos.get("vector_d", [])
+    # Opcional: varios escenarios de demanda externa para la misma matriz A
+    vectores_d_raw = datos.get("vectores_d", [])
     nombres = datos.get("nombres", [])
     usar_decimales = datos.get("usar_decimales", False)
 
+    if not vector_d_raw and vectores_d_raw:
+        vector_d_raw = vectores_d_raw[0]
     if not matriz_A_raw or not vector_d_raw:
         return jsonify({"ok": False, "error": "Faltan datos (Matriz A o Vector d)"}), 400
 
     try:
         n = len(matriz_A_raw)
         evaluador = EvaluadorSeguro()
+        A = evaluador.evaluar_tabla(matriz_A_raw)
 
         # 1. Construir el sistema (I - A)x = d
         # Elemento (i, j) del sistema será:
@@ -142,7 +149,7 @@ def resolver_economia_abierto():
         for i in range(n):
             fila = []
             for j in range(n):
-                val_A = evaluador.evaluar(str(matriz_A_raw[i][j]))
+                val_A = A[i][j]
                 if i == j:
                     val_sistema = 1 - val_A
                 else:
@@ -151,53 +158,39 @@ def resolver_economia_abierto():
             sistema_M.append(fila)
 
         # Vector b es la demanda externa (d)
-        vector_b = [evaluador.evaluar(str(x)) for x in vector_d_raw]
+        vector_b = evaluador.evaluar_vector(vector_d_raw)
 
         # 2. Resolver usando Gauss-Jordan
-        res = gauss_jordan_solve(sistema_M, vector_b, keep_steps=False)
-
-        # 3. Formatear salida
-        lineas_finales = []
-        produccion_total = {}
-        
         # Mapa de variables x1 -> C, x2 -> I, etc.
         mapa_vars = {f"x{i+1}": nombres[i] if i < len(nombres) else f"Sector {i+1}" for i in range(n)}
 
-        # Procesar los resultados
-        # En un sistema compatible determinado (única solución), gauss_jordan devuelve líneas tipo "x1 = 1250"
-        
-        if res["status"] == "unique":
-            # Extraer valores numéricos para mostrarlos limpios
-            # Las líneas vienen como "x1 = 2000". Parseamos eso.
-            for linea in res["lines"]:
-                # linea ejemplo: "x1 = 2500"
-                partes = linea.split("=")
-                if len(partes) == 2:
-                    var_key = partes[0].strip() # x1
-                    valor_str = partes[1].strip() # 2500
-                    
-                    nombre_real = mapa_vars.get(var_key, var_key)
-                    
-                    # Convertir a decimal para visualización monetaria
-                    txt_valor = formatear_linea(valor_str, usar_decimales=True) 
-                    
-                    lineas_finales.append({
-                        "sector": nombre_real,
-                        "valor": txt_valor,
-                        "raw": valor_str
-                    })
+        escenarios = []
+        if vectores_d_raw:
+            # (I - A) se factoriza una sola vez para todos los escenarios
+            Dt = evaluador.evaluar_tabla(vectores_d_raw)
+            D = [[d[i] for d in Dt] for i in range(n)]
+            espacios = solution_spaces(sistema_M, D)
+            for esp in espacios:
+                escenarios.append({
+                    "status": esp.status,
+                    "solucion": _produccion_por_sector(esp, mapa_vars),
+                })
+        if vectores_d_raw and vector_d_raw is vectores_d_raw[0]:
+            espacio = espacios[0]
         else:
-            # Caso raro en economía real (sistema singular), devolvemos las líneas crudas
-            for linea in res["lines"]:
-                lineas_finales.append({"sector": "Ecuación", "valor": linea})
+            espacio = solution_space(sistema_M, vector_b)
+
+        # 3. Formatear salida
+        lineas_finales = _produccion_por_sector(espacio, mapa_vars)
 
         interpretacion = "Se han calculado los niveles de producción necesarios para satisfacer tanto la demanda interna como la externa."
 
         return jsonify({
             "ok": True,
             "solucion": lineas_finales,
-            "status": res["status"],
-            "interpretacion": interpretacion
+            "status": espacio.status,
+            "interpretacion": interpretacion,
+            **({"escenarios": escenarios} if escenarios else {})
         })
 
     except Exception as e:
@@ -226,11 +219,9 @@ def resolver_leontief_demanda():
         evaluador = EvaluadorSeguro()
 
         # 1. Evaluar Matriz C y Vector X
-        C = []
-        for fila in matriz_C_raw:
-            C.append([evaluador.evaluar(str(val)) for val in fila])
+        C = evaluador.evaluar_tabla(matriz_C_raw)
         
-        X = [evaluador.evaluar(str(val)) for val in vector_X_raw]
+        X = evaluador.evaluar_vector(vector_X_raw)
 
         # 2. Calcular Demanda Interna (DI = C * X)
         # DI[i] = Sum(C[i][j] * X[j])
@@ -1,5 +1,27 @@
 from fractions import Fraction
-import math, ast, re
+import re
+
+from app.expresiones import a_python
+from app.expresiones.motor import a_fraccion_si_aplica, valor_exacto
+
+from .eliminacion import (
+    crear_motor,
+    Eliminacion,
+    INTERCAMBIO,
+    ESCALA,
+    PIVOTEO_POR_MOTOR,
+)
+from .factorizacion import CACHE, MOTORES_EXACTOS
+from .racional import MatrizRacional
+from .pivoteo import crear_pivoteo
+from .refinamiento import rref_refinada
+from .modular import rref_modular
+from .pygauss_ext import (
+    solve_from_ref,
+    solve_from_rref,
+    solution_to_strings,
+    solution_space_from_rref,
+)
 
 
 def es_casi_cero(x, tol=1e-12):
@@ -17,21 +39,6 @@ def identity(n):
     return I
 
 
-def a_fraccion_si_aplica(x):
-    if isinstance(x, Fraction):
-        return x
-    if isinstance(x, int):
-        return Fraction(x, 1)
-    if isinstance(x, float):
-        return Fraction(x).limit_denominator(10_000)
-    if isinstance(x, str):
-        try:
-            return Fraction(x)
-        except Exception:
-            return float(x)
-    return x
-
-
 class FormateadorNumeros:
     def __init__(self, modo="fraccion", decimales=6):
         self.modo = modo
@@ -77,168 +84,118 @@ def normalizar_expresion(expr: str) -> str:
     Convierte una expresión "bonita" (sen, tg, raiz, pi, ln, log10, log_n(x),
     valor absoluto, multiplicación implícita, potencias con ^, etc.)
     a una expresión de sintaxis Python compatible con el evaluador.
+    La reescritura se hace en una sola pasada (ver app/expresiones/reescritura.py).
     """
-    if not isinstance(expr, str):
-        expr = str(expr)
-    s = expr.strip()
-
-    # trigonométricas en español -> nombres de Python
-    s = re.sub(r"asen", "asin", s, flags=re.IGNORECASE)
-    s = re.sub(r"acos", "acos", s, flags=re.IGNORECASE)
-    s = re.sub(r"atan", "atan", s, flags=re.IGNORECASE)
-    s = re.sub(r"sen", "sin", s, flags=re.IGNORECASE)
-    s = re.sub(r"\btg", "tan", s, flags=re.IGNORECASE)
-    s = re.sub(r"cos", "cos", s, flags=re.IGNORECASE)
-
-    # logs
-    s = re.sub(r"\bln\(", "log(", s, flags=re.IGNORECASE)
-    s = re.sub(r"log10\(", "log10(", s, flags=re.IGNORECASE)
-    # log con subíndice 10 escrito como carácter especial
-    s = s.replace("log₁₀(", "log10(")
-    # log_n(x) -> log(x, n)
-    s = re.sub(
-        r"log_([0-9A-Za-z]+)\s*\(\s*([^)]+)\s*\)",
-        r"log(\2, \1)",
-        s,
-        flags=re.IGNORECASE,
-    )
+    return a_python(expr)
 
-    # raíz: símbolo de raíz -> sqrt()
-    s = s.replace("√(", "sqrt(")
-    s = re.sub(r"√([A-Za-z0-9.]+)", r"sqrt(\1)", s)
 
-    # pi
-    s = s.replace("π", "pi")
+# ========= Evaluación de tablas completas =========
 
-    # operaciones unicode
-    s = s.replace("×", "*").replace("·", "*").replace("÷", "/")
+# entero o a/b tal cual (sin ceros a la izquierda, que Python no admite)
+_LITERAL_RACIONAL = re.compile(
+    r"\s*([+-]?)\s*(0|[1-9][0-9]*)\s*(?:/\s*([1-9][0-9]*)\s*)?", re.ASCII
+)
 
-    # potencias ^ -> **
-    s = s.replace("^", "**")
 
-    # valor absoluto |x|
-    s = re.sub(r"\|([^|]+)\|", r"abs(\1)", s)
+def literal_racional(texto):
+    """
+    Fraction de un entero o de un cociente a/b escritos tal cual, sin pasar
+    por ast; None si ``texto`` es otra cosa (y entonces se usa el evaluador).
+    El valor es el mismo que da el evaluador.
+    """
+    m = _LITERAL_RACIONAL.fullmatch(texto)
+    if m is None:
+        return None
+    signo, num, den = m.groups()
+    try:
+        v = Fraction(int(num), int(den) if den else 1)
+    except ValueError:
+        return None     # más dígitos de los que int() admite
+    return -v if signo == "-" else v
+
+
+def _evaluar_celda(texto, valores, evaluar, donde):
+    """Valor de una celda ya recortada, reutilizando el de otra igual."""
+    v = valores.get(texto)
+    if v is not None:
+        return v
+    if texto == "":
+        raise ValueError(f"Hay celdas vacías en la matriz ({donde()}).")
+    v = literal_racional(texto)
+    if v is None:
+        try:
+            v = evaluar(texto)
+        except Exception as e:
+            raise ValueError(f"En la {donde()}: {e}") from None
+    if v is not None:
+        valores[texto] = v
+    return v
 
-    # multiplicación implícita: 2x, 3(x+1)
-    s = re.sub(
-        r"(^|[^0-9A-Za-z_.])(\d+(?:\.\d+)?)\s*([A-Za-z(])",
-        r"\1\2*\3",
-        s,
-    )
-    # a(x) -> a*(x) si 'a' es letra
-    s = re.sub(
-        r"(^|[^A-Za-z0-9_])([A-Za-z])\s*\(",
-        r"\1\2*(",
-        s,
-    )
-    # )( -> )*(
-    s = re.sub(r"\)\s*\(", ")*(", s)
-    # )x -> )*x
-    s = re.sub(r"\)\s*([A-Za-z])", r")*\1", s)
 
-    return s
+def evaluar_tabla(tabla, evaluar=None):
+    """
+    Evalúa una tabla de celdas (lista de filas, p. ej. la matriz pegada en
+    el formulario) de una vez: comprueba que es rectangular, evalúa cada
+    texto distinto una sola vez y resuelve enteros y a/b sin ast. Los
+    errores indican la fila y la columna de la celda.
+
+    ``evaluar`` es la función de una celda (por defecto la de
+    EvaluadorSeguro, con su caché de expresiones compiladas).
+    """
+    if evaluar is None:
+        evaluar = EvaluadorSeguro().evaluar
+    if not isinstance(tabla, (list, tuple)) or not all(isinstance(f, (list, tuple)) for f in tabla):
+        raise ValueError("La matriz debe ser una lista de filas.")
+    if any(len(f) != len(tabla[0]) for f in tabla):
+        raise ValueError("Las filas no tienen el mismo número de columnas.")
+    valores = {}
+    return [
+        [
+            _evaluar_celda(str(celda).strip(), valores, evaluar,
+                           lambda: f"fila {i+1}, columna {j+1}")
+            for j, celda in enumerate(fila)
+        ]
+        for i, fila in enumerate(tabla)
+    ]
+
+
+def evaluar_vector(vector, evaluar=None):
+    """Como evaluar_tabla para una sola lista de celdas (un vector)."""
+    if evaluar is None:
+        evaluar = EvaluadorSeguro().evaluar
+    if not isinstance(vector, (list, tuple)):
+        raise ValueError("El vector debe ser una lista de valores.")
+    valores = {}
+    return [
+        _evaluar_celda(str(celda).strip(), valores, evaluar, lambda: f"entrada {j+1}")
+        for j, celda in enumerate(vector)
+    ]
 
 
 # ========= Evaluador seguro =========
 
+# El análisis, la lista blanca y la caché son los del motor compartido
+# (app/expresiones/motor.py); aquí solo se evalúan celdas sin variables.
 
-class EvaluadorSeguro:
-    nombres = {
-        "pi": math.pi,
-        "e": math.e,
-        "sin": math.sin,
-        "cos": math.cos,
-        "tan": math.tan,
-        "sqrt": math.sqrt,
-        "raiz": math.sqrt,
-    }
-    ops_bin = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow)
-    ops_uni = (ast.UAdd, ast.USub)
 
+class EvaluadorSeguro:
     def evaluar(self, expr: str):
-        # nombres permitidos en expresiones
-        allowed_names = {
-            "sin": math.sin,
-            "cos": math.cos,
-            "tan": math.tan,
-            "asin": math.asin,
-            "acos": math.acos,
-            "atan": math.atan,
-            "sqrt": math.sqrt,
-            "raiz": math.sqrt,
-            "pi": math.pi,
-            "e": math.e,
-            "log": math.log,  # log(x) o log(x, base)
-            "log10": math.log10,
-            "abs": abs,
-            "frac": lambda a, b: Fraction(a, b),
-        }
+        return valor_exacto(str(expr))
 
-        expr = normalizar_expresion(str(expr))
+    def evaluar_tabla(self, tabla):
+        """Ver ``evaluar_tabla``."""
+        return evaluar_tabla(tabla, self.evaluar)
 
-        try:
-            node = ast.parse(expr, mode="eval")
-            return self._evaluate_node(node.body, allowed_names)
-        except Exception:
-            # Fallback simple para números directos
-            try:
-                return a_fraccion_si_aplica(float(expr))
-            except Exception:
-                raise ValueError(f"Expresión no válida: {expr}")
-
-    def _evaluate_node(self, node, allowed_names):
-        # Número literal
-        if isinstance(node, ast.Num):  # Python < 3.8
-            return a_fraccion_si_aplica(node.n)
-        if isinstance(node, ast.Constant):  # Python 3.8+
-            return a_fraccion_si_aplica(node.value)
-
-        # Operaciones binarias: +, -, *, /, **
-        if isinstance(node, ast.BinOp):
-            left = self._evaluate_node(node.left, allowed_names)
-            right = self._evaluate_node(node.right, allowed_names)
-
-            if isinstance(node.op, ast.Add):
-                return left + right
-            elif isinstance(node.op, ast.Sub):
-                return left - right
-            elif isinstance(node.op, ast.Mult):
-                return left * right
-            elif isinstance(node.op, ast.Div):
-                if right == 0:
-                    raise ValueError("División por cero")
-                return left / right
-            elif isinstance(node.op, ast.Pow):
-                return left ** right
-
-        # Operaciones unarias: +x, -x
-        if isinstance(node, ast.UnaryOp):
-            operand = self._evaluate_node(node.operand, allowed_names)
-            if isinstance(node.op, ast.USub):
-                return -operand
-            elif isinstance(node.op, ast.UAdd):
-                return operand
-
-        # Llamadas a funciones: sin(...), sqrt(...), log(...), frac(...)
-        if isinstance(node, ast.Call):
-            if isinstance(node.func, ast.Name) and node.func.id in allowed_names:
-                func = allowed_names[node.func.id]
-                args = [self._evaluate_node(arg, allowed_names) for arg in node.args]
-                return func(*args)
-            else:
-                raise ValueError(f"Función no permitida: {getattr(node.func, 'id', '?')}")
+    def evaluar_vector(self, vector):
+        """Ver ``evaluar_vector``."""
+        return evaluar_vector(vector, self.evaluar)
 
-        # Nombres sueltos: pi, e, etc.
-        if isinstance(node, ast.Name):
-            if node.id in allowed_names:
-                return allowed_names[node.id]
-            raise ValueError(f"Nombre no permitido: {node.id}")
 
-        # Cualquier otra cosa: no lo soportamos
-        raise ValueError("Nodo no soportado en la expresión")
+# ========= Clases de pasos y matriz =========
 
 
-# ========= Clases de pasos y matriz =========
+# Cada cuántos pasos delta se emite una matriz completa (fotograma clave)
+PASOS_ENTRE_CLAVES = 16
 
 
 class PasoOperacion:
@@ -247,9 +204,63 @@ class PasoOperacion:
         self.matriz = [[fmt(v) for v in f] for f in matriz]
         self.col_pivote = col_pivote
 
+    def como_dict(self):
+        return {
+            "descripcion": self.descripcion,
+            "matriz": self.matriz,
+            "col_pivote": self.col_pivote,
+        }
+
+
+class PasoDelta:
+    """Paso compacto: solo guarda las filas que cambió la operación."""
+
+    def __init__(self, desc, filas, fmt, col_pivote=None):
+        self.descripcion = desc
+        self.filas = [[r, [fmt(v) for v in fila]] for r, fila in filas]
+        self.col_pivote = col_pivote
+
+    def como_dict(self):
+        return {
+            "descripcion": self.descripcion,
+            "filas": self.filas,
+            "col_pivote": self.col_pivote,
+        }
+
+
+def expandir_pasos(pasos):
+    """
+    Reconstruye la matriz completa de cada paso. Acepta pasos completos
+    (con "matriz", que actúan como fotograma clave) y pasos delta (con
+    "filas": [[indice, [valores...]], ...]).
+    """
+    actual = None
+    salida = []
+    for p in pasos:
+        if p.get("matriz") is not None:
+            actual = [list(f) for f in p["matriz"]]
+        else:
+            if actual is None:
+                raise ValueError("El primer paso debe incluir la matriz completa.")
+            actual = actual[:]
+            for r, fila in p.get("filas", []):
+                actual[r] = list(fila)
+        salida.append(
+            {
+                "descripcion": p.get("descripcion", ""),
+                "matriz": actual,
+                "col_pivote": p.get("col_pivote"),
+            }
+        )
+    return salida
+
 
 class MatrizAumentada:
     def __init__(self, datos):
+        # datos: filas de números o una MatrizRacional (enteros por fila)
+        self.racional = datos if isinstance(datos, MatrizRacional) else None
+        if self.racional is not None:
+            datos = self.racional.fracciones()
         if not datos or any(len(f) != len(datos[0]) for f in datos):
             raise ValueError("La matriz debe ser rectangular y no vacía.")
         self.m = len(datos)
@@ -260,17 +271,199 @@ class MatrizAumentada:
     def copiar(self):
         return [f[:] for f in self.a]
 
+    def para_motor(self):
+        """Datos de entrada del motor (filas enteras si las hay)."""
+        return self.racional if self.racional is not None else self.a
 
-# ========= Gauss-Jordan =========
 
+class _ResolverConPasos:
+    """
+    Registro de pasos común a Gauss y Gauss-Jordan.
+
+    formato_pasos="completo" guarda la matriz entera en cada paso;
+    formato_pasos="delta" guarda solo las filas afectadas y una matriz
+    completa cada PASOS_ENTRE_CLAVES pasos (ver expandir_pasos);
+    formato_pasos="ninguno" solo los cuenta (se piden luego con
+    pasos_en_rango, ver sesiones.py).
+
+    pivoteo: estrategia de pivote (ver pivoteo.py); por defecto la del motor.
+
+    pasos_diferidos=True: no se formatean pasos ahora, pero se pedirán
+    después (pasos="diferidos"), así que total_pasos debe ser el del motor
+    exacto que los reproduce.
+
+    motor="refinamiento": Gauss-Jordan sin pasos (formato_pasos="ninguno" y
+    sin pasos diferidos) de un sistema cuadrado con solución única se
+    resuelve por refinamiento iterativo en precisión mixta (ver
+    refinamiento.py; el final lleva "refinamiento": {"rondas": k}). Así
+    no se registra ninguna operación y pasos_contados queda en False. Con
+    pasos, o si el refinamiento no es aplicable, se elimina con el motor
+    exacto.
+
+    motor="modular": igual, pero por imágenes módulo varios primos
+    calculadas en paralelo (ver modular.py; el final lleva "modular":
+    {"primos": k}); sirve también para sistemas no cuadrados o singulares.
+    """
 
-class ResolverGaussJordan:
-    def __init__(self, formateador: FormateadorNumeros):
+    reducida = True
+
+    def __init__(
+        self,
+        formateador: FormateadorNumeros,
+        motor="fracciones",
+        formato_pasos="completo",
+        pivoteo=None,
+        pasos_diferidos=False,
+    ):
         self.pasos = []
+        self.total_pasos = 0
+        self.pasos_contados = True
         self.formateador = formateador
+        self.motor = motor
+        self.pivoteo = pivoteo or PIVOTEO_POR_MOTOR.get(motor, "parcial")
+        crear_pivoteo(self.pivoteo)  # nombre desconocido: ValueError aquí
+        self.formato_pasos = formato_pasos
+        self.pasos_diferidos = pasos_diferidos
+
+    def _paso(self, op, motor):
+        """Paso formateado de ``op`` (None con formato_pasos="ninguno")."""
+        indice = self.total_pasos
+        self.total_pasos += 1
+        if self.formato_pasos == "ninguno":
+            return None
+        d = self._descripcion(op)
+        if self.formato_pasos == "delta" and indice % PASOS_ENTRE_CLAVES:
+            filas = [op.fila, op.otra] if op.tipo == INTERCAMBIO else [op.fila]
+            return PasoDelta(
+                d,
+                [(r, motor.fila(r)) for r in filas],
+                self.formateador.fmt,
+                op.col,
+            )
+        return PasoOperacion(d, motor.fracciones(), self.formateador.fmt, op.col)
+
+    def resolver(self, matriz: MatrizAumentada):
+        self.pasos = []
+        final = None
+        for tipo, dato in self.iterar(matriz):
+            if tipo == "paso":
+                self.pasos.append(dato)
+            else:
+                final = dato
+        return {"pasos": self.pasos, "final": final}
+
+    def iterar(self, matriz: MatrizAumentada):
+        """
+        Versión generadora de resolver(): produce ("paso", dict) en cuanto
+        se aplica cada operación y termina con ("final", dict). No guarda
+        la lista de pasos, así que sirve para enviarlos en streaming.
+        """
+        self.total_pasos = 0
+        self.pasos_contados = True
+        motor_nombre = self._motor_eliminacion()
+        if (
+            self.motor == "refinamiento"
+            and self.formato_pasos == "ninguno"
+            and not self.pasos_diferidos
+            and self.reducida
+        ):
+            res = rref_refinada(matriz.para_motor())
+            if res is not None:
+                R, pivotes, rondas = res
+                final = self._final(matriz, R, pivotes)
+                final["refinamiento"] = {"rondas": rondas}
+                self.pasos_contados = False
+                yield "final", final
+                return
+        if (
+            self.motor == "modular"
+            and self.formato_pasos == "ninguno"
+            and not self.pasos_diferidos
+            and self.reducida
+        ):
+            res = rref_modular(matriz.para_motor())
+            if res is not None:
+                R, pivotes, primos = res
+                final = self._final(matriz, R, pivotes)
+                final["modular"] = {"primos": primos}
+                self.pasos_contados = False
+                yield "final", final
+                return
+        if (
+            self.formato_pasos == "ninguno"
+            and self.reducida
+            and motor_nombre in MOTORES_EXACTOS
+        ):
+            # Sin pasos que formatear basta la factorización de A: si ya está
+            # en la caché solo se reproducen sus operaciones sobre b
+            fact = CACHE.obtener([f[:-1] for f in matriz.a], motor_nombre, self.pivoteo)
+            if not self._sin_pasos(matriz):
+                self.total_pasos = len(fact.operaciones)
+            R = fact.aumentada([f[-1] for f in matriz.a])
+            final = self._final(matriz, R, fact.pivotes)
+            if fact.estadisticas:
+                final["dispersion"] = fact.estadisticas
+            yield "final", final
+            return
+
+        motor = crear_motor(matriz.para_motor(), motor_nombre)
+        elim = Eliminacion(motor, reducida=self.reducida, pivoteo=self.pivoteo)
+        if self._sin_pasos(matriz):
+            elim.ejecutar()
+        else:
+            for op in elim:
+                paso = self._paso(op, motor)
+                if paso is not None:
+                    yield "paso", paso.como_dict()
+        final = self._final(matriz, motor.resultado(), elim.pivotes)
+        if hasattr(motor, "estadisticas"):
+            final["dispersion"] = motor.estadisticas()
+        yield "final", final
+
+    def _sin_pasos(self, matriz):
+        return False
+
+    def _motor_eliminacion(self):
+        # "refinamiento" y "modular" no registran operaciones de fila: los
+        # pasos (y la vuelta atrás) son los del motor exacto
+        return "fracciones" if self.motor in ("refinamiento", "modular") else self.motor
+
+    def pasos_en_rango(self, matriz: MatrizAumentada, desde, hasta):
+        """
+        Reproduce la eliminación y formatea solo los pasos [desde, hasta),
+        siempre con la matriz completa. El recorrido es determinista, así
+        que los pasos coinciden con los de resolver().
+        """
+        pasos = []
+        if hasta <= desde:
+            return pasos
+        motor = crear_motor(matriz.para_motor(), self._motor_eliminacion())
+        fmt = self.formateador.fmt
+        for i, op in enumerate(Eliminacion(motor, reducida=self.reducida, pivoteo=self.pivoteo)):
+            if i >= desde:
+                pasos.append(
+                    PasoOperacion(
+                        self._descripcion(op), motor.fracciones(), fmt, op.col
+                    ).como_dict()
+                )
+                if i + 1 >= hasta:
+                    break
+        return pasos
+
+
+# ========= Gauss-Jordan =========
+
+
+class ResolverGaussJordan(_ResolverConPasos):
+    ultima_rref = None
 
-    def _reg(self, d, A, col_pivote=None):
-        self.pasos.append(PasoOperacion(d, A, self.formateador.fmt, col_pivote))
+    def _descripcion(self, op):
+        fmt = self.formateador.fmt
+        if op.tipo == INTERCAMBIO:
+            return f"F{op.fila+1} ⇄ F{op.otra+1}"
+        if op.tipo == ESCALA:
+            return f"F{op.fila+1} ← F{op.fila+1} / {fmt(op.factor)}"
+        return f"F{op.fila+1} ← F{op.fila+1} - ({fmt(op.factor)})·F{op.otra+1}"
 
     def _es_incompatible(self, A, m, n):
         for r in range(m):
@@ -280,91 +473,56 @@ class ResolverGaussJordan:
                 return True
         return False
 
-    def resolver(self, matriz: MatrizAumentada):
-        A = matriz.copiar()
-        m, np1, n = matriz.m, matriz.np1, matriz.n
+    def _sin_pasos(self, matriz):
+        # inconsistente desde el inicio: sin pasos, pero las columnas pivote
+        # salen del mismo recorrido
+        return self._es_incompatible(matriz.a, matriz.m, matriz.n)
 
-        if self._es_incompatible(A, m, n):
+    def _final(self, matriz, A, pivotes):
+        m, n = matriz.m, matriz.n
+        self.ultima_rref = (A, pivotes)
+        if self._sin_pasos(matriz):
             return {
-                "pasos": [],
-                "final": {
-                    "tipo": "inconsistente",
-                    "descripcion": "El sistema es inconsistente.",
-                    "solucion": None,
-                    "pivotes": [],
-                    "variables_libres": [],
-                },
+                "tipo": "inconsistente",
+                "descripcion": "El sistema es inconsistente.",
+                "solucion": None,
+                "pivotes": [c + 1 for c in pivotes],
+                "variables_libres": [],
+                "lineas": ["Sistema inconsistente: no tiene solución."],
             }
 
-        fila = 0
-        piv_cols = []
-        for col in range(n):
-            piv = None
-            maxabs = 0
-            for r in range(fila, m):
-                try:
-                    val = abs(float(A[r][col]))
-                except Exception:
-                    val = 0
-                if val > maxabs and not es_casi_cero(A[r][col]):
-                    maxabs = val
-                    piv = r
-            if piv is None:
-                continue
-            if piv != fila:
-                A[fila], A[piv] = A[piv], A[fila]
-                self._reg(f"F{fila+1} ⇄ F{piv+1}", A, col_pivote=col)
-            piv_cols.append(col)
-            pv = A[fila][col]
-            for j in range(np1):
-                A[fila][j] = A[fila][j] / pv
-            self._reg(
-                f"F{fila+1} ← F{fila+1} / {self.formateador.fmt(pv)}",
-                A,
-                col_pivote=col,
-            )
-            for r in range(m):
-                if r == fila:
-                    continue
-                factor = A[r][col]
-                if es_casi_cero(factor):
-                    continue
-                for j in range(np1):
-                    A[r][j] -= factor * A[fila][j]
-                self._reg(
-                    f"F{r+1} ← F{r+1} - ({self.formateador.fmt(factor)})·F{fila+1}",
-                    A,
-                    col_pivote=col,
-                )
-            fila += 1
-            if fila == m:
-                break
-
-        tipo, sol, desc, pivotes = self._analizar(A, m, n)
+        tipo, sol, desc, _ = self._analizar(A, m, n)
         sol_dict = (
             {f"x{i+1}": self.formateador.fmt(sol[i]) for i in range(len(sol))}
             if sol
             else None
         )
+        # Lectura directa de la RREF: x1 = ..., Variable libre: xk
+        param = solve_from_rref(A, pivotes)
 
         return {
-            "pasos": [
-                {
-                    "descripcion": p.descripcion,
-                    "matriz": p.matriz,
-                    "col_pivote": p.col_pivote,
-                }
-                for p in self.pasos
-            ],
-            "final": {
-                "tipo": tipo,
-                "descripcion": desc,
-                "solucion": sol_dict,
-                "pivotes": [c + 1 for c in pivotes],
-                "variables_libres": [],
-            },
+            "tipo": tipo,
+            "descripcion": desc,
+            "solucion": sol_dict,
+            "pivotes": [c + 1 for c in pivotes],
+            "variables_libres": [f"x{j+1}" for j in param.free_vars],
+            "lineas": solution_to_strings(param, self.formateador.fmt),
         }
 
+    def espacio_solucion(self):
+        """
+        Rango, solución particular y base del núcleo (números exactos) de la
+        última RREF calculada, sin volver a eliminar (ver
+        pygauss_ext.SolutionSpace).
+        """
+        if self.ultima_rref is None:
+            raise ValueError("Todavía no se ha resuelto ningún sistema.")
+        return solution_space_from_rref(*self.ultima_rref)
+
+    def final_desde_rref(self, matriz: MatrizAumentada, R, pivotes):
+        """Resultado final a partir de una RREF ya calculada (ver incremental.py)."""
+        return self._final(matriz, R, pivotes)
+
     def _analizar(self, A, m, n):
         # Filas del tipo 0 0 ... 0 | b != 0
         for r in range(m):
@@ -393,68 +551,25 @@ class ResolverGaussJordan:
 # ========= Gauss (triangular superior) =========
 
 
-class ResolverGauss:
-    def __init__(self, formateador: FormateadorNumeros):
-        self.pasos = []
-        self.formateador = formateador
+class ResolverGauss(_ResolverConPasos):
+    reducida = False
 
-    def _reg(self, d, A, col_pivote=None):
-        self.pasos.append(PasoOperacion(d, A, self.formateador.fmt, col_pivote))
-
-    def resolver(self, matriz: MatrizAumentada):
-        A = matriz.copiar()
-        m, np1, n = matriz.m, matriz.np1, matriz.n
-        fila = 0
-        for col in range(n):
-            piv = None
-            maxabs = 0
-            for r in range(fila, m):
-                try:
-                    val = abs(float(A[r][col]))
-                except Exception:
-                    val = 0
-                if val > maxabs and not es_casi_cero(A[r][col]):
-                    maxabs = val
-                    piv = r
-            if piv is None:
-                continue
-            if piv != fila:
-                A[fila], A[piv] = A[piv], A[fila]
-                self._reg(f"F{fila+1} ⇄ F{piv+1}", A, col_pivote=col)
-            pv = A[fila][col]
-            if es_casi_cero(pv):
-                continue
-            for j in range(col, np1):
-                A[fila][j] = A[fila][j] / pv
-            self._reg(
-                f"F{fila+1} / {self.formateador.fmt(pv)}", A, col_pivote=col
-            )
-            for r in range(fila + 1, m):
-                factor = A[r][col]
-                if es_casi_cero(factor):
-                    continue
-                for j in range(col, np1):
-                    A[r][j] -= factor * A[fila][j]
-                self._reg(
-                    f"F{r+1} - ({self.formateador.fmt(factor)})·F{fila+1}",
-                    A,
-                    col_pivote=col,
-                )
-            fila += 1
-            if fila == m:
-                break
+    def _descripcion(self, op):
+        fmt = self.formateador.fmt
+        if op.tipo == INTERCAMBIO:
+            return f"F{op.fila+1} ⇄ F{op.otra+1}"
+        if op.tipo == ESCALA:
+            return f"F{op.fila+1} / {fmt(op.factor)}"
+        return f"F{op.fila+1} - ({fmt(op.factor)})·F{op.otra+1}"
 
-        pasos = [
-            {
-                "descripcion": p.descripcion,
-                "matriz": p.matriz,
-                "col_pivote": p.col_pivote,
-            }
-            for p in self.pasos
-        ]
+    def _final(self, matriz, A, pivotes):
+        # Sustitución hacia atrás sobre la misma forma escalonada
+        param = solve_from_ref(A, pivotes)
         return {
-            "pasos": pasos,
-            "final": {"descripcion": "Matriz triangular superior."},
+            "descripcion": "Matriz triangular superior.",
+            "pivotes": [c + 1 for c in pivotes],
+            "variables_libres": [f"x{j+1}" for j in param.free_vars],
+            "lineas": solution_to_strings(param, self.formateador.fmt),
         }
 
 
@@ -0,0 +1,119 @@
+# app/matrices/gauss/bareiss.py
+# -*- coding: utf-8 -*-
+"""
+Motor de eliminación libre de fracciones (Bareiss).
+
+Cada fila de la matriz aumentada se escala UNA sola vez a enteros y toda la
+eliminación se hace con aritmética entera y divisiones exactas (sin gcd).
+La fila r representa los valores ``filas[r][j] / den[r]``; las Fracciones
+solo se reconstruyen cuando hay que formatear un paso o el resultado final.
+
+Implementa la misma interfaz de motor que ``eliminacion.MatrizFracciones``.
+"""
+from fractions import Fraction
+from math import lcm
+
+
+def fila_a_enteros(fila):
+    """Escala una fila de Fracciones a enteros. Devuelve (enteros, escala)."""
+    escala = 1
+    for v in fila:
+        escala = lcm(escala, v.denominator)
+    return [v.numerator * (escala // v.denominator) for v in fila], escala
+
+
+class MatrizBareiss:
+    """Matriz aumentada entera con un denominador por fila."""
+
+    __slots__ = ("m", "np1", "n", "filas", "den", "p_prev")
+
+    def __init__(self, datos):
+        self.m = len(datos)
+        self.np1 = len(datos[0])
+        self.n = self.np1 - 1
+        self.filas = []
+        self.den = []
+        for fila in datos:
+            enteros, escala = fila_a_enteros(fila)
+            self.filas.append(enteros)
+            self.den.append(escala)
+        # último pivote entero usado (divisor exacto de Bareiss)
+        self.p_prev = 1
+
+    @classmethod
+    def desde_racional(cls, M):
+        """Copia las filas enteras de una ``racional.MatrizRacional`` sin
+        pasar por Fracciones."""
+        B = cls.__new__(cls)
+        B.m, B.np1, B.n = M.m, M.ncols, M.ncols - 1
+        B.filas = [f[:] for f in M.filas]
+        B.den = M.den[:]
+        B.p_prev = 1
+        return B
+
+    def valor(self, r, c):
+        return Fraction(self.filas[r][c], self.den[r])
+
+    def es_cero(self, r, c):
+        return self.filas[r][c] == 0
+
+    def magnitud(self, r, c):
+        return Fraction(abs(self.filas[r][c]), abs(self.den[r]))
+
+    def max_fila(self, r):
+        mayor = max(map(abs, self.filas[r][: self.n]), default=0)
+        return Fraction(mayor, abs(self.den[r]))
+
+    def bits(self, r, c):
+        """Bits del valor reducido (no de la escala de la fila, que depende
+        también de b)."""
+        v = self.valor(r, c)
+        return v.numerator.bit_length() + v.denominator.bit_length()
+
+    def nnz_fila(self, r):
+        return sum(1 for v in self.filas[r][: self.n] if v)
+
+    def intercambiar(self, i, j):
+        self.filas[i], self.filas[j] = self.filas[j], self.filas[i]
+        self.den[i], self.den[j] = self.den[j], self.den[i]
+
+    def normalizar(self, f, c):
+        """F_f ← F_f / pivote: solo cambia el denominador de la fila."""
+        pv = self.valor(f, c)
+        self.den[f] = self.filas[f][c]
+        return pv
+
+    def eliminar(self, r, f, c, desde=0):
+        """F_r ← F_r - factor·F_f con la regla de Bareiss. Devuelve el factor."""
+        pk = self.filas[f][c]
+        fr, ff = self.filas[r], self.filas[f]
+        m, pp = fr[c], self.p_prev
+        factor = Fraction(m * self.den[f], self.den[r] * pk)
+        for j in range(desde, self.np1):
+            fr[j] = (pk * fr[j] - m * ff[j]) // pp
+        self.den[r] = self.den[r] * pk // pp
+        return factor
+
+    def reescalar(self, r, f, c, desde=0):
+        """Fila con factor cero: se lleva a la escala del pivote actual."""
+        pk, pp = self.filas[f][c], self.p_prev
+        if pk == pp:
+            return
+        fr = self.filas[r]
+        for j in range(desde, self.np1):
+            fr[j] = fr[j] * pk // pp
+        self.den[r] = self.den[r] * pk // pp
+
+    def cerrar_pivote(self, f, c):
+        self.p_prev = self.filas[f][c]
+
+    def fila(self, r):
+        d = self.den[r]
+        return [Fraction(v, d) for v in self.filas[r]]
+
+    def fracciones(self):
+        return [
+            [Fraction(v, d) for v in fila] for fila, d in zip(self.filas, self.den)
+        ]
+
+    resultado = fracciones
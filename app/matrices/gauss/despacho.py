@@ -0,0 +1,127 @@
+# app/matrices/gauss/despacho.py
+# -*- coding: utf-8 -*-
+"""
+Elección automática del motor de eliminación cuando la petición no fija uno.
+
+Se decide con datos baratos del sistema: tamaño, tipo de las entradas, si
+hacen falta pasos y, cuando importa, el número de condición κ₁ estimado
+(LU en float64 + estimador de Hager/Higham, ver ``flotante.diagnostico``):
+
+- modo decimal y κ₁ <= MAX_CONDICION con residuo pequeño → "flotante";
+- con pasos → "fracciones" (con "bareiss" los pasos son idénticos, pero
+  pasar cada matriz intermedia a Fracciones lo hace más lento);
+- sin pasos, sistema cuadrado bien condicionado → "refinamiento"
+  (float64 + correcciones exactas, ver refinamiento.py);
+- sin pasos, sistemas grandes y varios procesos disponibles → "modular"
+  (imágenes módulo primos en paralelo, ver modular.py);
+- sin pasos en el resto de casos → "bareiss" (enteros, sin mcd por
+  operación), salvo sistemas diminutos.
+
+Los motores enteros solo se eligen si todas las entradas son Fracciones;
+el resultado es el mismo que con "fracciones" en todos los casos exactos.
+"""
+import time
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import Optional
+
+from .eliminacion import MOTORES as MOTORES_ELIMINACION
+from .flotante import HAY_NUMPY, MAX_CONDICION, diagnostico
+from .modular import TRABAJADORES, UMBRAL_PARALELO
+
+# Motores que puede pedir una petición: los de eliminación más los que
+# resuelven sin pasos por otra vía (y eliminan con "fracciones" si no)
+MOTORES = MOTORES_ELIMINACION + ("refinamiento", "modular")
+
+# Celdas de [A | b] a partir de las cuales "bareiss" compensa sin pasos
+UMBRAL_BAREISS = 12
+# Incógnitas a partir de las cuales "refinamiento" compensa
+UMBRAL_REFINAMIENTO = 3
+
+
+@dataclass
+class DecisionMotor:
+    motor: str
+    motivo: str
+    condicion: Optional[float] = None
+    ms_decision: float = 0.0
+    ms_resolucion: Optional[float] = None
+
+    def como_dict(self):
+        d = {
+            "nombre": self.motor,
+            "motivo": self.motivo,
+            "ms_decision": round(self.ms_decision, 3),
+        }
+        if self.condicion is not None:
+            d["condicion_estimada"] = self.condicion if self.condicion != float("inf") else None
+        if self.ms_resolucion is not None:
+            d["ms_resolucion"] = round(self.ms_resolucion, 3)
+        return d
+
+
+def _exacto(datos, con_pasos, reducida, condicion=None):
+    m = len(datos)
+    celdas = m * len(datos[0]) if m else 0
+    if con_pasos:
+        return "fracciones", "con pasos: eliminación con Fracciones"
+    if not all(isinstance(v, Fraction) for fila in datos for v in fila):
+        return "fracciones", "entradas no racionales"
+    if (
+        reducida
+        and condicion is not None
+        and condicion <= MAX_CONDICION
+        and m >= UMBRAL_REFINAMIENTO
+    ):
+        return "refinamiento", "sin pasos, cuadrado y bien condicionado: refinamiento en precisión mixta"
+    if reducida and HAY_NUMPY and TRABAJADORES > 1 and celdas >= UMBRAL_PARALELO:
+        return "modular", f"sin pasos y sistema grande: imágenes modulares en {TRABAJADORES} procesos"
+    if celdas >= UMBRAL_BAREISS:
+        return "bareiss", "sin pasos: eliminación entera de Bareiss"
+    return "fracciones", "sistema pequeño: eliminación con Fracciones"
+
+
+def decidir_motor(datos, modo_precision="fraccion", motor=None, con_pasos=True, reducida=True):
+    """
+    Motor para [A | b] (``datos``, filas de números) con su motivo y el
+    número de condición estimado si se calculó. ``con_pasos`` indica si se
+    van a formatear pasos (ahora o después, con pasos diferidos) y
+    ``reducida`` si es Gauss-Jordan. Un ``motor`` explícito se respeta;
+    si no está en MOTORES se lanza ValueError.
+    """
+    inicio = time.perf_counter()
+    condicion = None
+    if motor and motor not in MOTORES:
+        raise ValueError(f"Motor desconocido: {motor}. Opciones: {', '.join(MOTORES)}.")
+    if motor:
+        elegido, motivo = motor, "elegido en la petición"
+    elif not datos or not datos[0]:
+        elegido, motivo = "fracciones", "sistema vacío"
+    else:
+        necesita_condicion = HAY_NUMPY and (
+            modo_precision == "decimal" or (not con_pasos and reducida)
+        )
+        diag = diagnostico(datos) if necesita_condicion else None
+        if diag is not None:
+            condicion = diag["condicion"]
+        if (
+            modo_precision == "decimal"
+            and diag is not None
+            and diag["residuo_ok"]
+            and condicion <= MAX_CONDICION
+        ):
+            elegido, motivo = "flotante", "modo decimal y sistema bien condicionado: float64"
+        else:
+            ok = diag is not None and diag["residuo_ok"]
+            elegido, motivo = _exacto(datos, con_pasos, reducida, condicion if ok else None)
+            if modo_precision == "decimal" and diag is not None:
+                motivo = (
+                    "mal condicionado o singular en float64; "
+                    if diag["cuadrado"] else "no es cuadrado; "
+                ) + motivo
+    return DecisionMotor(
+        motor=elegido,
+        motivo=motivo,
+        condicion=condicion,
+        ms_decision=(time.perf_counter() - inicio) * 1000,
+    )
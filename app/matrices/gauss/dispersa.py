@@ -0,0 +1,110 @@
+# app/matrices/gauss/dispersa.py
+# -*- coding: utf-8 -*-
+"""
+Motor de eliminación disperso (un diccionario {columna: Fraction} por fila).
+
+Pensado para los sistemas que casi todo son ceros (flujos en redes, tablas
+de Leontief, circuitos): las operaciones de fila solo recorren las entradas
+no nulas de la fila pivote. Se usa con pivoteo "markowitz" (ver
+``eliminacion.Eliminacion``), que entre las filas candidatas elige la de
+menos entradas no nulas para reducir el relleno.
+
+Implementa la misma interfaz de motor que ``eliminacion.MatrizFracciones`` y
+lleva la cuenta del relleno (entradas que pasan de cero a no cero).
+"""
+from fractions import Fraction
+
+CERO = Fraction(0)
+
+
+class MatrizDispersa:
+    """Matriz aumentada por filas dispersas (diccionario de claves)."""
+
+    __slots__ = ("m", "np1", "n", "filas", "nnz", "nnz_inicial", "nnz_max", "relleno")
+
+    def __init__(self, datos):
+        self.m = len(datos)
+        self.np1 = len(datos[0])
+        self.n = self.np1 - 1
+        self.filas = [{j: v for j, v in enumerate(fila) if v != 0} for fila in datos]
+        self.nnz = self.nnz_inicial = self.nnz_max = sum(len(f) for f in self.filas)
+        self.relleno = 0
+
+    def valor(self, r, c):
+        return self.filas[r].get(c, CERO)
+
+    def es_cero(self, r, c):
+        return c not in self.filas[r]
+
+    def magnitud(self, r, c):
+        return abs(self.valor(r, c))
+
+    def max_fila(self, r):
+        return max((abs(v) for j, v in self.filas[r].items() if j < self.n), default=CERO)
+
+    def bits(self, r, c):
+        v = self.valor(r, c)
+        return v.numerator.bit_length() + v.denominator.bit_length()
+
+    def nnz_fila(self, r):
+        """No nulos de la fila en las columnas de A (sin contar b)."""
+        fila = self.filas[r]
+        return len(fila) - (self.n in fila)
+
+    def intercambiar(self, i, j):
+        self.filas[i], self.filas[j] = self.filas[j], self.filas[i]
+
+    def normalizar(self, f, c):
+        fila = self.filas[f]
+        pv = fila[c]
+        for j in fila:
+            fila[j] = fila[j] / pv
+        return pv
+
+    def eliminar(self, r, f, c, desde=0):
+        fr, ff = self.filas[r], self.filas[f]
+        factor = fr[c] / ff[c]
+        for j, v in ff.items():
+            if j < desde:
+                continue
+            if j in fr:
+                nuevo = fr[j] - factor * v
+                if nuevo:
+                    fr[j] = nuevo
+                else:
+                    del fr[j]
+                    self.nnz -= 1
+            else:
+                fr[j] = -factor * v
+                self.nnz += 1
+                self.relleno += 1
+        if self.nnz > self.nnz_max:
+            self.nnz_max = self.nnz
+        return factor
+
+    def reescalar(self, r, f, c, desde=0):
+        pass
+
+    def cerrar_pivote(self, f, c):
+        pass
+
+    def fila(self, r):
+        fila = self.filas[r]
+        return [fila.get(j, CERO) for j in range(self.np1)]
+
+    def fracciones(self):
+        return [self.fila(r) for r in range(self.m)]
+
+    resultado = fracciones
+
+    def estadisticas(self):
+        """Resumen de dispersión y relleno de la eliminación."""
+        total = self.m * self.np1
+        return {
+            "entradas": total,
+            "nnz_inicial": self.nnz_inicial,
+            "nnz_final": self.nnz,
+            "nnz_max": self.nnz_max,
+            "relleno": self.relleno,
+            "densidad_inicial": round(self.nnz_inicial / total, 4) if total else 0,
+        }
@@ -0,0 +1,208 @@
+# app/matrices/gauss/eliminacion.py
+# -*- coding: utf-8 -*-
+"""
+Núcleo común de eliminación (Gauss y Gauss-Jordan).
+
+Un solo recorrido produce la forma escalonada (o reducida), las columnas
+pivote y la secuencia de operaciones elementales aplicadas. Lo usan tanto
+los resolvedores con pasos de ``algebra.py`` como ``pygauss_ext.ref/rref``,
+de modo que ninguna ruta necesita eliminar dos veces la misma matriz.
+
+La aritmética vive en un "motor":
+  - MatrizFracciones: listas de Fraction (motor clásico).
+  - MatrizBareiss:    enteros por fila + denominador (ver bareiss.py).
+  - MatrizFlotante:   NumPy float64, para el modo decimal (ver flotante.py).
+  - MatrizDispersa:   filas {columna: Fraction} para sistemas dispersos
+                      (ver dispersa.py).
+
+La matriz de entrada puede venir como filas de Fracciones o como
+``racional.MatrizRacional`` (enteros por fila + denominador).
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import Any, List, Optional
+
+from .bareiss import MatrizBareiss
+from .dispersa import MatrizDispersa
+from .flotante import MatrizFlotante, HAY_NUMPY
+from .racional import MatrizRacional
+from .pivoteo import crear_pivoteo, ESTRATEGIAS
+
+INTERCAMBIO = "intercambio"
+ESCALA = "escala"
+ELIMINACION = "eliminacion"
+
+MOTORES = ("fracciones", "bareiss", "flotante", "dispersa")
+
+# Pivoteo por defecto de cada motor (el resto usa "parcial"); las opciones
+# están en pivoteo.ESTRATEGIAS
+PIVOTEO_POR_MOTOR = {"dispersa": "markowitz"}
+PIVOTEOS = tuple(ESTRATEGIAS)
+
+
+def _es_cero(x, tol=1e-12):
+    if isinstance(x, Fraction):
+        return x == 0
+    try:
+        return abs(float(x)) < tol
+    except Exception:
+        return False
+
+
+@dataclass
+class Operacion:
+    """Operación elemental ya aplicada sobre la matriz."""
+    tipo: str                 # INTERCAMBIO | ESCALA | ELIMINACION
+    fila: int                 # fila modificada (0-based)
+    otra: Optional[int]       # fila intercambiada / fila pivote usada
+    col: int                  # columna pivote
+    factor: Any = None        # pivote (ESCALA) o multiplicador (ELIMINACION)
+
+
+class MatrizFracciones:
+    """Motor clásico: una Fraction por celda."""
+
+    __slots__ = ("m", "np1", "n", "a")
+
+    def __init__(self, datos):
+        self.m = len(datos)
+        self.np1 = len(datos[0])
+        self.n = self.np1 - 1
+        self.a = [fila[:] for fila in datos]
+
+    def valor(self, r, c):
+        return self.a[r][c]
+
+    def es_cero(self, r, c):
+        return _es_cero(self.a[r][c])
+
+    def magnitud(self, r, c):
+        return abs(self.a[r][c])
+
+    def max_fila(self, r):
+        return max((abs(v) for v in self.a[r][: self.n]), default=0)
+
+    def bits(self, r, c):
+        v = self.a[r][c]
+        if isinstance(v, (Fraction, int)):
+            return v.numerator.bit_length() + v.denominator.bit_length()
+        return 0
+
+    def nnz_fila(self, r):
+        return sum(1 for v in self.a[r][: self.n] if not _es_cero(v))
+
+    def intercambiar(self, i, j):
+        self.a[i], self.a[j] = self.a[j], self.a[i]
+
+    def normalizar(self, f, c):
+        fila = self.a[f]
+        pv = fila[c]
+        for j in range(c, self.np1):
+            fila[j] = fila[j] / pv
+        return pv
+
+    def eliminar(self, r, f, c, desde=0):
+        fr, ff = self.a[r], self.a[f]
+        factor = fr[c] / ff[c]
+        for j in range(desde, self.np1):
+            fr[j] -= factor * ff[j]
+        return factor
+
+    def reescalar(self, r, f, c, desde=0):
+        pass
+
+    def cerrar_pivote(self, f, c):
+        pass
+
+    def fila(self, r):
+        return self.a[r]
+
+    def fracciones(self):
+        return self.a
+
+    resultado = fracciones
+
+
+def crear_motor(datos, motor: str = "fracciones"):
+    """
+    Copia ``datos`` en el motor pedido (Bareiss solo si todo es racional).
+    ``datos`` puede ser una lista de filas o una ``MatrizRacional``.
+    """
+    if isinstance(datos, MatrizRacional):
+        if motor == "bareiss":
+            return MatrizBareiss.desde_racional(datos)
+        datos = datos.fracciones()
+    if motor == "bareiss" and all(
+        isinstance(v, Fraction) for fila in datos for v in fila
+    ):
+        return MatrizBareiss(datos)
+    if motor == "flotante" and HAY_NUMPY:
+        return MatrizFlotante(datos)
+    if motor == "dispersa" and all(
+        isinstance(v, Fraction) for fila in datos for v in fila
+    ):
+        return MatrizDispersa(datos)
+    return MatrizFracciones(datos)
+
+
+class Eliminacion:
+    """
+    Recorrido de eliminación. Iterarlo aplica las operaciones sobre el motor
+    y produce cada ``Operacion`` justo después de aplicarla.
+
+    - reducida=True  → Gauss-Jordan (elimina arriba y abajo del pivote).
+    - normalizar     → divide la fila pivote para dejar el pivote en 1.
+    - pivoteo        → nombre de la estrategia: "parcial" (mayor |valor|),
+                       "primero" (primer no nulo), "escalado", "torre_filas",
+                       "bits" o "markowitz" (ver pivoteo.py), o una instancia.
+    """
+
+    def __init__(self, motor, reducida=True, normalizar=True, pivoteo="parcial"):
+        self.motor = motor
+        self.reducida = reducida
+        self.normalizar = normalizar
+        self.pivoteo = pivoteo
+        self.estrategia = crear_pivoteo(pivoteo).preparar(motor)
+        self.pivotes: List[int] = []
+
+    def __iter__(self):
+        M = self.motor
+        E = self.estrategia
+        fila = 0
+        for col in range(M.n):
+            piv = E.elegir(col, fila)
+            if piv is None:
+                continue
+            if piv != fila:
+                M.intercambiar(fila, piv)
+                E.intercambiadas(fila, piv)
+                yield Operacion(INTERCAMBIO, fila, piv, col)
+            if self.normalizar:
+                pv = M.normalizar(fila, col)
+                E.fila_modificada(fila)
+                yield Operacion(ESCALA, fila, None, col, pv)
+            if self.reducida:
+                desde, filas = 0, range(M.m)
+            else:
+                desde, filas = col, range(fila + 1, M.m)
+            for r in filas:
+                if r == fila:
+                    continue
+                if M.es_cero(r, col):
+                    M.reescalar(r, fila, col, desde)
+                    continue
+                factor = M.eliminar(r, fila, col, desde)
+                E.fila_modificada(r)
+                yield Operacion(ELIMINACION, r, fila, col, factor)
+            M.cerrar_pivote(fila, col)
+            self.pivotes.append(col)
+            fila += 1
+            if fila == M.m:
+                break
+
+    def ejecutar(self):
+        """Aplica toda la eliminación sin consumir las operaciones."""
+        for _ in self:
+            pass
+        return self
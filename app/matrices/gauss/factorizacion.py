@@ -0,0 +1,157 @@
+# app/matrices/gauss/factorizacion.py
+# -*- coding: utf-8 -*-
+"""
+Factorización reutilizable de la matriz de coeficientes.
+
+Las operaciones de fila de Gauss-Jordan solo dependen de las columnas de A,
+no de b. ``Factorizacion`` elimina A una sola vez con el núcleo común,
+guarda la RREF, las columnas pivote y la lista de operaciones aplicadas, y
+luego resuelve cualquier número de lados derechos reproduciendo esas
+operaciones sobre cada b (O(operaciones) por columna en lugar de una
+eliminación completa).
+
+``CacheFactorizaciones`` guarda factorizaciones ya hechas en una LRU acotada
+en bytes, con clave el hash del contenido de A (más motor y pivoteo): varias
+peticiones con la misma A y distinto b solo reproducen las operaciones.
+"""
+from collections import OrderedDict
+from fractions import Fraction
+from hashlib import sha256
+from threading import Lock
+
+from .eliminacion import (
+    crear_motor,
+    Eliminacion,
+    INTERCAMBIO,
+    ESCALA,
+    PIVOTEO_POR_MOTOR,
+)
+
+# Motores exactos admitidos (la réplica sobre b se hace con Fracciones)
+MOTORES_EXACTOS = ("fracciones", "bareiss", "dispersa")
+
+MAX_BYTES_CACHE = 32 * 1024 * 1024
+
+
+class Factorizacion:
+    """RREF de A con las operaciones de fila registradas."""
+
+    def __init__(self, A, motor="fracciones", pivoteo=None):
+        if not A or any(len(f) != len(A[0]) for f in A):
+            raise ValueError("La matriz debe ser rectangular y no vacía.")
+        if motor not in MOTORES_EXACTOS:
+            motor = "fracciones"
+        self.m = len(A)
+        self.n = len(A[0])
+        # columna b nula: la eliminación solo decide con las columnas de A
+        datos = [[Fraction(v) for v in fila] + [Fraction(0)] for fila in A]
+        M = crear_motor(datos, motor)
+        elim = Eliminacion(
+            M,
+            reducida=True,
+            pivoteo=pivoteo or PIVOTEO_POR_MOTOR.get(motor, "primero"),
+        )
+        self.operaciones = list(elim)
+        self.pivotes = elim.pivotes
+        self.rref = [fila[:-1] for fila in M.resultado()]
+        self.estadisticas = (
+            M.estadisticas() if hasattr(M, "estadisticas") else None
+        )
+
+    def tamano_bytes(self):
+        """Estimación del tamaño en memoria (para el límite de la caché)."""
+        def frac(x):
+            return 64 + (x.numerator.bit_length() + x.denominator.bit_length()) // 8
+
+        total = sum(frac(v) for fila in self.rref for v in fila)
+        total += sum(
+            96 + (frac(op.factor) if op.factor is not None else 0)
+            for op in self.operaciones
+        )
+        return total
+
+    def aplicar(self, b):
+        """Reproduce las operaciones registradas sobre el vector ``b``."""
+        if len(b) != self.m:
+            raise ValueError("b debe tener tantas entradas como filas tiene A.")
+        c = [Fraction(v) for v in b]
+        for op in self.operaciones:
+            if op.tipo == INTERCAMBIO:
+                c[op.fila], c[op.otra] = c[op.otra], c[op.fila]
+            elif op.tipo == ESCALA:
+                c[op.fila] = c[op.fila] / op.factor
+            elif c[op.otra]:
+                c[op.fila] -= op.factor * c[op.otra]
+        return c
+
+    def aumentada(self, b):
+        """RREF de [A | b] a partir de la factorización."""
+        c = self.aplicar(b)
+        return [fila + [ci] for fila, ci in zip(self.rref, c)]
+
+
+def clave_matriz(A, motor, pivoteo):
+    """Hash canónico de A ya evaluada (cada entrada como Fraction reducida)."""
+    h = sha256(f"{motor}|{pivoteo}|{len(A)}x{len(A[0])}".encode())
+    for fila in A:
+        h.update(("|" + ",".join(str(Fraction(v)) for v in fila)).encode())
+    return h.hexdigest()
+
+
+class CacheFactorizaciones:
+    """LRU de factorizaciones acotada por tamaño estimado en bytes."""
+
+    def __init__(self, max_bytes=MAX_BYTES_CACHE):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        self._datos = OrderedDict()
+        self._lock = Lock()
+
+    def obtener(self, A, motor="fracciones", pivoteo=None):
+        """Factorización de A: de la caché si ya está, si no se calcula."""
+        if motor not in MOTORES_EXACTOS:
+            motor = "fracciones"
+        pivoteo = pivoteo or PIVOTEO_POR_MOTOR.get(motor, "primero")
+        clave = clave_matriz(A, motor, pivoteo)
+        with self._lock:
+            if clave in self._datos:
+                self._datos.move_to_end(clave)
+                self.aciertos += 1
+                return self._datos[clave][0]
+            self.fallos += 1
+
+        fact = Factorizacion(A, motor=motor, pivoteo=pivoteo)
+        tam = fact.tamano_bytes()
+        if tam > self.max_bytes:
+            return fact
+        with self._lock:
+            if clave not in self._datos:
+                self._datos[clave] = (fact, tam)
+                self.bytes += tam
+            while self.bytes > self.max_bytes:
+                _, (_, t) = self._datos.popitem(last=False)
+                self.bytes -= t
+                self.desalojos += 1
+        return fact
+
+    def limpiar(self):
+        with self._lock:
+            self._datos.clear()
+            self.bytes = 0
+
+    def estadisticas(self):
+        return {
+            "entradas": len(self._datos),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "desalojos": self.desalojos,
+        }
+
+
+# Caché compartida del proceso (rutas de Gauss-Jordan y gauss_jordan_solve)
+CACHE = CacheFactorizaciones()
@@ -0,0 +1,194 @@
+# app/matrices/gauss/flotante.py
+# -*- coding: utf-8 -*-
+"""
+Motor de eliminación en coma flotante (NumPy float64).
+
+En modo "decimal" el resultado se muestra redondeado, así que no hace falta
+pagar la aritmética exacta de Fraction. Este motor implementa la misma
+interfaz que ``eliminacion.MatrizFracciones`` con operaciones vectorizadas
+por fila.
+
+Antes de usarlo se hace una comprobación barata: una factorización LU,
+el residuo de su solución y una estimación del número de condición κ₁
+(Hager/Higham, ``estimar_condicion``) con esa misma factorización. Si el
+sistema no es cuadrado, es singular o está mal condicionado, se sigue con
+el motor exacto, porque ahí las decisiones de rango en flotante no son
+fiables.
+"""
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: sin él se usa siempre el motor exacto
+    np = None
+
+HAY_NUMPY = np is not None
+
+TOL_RELATIVA = 1e-12
+MAX_CONDICION = 1e10
+
+
+class MatrizFlotante:
+    """Matriz aumentada float64; los ceros se deciden con tolerancia relativa."""
+
+    __slots__ = ("m", "np1", "n", "a", "tol")
+
+    def __init__(self, datos):
+        self.a = np.array([[float(v) for v in fila] for fila in datos], dtype=float)
+        self.m, self.np1 = self.a.shape
+        self.n = self.np1 - 1
+        escala = float(np.abs(self.a).max()) if self.a.size else 0.0
+        self.tol = TOL_RELATIVA * max(1.0, escala)
+
+    def valor(self, r, c):
+        return float(self.a[r, c])
+
+    def es_cero(self, r, c):
+        return abs(self.a[r, c]) < self.tol
+
+    def magnitud(self, r, c):
+        return abs(float(self.a[r, c]))
+
+    def max_fila(self, r):
+        return float(np.abs(self.a[r, : self.n]).max()) if self.n else 0.0
+
+    def nnz_fila(self, r):
+        return int(np.count_nonzero(np.abs(self.a[r, : self.n]) >= self.tol))
+
+    def intercambiar(self, i, j):
+        self.a[[i, j]] = self.a[[j, i]]
+
+    def normalizar(self, f, c):
+        pv = float(self.a[f, c])
+        self.a[f, c:] /= pv
+        self.a[f, c] = 1.0
+        return pv
+
+    def eliminar(self, r, f, c, desde=0):
+        factor = float(self.a[r, c] / self.a[f, c])
+        self.a[r, desde:] -= factor * self.a[f, desde:]
+        self.a[r, c] = 0.0
+        return factor
+
+    def reescalar(self, r, f, c, desde=0):
+        pass
+
+    def cerrar_pivote(self, f, c):
+        pass
+
+    def fila(self, r):
+        return self.a[r].tolist()
+
+    def fracciones(self):
+        return self.a.tolist()
+
+    def resultado(self):
+        """Matriz final para la sustitución: floats con los ceros limpios."""
+        limpia = np.where(np.abs(self.a) < self.tol, 0.0, self.a)
+        return limpia.tolist()
+
+
+def factorizar_lu(A):
+    """
+    PA = LU con pivoteo parcial (float64, L unitaria en la parte estricta
+    inferior de ``lu``). Devuelve ``(lu, perm)`` o None si A es singular.
+    """
+    lu = np.array(A, dtype=float)
+    n = lu.shape[0]
+    perm = np.arange(n)
+    escala = float(np.abs(lu).max()) if lu.size else 0.0
+    tol = TOL_RELATIVA * max(1.0, escala)
+    for k in range(n):
+        p = k + int(np.argmax(np.abs(lu[k:, k])))
+        if abs(lu[p, k]) < tol:
+            return None
+        if p != k:
+            lu[[k, p]] = lu[[p, k]]
+            perm[[k, p]] = perm[[p, k]]
+        lu[k + 1:, k] /= lu[k, k]
+        lu[k + 1:, k + 1:] -= np.outer(lu[k + 1:, k], lu[k, k + 1:])
+    return lu, perm
+
+
+def resolver_lu(fact, b, traspuesta=False):
+    """Resuelve A·x = b (o Aᵀ·x = b) con la factorización de factorizar_lu."""
+    lu, perm = fact
+    n = lu.shape[0]
+    if not traspuesta:
+        y = np.array(b, dtype=float)[perm]
+        for i in range(1, n):
+            y[i] -= lu[i, :i] @ y[:i]
+        for i in range(n - 1, -1, -1):
+            y[i] = (y[i] - lu[i, i + 1:] @ y[i + 1:]) / lu[i, i]
+        return y
+    # Aᵀ = Uᵀ Lᵀ P: Uᵀ z = b, Lᵀ w = z, x = Pᵀ w
+    z = np.array(b, dtype=float)
+    for i in range(n):
+        z[i] = (z[i] - lu[:i, i] @ z[:i]) / lu[i, i]
+    for i in range(n - 2, -1, -1):
+        z[i] -= lu[i + 1:, i] @ z[i + 1:]
+    x = np.empty(n)
+    x[perm] = z
+    return x
+
+
+def estimar_condicion(A, fact=None, max_iter=5):
+    """
+    Estimación barata de κ₁(A) = ||A||₁·||A⁻¹||₁ (Hager/Higham): ||A⁻¹||₁
+    se estima con unas pocas soluciones con A y Aᵀ usando la misma
+    factorización LU, en O(n²) cada una en lugar del O(n³) de la inversa.
+    Devuelve inf si A es singular.
+    """
+    A = np.asarray(A, dtype=float)
+    n = A.shape[0]
+    if fact is None:
+        fact = factorizar_lu(A)
+    if fact is None:
+        return float("inf")
+    if n == 0:
+        return 1.0
+    x = np.full(n, 1.0 / n)
+    estimacion = 0.0
+    anterior = -1
+    for _ in range(max_iter):
+        y = resolver_lu(fact, x)
+        estimacion = float(np.abs(y).sum())
+        signo = np.where(y >= 0, 1.0, -1.0)
+        z = resolver_lu(fact, signo, traspuesta=True)
+        j = int(np.argmax(np.abs(z)))
+        if j == anterior or np.abs(z).max() <= z @ x:
+            break
+        x = np.zeros(n)
+        x[j] = 1.0
+        anterior = j
+    # vector alternativo de Higham: corrige los casos en que Hager subestima
+    alterno = np.array([(-1) ** i * (1 + i / max(n - 1, 1)) for i in range(n)])
+    estimacion = max(estimacion, 2 * float(np.abs(resolver_lu(fact, alterno)).sum()) / (3 * n))
+    return float(np.abs(A).sum(axis=0).max()) * estimacion
+
+
+def diagnostico(datos):
+    """
+    Comprobación previa del sistema [A|b] en float64: ``{"cuadrado",
+    "condicion", "residuo_ok"}`` (condicion = None si no es cuadrado o no
+    se puede evaluar, inf si A es singular).
+    """
+    vacio = {"cuadrado": False, "condicion": None, "residuo_ok": False}
+    if not HAY_NUMPY or not datos or len(datos) != len(datos[0]) - 1:
+        return vacio
+    try:
+        Ab = np.array([[float(v) for v in fila] for fila in datos], dtype=float)
+    except (TypeError, ValueError, OverflowError):
+        return vacio
+    if not np.all(np.isfinite(Ab)):
+        return vacio
+    A, b = Ab[:, :-1], Ab[:, -1]
+    fact = factorizar_lu(A)
+    if fact is None:
+        return {"cuadrado": True, "condicion": float("inf"), "residuo_ok": False}
+    x = resolver_lu(fact, b)
+    residuo = np.abs(A @ x - b).max()
+    escala = np.abs(A).sum(axis=1).max() * np.abs(x).max() + np.abs(b).max()
+    return {
+        "cuadrado": True,
+        "condicion": estimar_condicion(A, fact),
+        "residuo_ok": bool(residuo <= 1e-9 * max(escala, 1.0)),
+    }
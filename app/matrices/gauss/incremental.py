@@ -0,0 +1,144 @@
+# app/matrices/gauss/incremental.py
+# -*- coding: utf-8 -*-
+"""
+Re-resolución incremental tras editar celdas de la tabla de Gauss-Jordan.
+
+Cada sesión guarda la última factorización de A (ver factorizacion.py):
+
+  - si solo cambia b, se reproducen las operaciones de fila guardadas;
+  - si cambia una entrada A[i][j] y A es cuadrada e invertible, se aplica
+    una actualización de rango uno (Sherman-Morrison) en forma de producto:
+    con w = A⁻¹·e_i, la nueva solución es x - (δ·x_j / (1 + δ·w_j))·w.
+    Tras MAX_ACTUALIZACIONES ediciones, o si A deja de ser invertible, se
+    vuelve a factorizar (con la caché de factorizaciones).
+
+Las sesiones viven en una LRU del proceso, igual que las soluciones
+paginadas de sesiones.py, y las comparten los hilos de Flask: cada una
+tiene su candado.
+"""
+from fractions import Fraction
+from secrets import token_hex
+from threading import RLock
+
+from .eliminacion import PIVOTEO_POR_MOTOR
+from .factorizacion import CACHE
+from .sesiones import CacheLRU
+
+MAX_SESIONES = 128
+MAX_ACTUALIZACIONES = 8
+
+
+class SesionResolucion:
+    """Última matriz [A | b] resuelta y su factorización."""
+
+    def __init__(self, datos, motor="fracciones"):
+        self._lock = RLock()
+        self.motor = motor
+        # el mismo pivoteo que los resolvedores: comparten la caché con /resolver
+        self.pivoteo = PIVOTEO_POR_MOTOR.get(motor, "parcial")
+        self.A = [[Fraction(v) for v in fila[:-1]] for fila in datos]
+        self.b = [Fraction(fila[-1]) for fila in datos]
+        self.m = len(self.A)
+        self.n = len(self.A[0])
+        self._refactorizar()
+
+    def _refactorizar(self):
+        self.fact = CACHE.obtener(self.A, self.motor, self.pivoteo)
+        # (j, δ, w, 1 + δ·w_j) por cada edición de rango uno pendiente
+        self.actualizaciones = []
+        self.invertible = self.m == self.n and len(self.fact.pivotes) == self.n
+
+    def _resolver(self, b):
+        """x = A⁻¹·b con la factorización base y las actualizaciones."""
+        x = self.fact.aplicar(b)
+        for j, delta, w, denom in self.actualizaciones:
+            if x[j]:
+                k = delta * x[j] / denom
+                x = [xi - k * wi for xi, wi in zip(x, w)]
+        return x
+
+    def cambiar_celda(self, i, j, valor):
+        """Cambia A[i][j]; devuelve True si hubo que factorizar desde cero."""
+        valor = Fraction(valor)
+        delta = valor - self.A[i][j]
+        if not delta:
+            return False
+        self.A[i][j] = valor
+        if not self.invertible or len(self.actualizaciones) >= MAX_ACTUALIZACIONES:
+            self._refactorizar()
+            return True
+        e_i = [Fraction(0)] * self.m
+        e_i[i] = Fraction(1)
+        w = self._resolver(e_i)
+        denom = 1 + delta * w[j]
+        if not denom:
+            # la edición vuelve singular a A: hace falta la RREF completa
+            self._refactorizar()
+            return True
+        self.actualizaciones.append((j, delta, w, denom))
+        return False
+
+    def cambiar_b(self, b):
+        self.b = [Fraction(v) for v in b]
+
+    def actualizar(self, datos):
+        """
+        Lleva la sesión a la nueva tabla [A | b]. Devuelve cuántas celdas de
+        A cambiaron (las de b solo requieren reproducir operaciones), o None
+        si hubo que factorizar A desde cero.
+        """
+        with self._lock:
+            cambios = [
+                (i, j, v)
+                for i, fila in enumerate(datos)
+                for j, v in enumerate(fila[:-1])
+                if Fraction(v) != self.A[i][j]
+            ]
+            self.cambiar_b([fila[-1] for fila in datos])
+            if len(cambios) > MAX_ACTUALIZACIONES:
+                self.A = [[Fraction(v) for v in fila[:-1]] for fila in datos]
+                self._refactorizar()
+                return None
+            refactorizada = False
+            for i, j, v in cambios:
+                refactorizada = self.cambiar_celda(i, j, v) or refactorizada
+            return None if refactorizada else len(cambios)
+
+    def rref(self):
+        """RREF de [A | b] actual y sus columnas pivote."""
+        with self._lock:
+            if self.invertible:
+                x = self._resolver(self.b)
+                R = [
+                    [Fraction(int(c == r)) for c in range(self.n)] + [x[r]]
+                    for r in range(self.m)
+                ]
+                return R, list(range(self.n))
+            return self.fact.aumentada(self.b), self.fact.pivotes
+
+
+_sesiones = CacheLRU(MAX_SESIONES)
+
+
+def sesion_para(sid, datos, motor="fracciones"):
+    """
+    Sesión ``sid`` actualizada a ``datos``; si no existe (o cambió el tamaño
+    de la tabla) se crea una nueva. Devuelve (sid, (R, pivotes),
+    celdas_cambiadas): la RREF se lee con la sesión bloqueada, para que
+    otra petición con el mismo ``sid`` no la cambie entre medias, y
+    celdas_cambiadas es None cuando hubo que factorizar desde cero.
+    """
+    sesion = _sesiones.obtener(sid) if sid else None
+    if (
+        sesion is None
+        or sesion.motor != motor
+        or sesion.m != len(datos)
+        or sesion.n != len(datos[0]) - 1
+    ):
+        sid = token_hex(8)
+        sesion = SesionResolucion(datos, motor)
+        _sesiones.guardar(sid, sesion)
+        return sid, sesion.rref(), None
+    with sesion._lock:
+        cambios = sesion.actualizar(datos)
+        return sid, sesion.rref(), cambios
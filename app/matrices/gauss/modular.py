@@ -0,0 +1,339 @@
+# app/matrices/gauss/modular.py
+# -*- coding: utf-8 -*-
+"""
+RREF exacta por aritmética modular (varios primos + CRT + reconstrucción
+racional).
+
+En sistemas grandes con enteros/racionales el costo del motor exacto crece
+con el tamaño de los numeradores intermedios. Aquí la eliminación se hace
+módulo primos de 31 bits (enteros pequeños), los residuos se combinan con el
+teorema chino del resto y cada entrada se recupera como Fraction por
+reconstrucción racional. Se para en cuanto la reconstrucción se estabiliza y
+el resultado se comprueba de forma exacta contra el sistema original.
+
+La RREF es única, así que el resultado coincide con ``pygauss_ext.rref``.
+Si el sistema es inconsistente (o no se llega a un resultado verificado) se
+devuelve None y quien llama usa el motor exacto.
+
+Las imágenes módulo cada primo son independientes: en sistemas grandes se
+calculan por lotes en un pool de procesos. El proceso principal reduce los
+enteros módulo cada primo del lote y los deja en un bloque de memoria
+compartida (int64, uno por primo); cada proceso hace la RREF de su bloque
+en el sitio y solo devuelve los pivotes. El número de procesos se fija con
+la variable de entorno PYGAUSS_TRABAJADORES (1 = sin pool) o con el
+argumento ``trabajadores``; el resultado no depende de él.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from fractions import Fraction
+from math import gcd, isqrt
+from multiprocessing import shared_memory
+from threading import Lock
+
+from .bareiss import fila_a_enteros
+from .flotante import np, HAY_NUMPY
+from .racional import MatrizRacional
+
+MAX_PRIMOS = 4000
+# Procesos para las imágenes modulares (por defecto, uno por núcleo)
+TRABAJADORES = max(1, int(os.environ.get("PYGAUSS_TRABAJADORES", os.cpu_count() or 1)))
+# Celdas de [A | b] a partir de las cuales compensa repartir los primos
+UMBRAL_PARALELO = 60 * 61
+
+_pool = None
+_pool_trabajadores = 0
+_pool_candado = Lock()
+
+
+def _es_primo(n):
+    """Miller-Rabin determinista para n < 2.1e12 (basta para 31 bits)."""
+    if n < 2:
+        return False
+    for p in (2, 3, 5, 7, 11):
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in (2, 3, 5, 7, 11):
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _primos():
+    """Primos de 31 bits en orden descendente."""
+    p = 2**31 - 1
+    while True:
+        if _es_primo(p):
+            yield p
+        p -= 2
+
+
+def _residuos(filas, p):
+    return [[v % p for v in fila] for fila in filas]
+
+
+def _rref_mod(filas, p):
+    """RREF de ``filas`` (enteros) módulo p. Devuelve (matriz, pivotes)."""
+    A = _residuos(filas, p)
+    if HAY_NUMPY:
+        A = np.array(A, dtype=np.int64)
+        pivotes = _rref_mod_numpy(A, p)
+        return A.tolist(), pivotes
+    m, ncols = len(A), len(A[0])
+    pivotes = []
+    fila = 0
+    for col in range(ncols):
+        piv = next((r for r in range(fila, m) if A[r][col]), None)
+        if piv is None:
+            continue
+        A[fila], A[piv] = A[piv], A[fila]
+        inv = pow(A[fila][col], -1, p)
+        # a la izquierda de col la fila pivote ya es cero
+        F = [v * inv % p for v in A[fila][col:]]
+        A[fila][col:] = F
+        for r in range(m):
+            if r != fila and A[r][col]:
+                k = A[r][col]
+                A[r][col:] = [(a - k * b) % p for a, b in zip(A[r][col:], F)]
+        pivotes.append(col)
+        fila += 1
+        if fila == m:
+            break
+    return A, pivotes
+
+
+def _rref_mod_numpy(A, p):
+    """Igual que _rref_mod, en el sitio sobre A (int64, entradas en [0, p)),
+    con la actualización de todas las filas a la vez (p < 2**31, así que
+    k·b < 2**62 no desborda). Devuelve los pivotes."""
+    m, ncols = A.shape
+    pivotes = []
+    fila = 0
+    for col in range(ncols):
+        nz = np.flatnonzero(A[fila:, col])
+        if nz.size == 0:
+            continue
+        piv = fila + int(nz[0])
+        if piv != fila:
+            A[[fila, piv]] = A[[piv, fila]]
+        inv = pow(int(A[fila, col]), -1, p)
+        A[fila, col:] = A[fila, col:] * inv % p
+        k = A[:, col].copy()
+        k[fila] = 0
+        A[:, col:] = (A[:, col:] - np.outer(k, A[fila, col:])) % p
+        pivotes.append(col)
+        fila += 1
+        if fila == m:
+            break
+    return pivotes
+
+
+def _imagen_compartida(nombre, forma, indice, p):
+    """Tarea de un proceso del pool: RREF mod p del bloque ``indice`` de la
+    memoria compartida ``nombre``, en el sitio. Devuelve los pivotes."""
+    shm = shared_memory.SharedMemory(name=nombre)
+    try:
+        bloque = np.ndarray(forma, dtype=np.int64, buffer=shm.buf)[indice]
+        pivotes = _rref_mod_numpy(bloque, p)
+        del bloque
+        return pivotes
+    finally:
+        shm.close()
+
+
+def _obtener_pool(trabajadores):
+    """Pool de procesos compartido (se crea al primer uso)."""
+    global _pool, _pool_trabajadores
+    with _pool_candado:
+        if _pool is None or _pool_trabajadores != trabajadores:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            _pool = ProcessPoolExecutor(max_workers=trabajadores)
+            _pool_trabajadores = trabajadores
+        return _pool
+
+
+def _descartar_pool():
+    global _pool
+    with _pool_candado:
+        if _pool is not None:
+            _pool.shutdown(wait=False)
+        _pool = None
+
+
+def _imagenes_paralelas(filas, primos, pool):
+    """[(p, matriz, pivotes)] de un lote de primos, repartidos en el pool."""
+    forma = (len(primos), len(filas), len(filas[0]))
+    shm = shared_memory.SharedMemory(create=True, size=8 * forma[0] * forma[1] * forma[2])
+    try:
+        bloques = np.ndarray(forma, dtype=np.int64, buffer=shm.buf)
+        for i, p in enumerate(primos):
+            bloques[i] = _residuos(filas, p)
+        tareas = [
+            pool.submit(_imagen_compartida, shm.name, forma, i, p)
+            for i, p in enumerate(primos)
+        ]
+        pivotes = [t.result() for t in tareas]
+        imagenes = [(p, bloques[i].tolist(), pivotes[i]) for i, p in enumerate(primos)]
+        del bloques
+        return imagenes
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _imagenes(filas, primos, pool):
+    if pool is None:
+        return [(p, *_rref_mod(filas, p)) for p in primos]
+    try:
+        return _imagenes_paralelas(filas, primos, pool)
+    except (BrokenProcessPool, OSError):
+        # sin procesos disponibles (límites del sistema, pool roto): en serie
+        _descartar_pool()
+        return [(p, *_rref_mod(filas, p)) for p in primos]
+
+
+def _reconstruir(a, M):
+    """r/s con |r|, s <= sqrt(M/2) y r ≡ a·s (mod M), o None."""
+    cota = isqrt(M // 2)
+    r0, r1 = M, a % M
+    s0, s1 = 0, 1
+    while r1 > cota:
+        q = r0 // r1
+        r0, r1 = r1, r0 - q * r1
+        s0, s1 = s1, s0 - q * s1
+    if s1 == 0 or abs(s1) > cota or gcd(r1, abs(s1)) != 1:
+        return None
+    return Fraction(r1, s1)
+
+
+def _verificar(Ab, R, pivotes):
+    """
+    Comprobación exacta: la solución particular y los vectores del núcleo
+    que da R satisfacen el sistema original. Con eso el rango modular es el
+    rango verdadero y R es la RREF racional.
+    """
+    n = len(Ab[0]) - 1
+    libres = [j for j in range(n) if j not in set(pivotes)]
+
+    x0 = [Fraction(0)] * n
+    for i, c in enumerate(pivotes):
+        x0[c] = R[i][n]
+    vectores = [(x0, True)]
+    for j in libres:
+        v = [Fraction(0)] * n
+        v[j] = Fraction(1)
+        for i, c in enumerate(pivotes):
+            v[c] = -R[i][j]
+        vectores.append((v, False))
+
+    for fila in Ab:
+        for v, con_b in vectores:
+            s = sum(fila[j] * v[j] for j in range(n) if v[j])
+            if s != (fila[n] if con_b else 0):
+                return False
+    return True
+
+
+def rref_modular(Ab, max_primos=MAX_PRIMOS, trabajadores=None):
+    """
+    RREF de la matriz aumentada ``Ab`` (Fracciones o MatrizRacional) por
+    varios primos.
+
+    ``trabajadores``: procesos para las imágenes modulares (None = los de
+    PYGAUSS_TRABAJADORES si el sistema pasa de UMBRAL_PARALELO celdas; 1 =
+    en serie). Con más de uno los primos se procesan por lotes de ese
+    tamaño y la reconstrucción se intenta una vez por lote.
+
+    Devuelve ``(matriz, pivotes, primos_usados)`` o None si el sistema es
+    inconsistente o no se obtuvo un resultado verificado.
+    """
+    if isinstance(Ab, MatrizRacional):
+        filas = Ab.filas
+        Ab = Ab.fracciones()
+    else:
+        filas = [fila_a_enteros(f)[0] for f in Ab]
+    m, ncols = len(Ab), len(Ab[0])
+    n = ncols - 1
+
+    if trabajadores is None:
+        trabajadores = TRABAJADORES if m * ncols >= UMBRAL_PARALELO else 1
+    pool = _obtener_pool(trabajadores) if trabajadores > 1 and HAY_NUMPY else None
+    lote = trabajadores if pool is not None else 1
+
+    mejor = None          # perfil de pivotes de referencia
+    residuos = None       # entradas acumuladas por CRT
+    M = 1
+    usados = 0
+    anterior = None
+
+    primos = _primos()
+    intentos = 0
+    while intentos < max_primos:
+        k = min(lote, max_primos - intentos)
+        intentos += k
+        combinadas = 0
+        for p, A, piv in _imagenes(filas, [next(primos) for _ in range(k)], pool):
+            perfil = (-len(piv), piv)
+            if mejor is not None and perfil > mejor:
+                continue        # primo desafortunado: perdió rango
+            if mejor is None or perfil < mejor:
+                mejor, M, residuos, anterior, usados = perfil, 1, None, None, 0
+            if n in piv:
+                return None     # inconsistente: lo resuelve el motor exacto
+
+            libres = [j for j in range(ncols) if j not in set(piv)]
+            nuevos = [[A[i][j] for j in libres] for i in range(len(piv))]
+            if residuos is None:
+                residuos = nuevos
+            else:
+                inv = pow(M, -1, p)
+                for i in range(len(piv)):
+                    fila_x = residuos[i]
+                    for c, b in enumerate(nuevos[i]):
+                        x = fila_x[c]
+                        fila_x[c] = x + M * ((b - x) * inv % p)
+            M *= p
+            usados += 1
+            combinadas += 1
+        if not combinadas:
+            continue        # todo el lote fue de primos desafortunados
+
+        piv = mejor[1]
+        r = len(piv)
+        libres = [j for j in range(ncols) if j not in set(piv)]
+        candidata = []
+        for i in range(r):
+            valores = [_reconstruir(x, M) for x in residuos[i]]
+            if any(v is None for v in valores):
+                candidata = None
+                break
+            candidata.append(valores)
+        if candidata is None:
+            anterior = None
+            continue
+        if candidata != anterior:
+            anterior = candidata
+            if r > 0:
+                continue    # aún no se estabiliza
+
+        R = [[Fraction(0)] * ncols for _ in range(m)]
+        for i, c in enumerate(piv):
+            R[i][c] = Fraction(1)
+            for k, j in enumerate(libres):
+                R[i][j] = candidata[i][k]
+        if _verificar(Ab, R, piv):
+            return R, piv, usados
+        anterior = None
+    return None
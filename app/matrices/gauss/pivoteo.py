@@ -0,0 +1,180 @@
+# app/matrices/gauss/pivoteo.py
+# -*- coding: utf-8 -*-
+"""
+Estrategias de pivoteo para el núcleo de eliminación.
+
+Cada estrategia elige la fila pivote de la columna actual entre las filas
+que aún no tienen pivote. Las columnas se recorren siempre en orden: la
+forma escalonada y la lectura x1 = ..., libres dependen del orden original
+de las variables, así que no hay pivoteo completo ni de torre con
+intercambio de columnas: "escalado" y "torre_filas" son sus versiones por
+filas (ver cada clase).
+
+Las magnitudes se piden al motor una sola vez por candidata y búsqueda
+(``motor.magnitud``), y los datos por fila (máximo de la fila, no nulos) se
+guardan en caché hasta que una operación modifica esa fila: ``Eliminacion``
+avisa con ``fila_modificada`` e ``intercambiadas``.
+
+  - "primero":     primer no nulo (el más barato; el de pygauss_ext).
+  - "parcial":     mayor |a_rc| (estabilidad en flotante).
+  - "escalado":    mayor |a_rc| relativo al máximo de su fila (pivoteo
+                   parcial escalado).
+  - "torre_filas": mayor |a_rc| entre las filas donde a_rc también es el
+                   máximo de su fila (la condición de torre, sin buscar en
+                   otras columnas); si no hay, parcial.
+  - "bits":        entrada con menos bits (numerador + denominador): menos
+                   crecimiento de coeficientes en modo exacto. En flotante,
+                   parcial.
+  - "markowitz":   fila con menos no nulos en A (menos relleno).
+"""
+
+
+class Pivoteo:
+    """Estrategia base con caché de datos por fila."""
+
+    nombre = ""
+
+    def __init__(self):
+        self.motor = None
+        self._por_fila = {}
+
+    def preparar(self, motor):
+        self.motor = motor
+        self._por_fila.clear()
+        return self
+
+    def fila_modificada(self, r):
+        self._por_fila.pop(r, None)
+
+    def intercambiadas(self, i, j):
+        c = self._por_fila
+        vi, vj = c.pop(i, None), c.pop(j, None)
+        if vi is not None:
+            c[j] = vi
+        if vj is not None:
+            c[i] = vj
+
+    def _dato_fila(self, r, calcular):
+        v = self._por_fila.get(r)
+        if v is None:
+            v = self._por_fila[r] = calcular(r)
+        return v
+
+    def _candidatas(self, col, fila):
+        M = self.motor
+        return [r for r in range(fila, M.m) if not M.es_cero(r, col)]
+
+    def elegir(self, col, fila):
+        """Fila pivote para ``col`` entre ``fila``..m-1, o None."""
+        raise NotImplementedError
+
+
+class PivoteoPrimero(Pivoteo):
+    nombre = "primero"
+
+    def elegir(self, col, fila):
+        M = self.motor
+        for r in range(fila, M.m):
+            if not M.es_cero(r, col):
+                return r
+        return None
+
+
+class PivoteoParcial(Pivoteo):
+    nombre = "parcial"
+
+    def _mayor(self, candidatas, col):
+        M = self.motor
+        tol = getattr(M, "tol", 0)
+        piv, mejor = None, None
+        for r in candidatas:
+            mag = M.magnitud(r, col)
+            # los empates (o casi, en flotante) conservan la primera fila
+            if piv is None or mag > mejor + tol:
+                piv, mejor = r, mag
+        return piv
+
+    def elegir(self, col, fila):
+        return self._mayor(self._candidatas(col, fila), col)
+
+
+class PivoteoEscalado(Pivoteo):
+    nombre = "escalado"
+
+    def elegir(self, col, fila):
+        M = self.motor
+        piv = mejor = escala = None
+        for r in self._candidatas(col, fila):
+            mag = M.magnitud(r, col)
+            s = self._dato_fila(r, M.max_fila)
+            # mag/s > mejor/escala sin dividir
+            if piv is None or mag * escala > mejor * s:
+                piv, mejor, escala = r, mag, s
+        return piv
+
+
+class PivoteoTorreFilas(PivoteoParcial):
+    nombre = "torre_filas"
+
+    def elegir(self, col, fila):
+        M = self.motor
+        candidatas = self._candidatas(col, fila)
+        dominantes = [
+            r for r in candidatas
+            if M.magnitud(r, col) >= self._dato_fila(r, M.max_fila)
+        ]
+        return self._mayor(dominantes or candidatas, col)
+
+
+class PivoteoBits(PivoteoParcial):
+    nombre = "bits"
+
+    def elegir(self, col, fila):
+        M = self.motor
+        candidatas = self._candidatas(col, fila)
+        if not hasattr(M, "bits"):
+            return self._mayor(candidatas, col)
+        piv, menor = None, None
+        for r in candidatas:
+            b = M.bits(r, col)
+            if piv is None or b < menor:
+                piv, menor = r, b
+        return piv
+
+
+class PivoteoMarkowitz(Pivoteo):
+    nombre = "markowitz"
+
+    def elegir(self, col, fila):
+        M = self.motor
+        piv, menor = None, None
+        for r in self._candidatas(col, fila):
+            nnz = self._dato_fila(r, M.nnz_fila)
+            if piv is None or nnz < menor:
+                piv, menor = r, nnz
+        return piv
+
+
+ESTRATEGIAS = {
+    cls.nombre: cls
+    for cls in (
+        PivoteoPrimero,
+        PivoteoParcial,
+        PivoteoEscalado,
+        PivoteoTorreFilas,
+        PivoteoBits,
+        PivoteoMarkowitz,
+    )
+}
+
+
+def crear_pivoteo(pivoteo="parcial"):
+    """Estrategia a partir de su nombre (o la misma instancia)."""
+    if isinstance(pivoteo, Pivoteo):
+        return pivoteo
+    try:
+        return ESTRATEGIAS[pivoteo]()
+    except KeyError:
+        raise ValueError(
+            f"Pivoteo desconocido: {pivoteo!r}. Opciones: {', '.join(ESTRATEGIAS)}."
+        ) from None
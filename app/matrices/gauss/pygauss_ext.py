@@ -8,11 +8,18 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from fractions import Fraction
-from typing import List, Tuple, Dict, Optional, Any
+from typing import List, Tuple, Dict, Optional, Any, Callable
+from bisect import bisect_left
 import json
 import urllib.request
 import urllib.error
 
+from .eliminacion import crear_motor, Eliminacion, INTERCAMBIO, ESCALA, PIVOTEO_POR_MOTOR
+from .modular import rref_modular
+from .refinamiento import rref_refinada
+from .factorizacion import CACHE, MOTORES_EXACTOS
+from .racional import MatrizRacional
+
 # ---------- Utilities ----------
 
 def to_fraction(x: Any) -> Fraction:
@@ -29,7 +36,13 @@ def to_fraction(x: Any) -> Fraction:
         return Fraction(float(x)).limit_denominator()
 
 def fraction_fmt(f: Fraction) -> str:
-    """Pretty print a Fraction: integer if denom=1 else 'num/den' with sign cleaned."""
+    """Pretty print a Fraction: integer if denom=1 else 'num/den' with sign cleaned.
+
+    Floats (from the "flotante" engine) are printed as trimmed decimals.
+    """
+    if isinstance(f, float):
+        s = "{0:.10f}".format(f).rstrip("0").rstrip(".")
+        return "0" if s in ("", "-0") else s
     if f.denominator == 1:
         return str(f.numerator)
     # ensure "-a/b" rather than "+ -a/b"
@@ -51,65 +64,108 @@ def augment(A: List[List[Any]], b: List[Any]) -> List[List[Fraction]]:
         out.append(row)
     return out
 
+def augment_rows(A: List[List[Any]], b: List[Any]) -> MatrizRacional:
+    """Create augmented matrix [A|b] as integer rows with one denominator each.
+
+    Same values as augment(), without one Fraction object per cell; ref(),
+    rref() and every exact engine accept it.
+    """
+    if len(b) != len(A):
+        raise ValueError("b length must match number of rows in A")
+    return MatrizRacional([[to_fraction(x) for x in row] + [to_fraction(bi)]
+                           for row, bi in zip(A, b)])
+
 # Linear expressions of the form: const + sum(coeff[var] * var)
-# We'll represent variables by their 0-based index using keys like ('x', j).
-Expr = Dict[Any, Fraction]  # keys: 'const' or ('x', j)
+# Variables are 0-based indices. LinExpr keeps them as a sorted index list
+# plus a parallel list of exact coefficients (no zero entries), so the
+# back-substitution loops update expressions in place instead of building
+# a new dict per operation.
+
+class LinExpr:
+    """Sparse linear expression: const + sum(vals[k] * x_{idx[k]})."""
+
+    __slots__ = ("const", "idx", "vals")
+
+    def __init__(self, const=Fraction(0), idx=None, vals=None):
+        # floats stay floats (converting them would print the exact binary value)
+        self.const = const if isinstance(const, float) else Fraction(const)
+        self.idx: List[int] = idx if idx is not None else []
+        self.vals: List[Any] = vals if vals is not None else []
+
+    def copy(self) -> "LinExpr":
+        return LinExpr(self.const, self.idx[:], self.vals[:])
+
+    def coeff(self, j: int):
+        k = bisect_left(self.idx, j)
+        if k < len(self.idx) and self.idx[k] == j:
+            return self.vals[k]
+        return Fraction(0)
+
+    def terms(self):
+        """(variable index, coefficient) pairs in increasing index order."""
+        return zip(self.idx, self.vals)
+
+    def axpy(self, k, other: "LinExpr") -> "LinExpr":
+        """self += k * other, in place. Returns self."""
+        if not k:
+            return self
+        self.const = self.const + k * other.const
+        idx, vals = self.idx, self.vals
+        pos, zeros = 0, False
+        for j, v in zip(other.idx, other.vals):
+            pos = bisect_left(idx, j, pos)
+            if pos < len(idx) and idx[pos] == j:
+                vals[pos] = vals[pos] + k * v
+                zeros = zeros or not vals[pos]
+            else:
+                idx.insert(pos, j)
+                vals.insert(pos, k * v)
+        if zeros:
+            keep = [i for i, v in enumerate(vals) if v != 0]
+            self.idx = [idx[i] for i in keep]
+            self.vals = [vals[i] for i in keep]
+        return self
+
+    def scale(self, k) -> "LinExpr":
+        """self *= k, in place. Returns self."""
+        self.const = self.const * k
+        vals = self.vals
+        for i in range(len(vals)):
+            vals[i] = vals[i] * k
+        return self
+
+Expr = LinExpr
 
 def expr_const(c: Fraction = Fraction(0)) -> Expr:
-    return {'const': Fraction(c)}
+    return LinExpr(c)
 
 def expr_var(j: int) -> Expr:
-    return {'const': Fraction(0), ('x', j): Fraction(1)}
+    return LinExpr(Fraction(0), [j], [Fraction(1)])
 
 def expr_add(a: Expr, b: Expr) -> Expr:
-    out: Expr = {}
-    keys = set(a.keys()).union(b.keys())
-    for k in keys:
-        out[k] = a.get(k, Fraction(0)) + b.get(k, Fraction(0))
-    if 'const' not in out:
-        out['const'] = Fraction(0)
-    # prune zeros
-    for k in list(out.keys()):
-        if out[k] == 0:
-            if k != 'const':
-                out.pop(k, None)
-    return out
+    return a.copy().axpy(1, b)
 
 def expr_sub(a: Expr, b: Expr) -> Expr:
-    out: Expr = {}
-    keys = set(a.keys()).union(b.keys())
-    for k in keys:
-        out[k] = a.get(k, Fraction(0)) - b.get(k, Fraction(0))
-    if 'const' not in out:
-        out['const'] = Fraction(0)
-    for k in list(out.keys()):
-        if out[k] == 0:
-            if k != 'const':
-                out.pop(k, None)
-    return out
+    return a.copy().axpy(-1, b)
 
 def expr_scale(a: Expr, k: Fraction) -> Expr:
-    out: Expr = {}
-    for key, val in a.items():
-        out[key] = val * k
-    return out
+    return a.copy().scale(k)
 
-def expr_to_str(e: Expr) -> str:
+def expr_to_str(e: Expr, fmt: Callable[[Any], str] = fraction_fmt) -> str:
+    """Format e as 'c + a*x1 - x2'; fmt prints each number (fraction_fmt by default)."""
     parts = []
-    const = e.get('const', Fraction(0))
+    const = e.const
     if const != 0:
-        parts.append(fraction_fmt(const))
-    # sort variables by index
-    vars_sorted = sorted([k for k in e.keys() if isinstance(k, tuple) and k[0]=='x'], key=lambda t: t[1])
-    for key in vars_sorted:
-        coeff = e[key]
-        name = f"x{key[1]+1}"
+        parts.append(fmt(const))
+    # variables already sorted by index
+    for j, coeff in e.terms():
+        name = f"x{j+1}"
         if coeff == 1:
             parts.append(name)
         elif coeff == -1:
             parts.append(f"-{name}")
         else:
-            parts.append(f"{fraction_fmt(coeff)}*{name}")
+            parts.append(f"{fmt(coeff)}*{name}")
     if not parts:
         return "0"
     # join with +/-, fix "+ -" occurrences
@@ -124,73 +180,70 @@ class EchelonResult:
     matrix: List[List[Fraction]]  # augmented matrix after ops
     pivots: List[int]             # pivot column indices (in A columns)
     steps: List[str]              # textual steps (optional)
-
-def ref(Ab: List[List[Fraction]], keep_steps: bool = False) -> EchelonResult:
-    """Row Echelon Form (Gaussian elimination). Returns pivots and steps."""
-    M = mat_copy(Ab)
-    m = len(M)
-    n = len(M[0]) - 1  # number of variables
-    pivots = []
+    stats: Optional[Dict[str, Any]] = None  # sparsity / fill-in ("dispersa")
+    refinement_rounds: Optional[int] = None  # exact corrections ("refinamiento")
+
+def _step_text(op) -> str:
+    if op.tipo == INTERCAMBIO:
+        return f"R{op.fila+1} ↔ R{op.otra+1}"
+    if op.tipo == ESCALA:
+        return f"R{op.fila+1} := R{op.fila+1} / {fraction_fmt(op.factor)}"
+    return f"R{op.fila+1} := R{op.fila+1} - ({fraction_fmt(op.factor)})*R{op.otra+1}"
+
+def _echelon(Ab, reduced: bool, keep_steps: bool,
+             engine: str, pivoting: Optional[str] = None) -> EchelonResult:
+    """Single pass of the shared elimination core.
+
+    Ab: list of Fraction rows (augment) or a MatrizRacional (augment_rows).
+    pivoting: strategy name from pivoteo.ESTRATEGIAS ("primero", "parcial",
+    "escalado", "torre_filas", "bits", "markowitz"); default first-nonzero, or
+    Markowitz with the "dispersa" engine.
+    """
+    if engine == "modular":
+        if reduced:
+            res = rref_modular(Ab)
+            if res is not None:
+                matrix, pivots, nprimes = res
+                steps = [f"RREF mod {nprimes} primes (CRT + rational reconstruction)"]
+                return EchelonResult(matrix, pivots, steps if keep_steps else [])
+        # REF, inconsistent or unverified systems: exact engine
+        engine = "fracciones"
+    elif engine == "refinamiento":
+        if reduced:
+            res = rref_refinada(Ab)
+            if res is not None:
+                matrix, pivots, rounds = res
+                steps = [f"float64 LU + {rounds} exact residual corrections "
+                         "(iterative refinement + rational reconstruction)"]
+                return EchelonResult(matrix, pivots, steps if keep_steps else [],
+                                     refinement_rounds=rounds)
+        # REF, non-square, singular, ill-conditioned or stalled: exact engine
+        engine = "fracciones"
+    motor = crear_motor(Ab, engine)
+    # the sparse engine picks the pivot row with fewest nonzeros (Markowitz)
+    pivoting = pivoting or PIVOTEO_POR_MOTOR.get(engine, "primero")
+    elim = Eliminacion(motor, reducida=reduced, normalizar=reduced, pivoteo=pivoting)
     steps = []
+    for op in elim:
+        # scaling by 1 is a no-op; keep it out of the textual log
+        if keep_steps and not (op.tipo == ESCALA and op.factor == 1):
+            steps.append(_step_text(op))
+    stats = motor.estadisticas() if hasattr(motor, "estadisticas") else None
+    return EchelonResult(motor.resultado(), elim.pivotes, steps, stats)
+
+def ref(Ab: List[List[Fraction]], keep_steps: bool = False,
+        engine: str = "fracciones",
+        pivoting: Optional[str] = None) -> EchelonResult:
+    """Row Echelon Form (Gaussian elimination). Returns pivots and steps."""
+    return _echelon(Ab, reduced=False, keep_steps=keep_steps, engine=engine,
+                    pivoting=pivoting)
 
-    row = 0
-    for col in range(n):
-        # find pivot
-        pivot = None
-        for r in range(row, m):
-            if M[r][col] != 0:
-                pivot = r
-                break
-        if pivot is None:
-            continue
-        if pivot != row:
-            M[row], M[pivot] = M[pivot], M[row]
-            if keep_steps:
-                steps.append(f"R{row+1} ↔ R{pivot+1}")
-        # eliminate below
-        piv = M[row][col]
-        for r in range(row+1, m):
-            if M[r][col] != 0:
-                factor = M[r][col] / piv
-                for c in range(col, n+1):
-                    M[r][c] -= factor * M[row][c]
-                if keep_steps:
-                    steps.append(f"R{r+1} := R{r+1} - ({fraction_fmt(factor)})*R{row+1}")
-        pivots.append(col)
-        row += 1
-        if row == m:
-            break
-
-    return EchelonResult(M, pivots, steps)
-
-def rref(Ab: List[List[Fraction]], keep_steps: bool = False) -> EchelonResult:
+def rref(Ab: List[List[Fraction]], keep_steps: bool = False,
+         engine: str = "fracciones",
+         pivoting: Optional[str] = None) -> EchelonResult:
     """Reduced Row Echelon Form (Gauss-Jordan)."""
-    res = ref(Ab, keep_steps=keep_steps)
-    M = res.matrix
-    pivots = res.pivots
-    steps = res.steps
-    m = len(M)
-    n = len(M[0]) - 1
-
-    # Make pivot entries 1 and clear above
-    for i, col in enumerate(pivots):
-        # scale row i
-        piv = M[i][col]
-        if piv != 0 and piv != 1:
-            for c in range(col, n+1):
-                M[i][c] /= piv
-            if keep_steps:
-                steps.append(f"R{i+1} := R{i+1} / {fraction_fmt(piv)}")
-        # eliminate above
-        for r in range(0, i):
-            if M[r][col] != 0:
-                factor = M[r][col]
-                for c in range(col, n+1):
-                    M[r][c] -= factor * M[i][c]
-                if keep_steps:
-                    steps.append(f"R{r+1} := R{r+1} - ({fraction_fmt(factor)})*R{i+1}")
-
-    return EchelonResult(M, pivots, steps)
+    return _echelon(Ab, reduced=True, keep_steps=keep_steps, engine=engine,
+                    pivoting=pivoting)
 
 # ---------- Solution formatting ----------
 
@@ -231,15 +284,14 @@ def solve_from_ref(M: List[List[Fraction]], pivots: List[int]) -> Solution:
             # degenerate but shouldn't happen
             exprs[col] = expr_const(0)
             continue
-        # compute rhs = b_i - sum_{j>col} a_ij * x_j
+        # compute rhs = b_i - sum_{j>col} a_ij * x_j (in place)
         rhs: Expr = expr_const(M[i][-1])
         for j in range(col+1, n):
             aij = M[i][j]
-            if aij != 0:
-                ej = exprs.get(j, expr_const(0))
-                rhs = expr_sub(rhs, expr_scale(ej, aij))
+            if aij != 0 and j in exprs:
+                rhs.axpy(-aij, exprs[j])
         # divide by pivot
-        exprs[col] = expr_scale(rhs, Fraction(1,1)/piv)
+        exprs[col] = rhs.scale(Fraction(1,1)/piv)
 
     status = "unique" if len(free) == 0 else "infinite"
     return Solution(status=status, variable_expressions=exprs, free_vars=free, steps=[])
@@ -255,13 +307,10 @@ def solve_from_rref(M: List[List[Fraction]], pivots: List[int]) -> Solution:
     exprs: Dict[int, Expr] = {}
 
     for i, col in enumerate(pivots):
-        rhs = expr_const(M[i][-1])  # in RREF, pivot = 1 and entries to right are the coefficients
-        # subtract contributions of free variables present in row i
-        for j in free:
-            aij = M[i][j]
-            if aij != 0:
-                rhs = expr_sub(rhs, expr_scale(expr_var(j), aij))
-        exprs[col] = rhs
+        # in RREF, pivot = 1 and entries to right are the coefficients:
+        # x_col = b_i - sum over free j of a_ij * x_j (indices already sorted)
+        terms = [(j, -M[i][j]) for j in free if M[i][j] != 0]
+        exprs[col] = LinExpr(M[i][-1], [j for j, _ in terms], [v for _, v in terms])
 
     # free vars equal themselves
     for j in free:
@@ -270,8 +319,12 @@ def solve_from_rref(M: List[List[Fraction]], pivots: List[int]) -> Solution:
     status = "unique" if len(free) == 0 else "infinite"
     return Solution(status=status, variable_expressions=exprs, free_vars=free, steps=[])
 
-def solution_to_strings(sol: Solution) -> List[str]:
-    """Format solution as requested: x1 = ..., and for free variables 'Variable libre: xk'."""
+def solution_to_strings(sol: Solution, fmt: Callable[[Any], str] = fraction_fmt) -> List[str]:
+    """Format solution as requested: x1 = ..., and for free variables 'Variable libre: xk'.
+
+    fmt prints each number, e.g. FormateadorNumeros.fmt to honour the
+    request's modo_precision and decimales.
+    """
     lines: List[str] = []
     if sol.status == "inconsistent":
         return ["Sistema inconsistente: no tiene solución."]
@@ -282,12 +335,70 @@ def solution_to_strings(sol: Solution) -> List[str]:
             lines.append(f"Variable libre: x{j+1}")
         if j in sol.variable_expressions:
             expr = sol.variable_expressions[j]
-            lines.append(f"x{j+1} = {expr_to_str(expr)}")
+            lines.append(f"x{j+1} = {expr_to_str(expr, fmt)}")
     return lines
 
+# ---------- Solution space (exact arrays) ----------
+
+@dataclass
+class SolutionSpace:
+    """Solution set of A x = b read once from the RREF of [A|b].
+
+    x = particular + sum(t_k * null_space[k]) for any values t_k of the
+    free variables (one null-space vector per free variable, in order).
+    """
+    rank: int
+    pivots: List[int]                  # pivot columns (0-based)
+    free_vars: List[int]               # non-pivot columns (0-based)
+    particular: Optional[List[Any]]    # None if the system is inconsistent
+    null_space: List[List[Any]]        # basis of {x : A x = 0}
+    rref: List[List[Any]]              # RREF of [A|b]
+    column_basis: Optional[List[List[Any]]] = None  # pivot columns of A
+
+    @property
+    def status(self) -> str:
+        if self.particular is None:
+            return "inconsistent"
+        return "unique" if not self.free_vars else "infinite"
+
+    def lines(self) -> List[str]:
+        """Same lines as gauss_jordan_solve (x1 = ..., Variable libre: xk)."""
+        return solution_to_strings(solve_from_rref(self.rref, self.pivots))
+
+def solution_space_from_rref(M: List[List[Any]], pivots: List[int],
+                             A: Optional[List[List[Any]]] = None) -> SolutionSpace:
+    """Rank, particular solution and null-space basis from an RREF [A|b]."""
+    n = len(M[0]) - 1
+    pivot_set = set(pivots)
+    free = [j for j in range(n) if j not in pivot_set]
+    zero = Fraction(0)
+
+    null_space = []
+    for j in free:
+        v = [zero] * n
+        v[j] = Fraction(1)
+        for i, col in enumerate(pivots):
+            if M[i][j] != 0:
+                v[col] = -M[i][j]
+        null_space.append(v)
+
+    particular = None
+    if not detect_inconsistent(M):
+        particular = [zero] * n
+        for i, col in enumerate(pivots):
+            particular[col] = M[i][n]
+
+    column_basis = None
+    if A is not None:
+        column_basis = [[row[c] for row in A] for c in pivots]
+    return SolutionSpace(len(pivots), list(pivots), free, particular,
+                         null_space, M, column_basis)
+
 # ---------- Public API ----------
 
-def gauss_solve(A: List[List[Any]], b: List[Any], keep_steps: bool = False) -> Dict[str, Any]:
+def gauss_solve(A: List[List[Any]], b: List[Any], keep_steps: bool = False,
+                engine: str = "fracciones",
+                pivoting: Optional[str] = None) -> Dict[str, Any]:
     """Gaussian elimination to REF + back substitution into parametric form.
 
     Returns dict with:
@@ -297,9 +408,18 @@ def gauss_solve(A: List[List[Any]], b: List[Any], keep_steps: bool = False) -> D
         - pivots: List[int]
         - ref_matrix: List[List[str]] pretty fractions
         - steps: List[str] elimination steps (if keep_steps)
+
+    engine: "fracciones", "bareiss" (integer, fraction-free elimination),
+    "flotante" (NumPy float64; lines and matrix are printed as decimals, so
+    only use it on well-conditioned systems), "dispersa" (dict-of-keys rows
+    with Markowitz pivot rows; adds a "sparsity" fill-in report),
+    "modular" or "refinamiento" (RREF only; REF falls back to "fracciones").
+
+    pivoting: pivot strategy (see _echelon); it changes the REF and the
+    steps, not the solution.
     """
     Ab = augment(A, b)
-    res = ref(Ab, keep_steps=keep_steps)
+    res = ref(Ab, keep_steps=keep_steps, engine=engine, pivoting=pivoting)
     sol = solve_from_ref(res.matrix, res.pivots)
 
     out = {
@@ -310,12 +430,46 @@ def gauss_solve(A: List[List[Any]], b: List[Any], keep_steps: bool = False) -> D
         "ref_matrix": [[fraction_fmt(x) for x in row] for row in res.matrix],
         "steps": res.steps if keep_steps else []
     }
+    if res.stats:
+        out["sparsity"] = res.stats
     return out
 
-def gauss_jordan_solve(A: List[List[Any]], b: List[Any], keep_steps: bool = False) -> Dict[str, Any]:
-    """Gauss-Jordan to RREF and direct read-off of parametric solution."""
+def gauss_jordan_solve(A: List[List[Any]], b: List[Any], keep_steps: bool = False,
+                       engine: str = "fracciones",
+                       use_cache: bool = True,
+                       pivoting: Optional[str] = None) -> Dict[str, Any]:
+    """Gauss-Jordan to RREF and direct read-off of parametric solution.
+
+    engine: same choices as gauss_solve. "modular" eliminates modulo several
+    31-bit primes, recombines with CRT and recovers exact Fractions by
+    rational reconstruction (see modular.py); the output is identical to
+    the exact engines, without the per-step row operations. On large
+    systems the modular images run in a process pool (PYGAUSS_TRABAJADORES
+    workers). "refinamiento"
+    factors A once in float64 and corrects the solution with exact integer
+    residuals until rational reconstruction verifies (see refinamiento.py);
+    "refinement_rounds" reports the corrections used. Non-square, singular,
+    ill-conditioned or stalled systems fall back to "fracciones".
+
+    use_cache: with an exact engine, the factorization of A is looked up in
+    the shared content-addressed cache (factorizacion.CACHE), so repeated
+    calls with the same A only replay the recorded row operations on b
+    (with "dispersa", "sparsity" then describes the factorization of A).
+
+    pivoting: pivot strategy (see _echelon); the RREF is the same for all.
+    """
     Ab = augment(A, b)
-    res = rref(Ab, keep_steps=keep_steps)
+    if use_cache and engine in MOTORES_EXACTOS:
+        # same A as a previous call: only its row operations are replayed on b
+        fact = CACHE.obtener([row[:-1] for row in Ab], engine, pivoting)
+        steps = [
+            _step_text(op) for op in fact.operaciones
+            if not (op.tipo == ESCALA and op.factor == 1)
+        ] if keep_steps else []
+        res = EchelonResult(fact.aumentada([row[-1] for row in Ab]),
+                            fact.pivotes, steps, fact.estadisticas)
+    else:
+        res = rref(Ab, keep_steps=keep_steps, engine=engine, pivoting=pivoting)
     sol = solve_from_rref(res.matrix, res.pivots)
 
     out = {
@@ -326,8 +480,89 @@ def gauss_jordan_solve(A: List[List[Any]], b: List[Any], keep_steps: bool = Fals
         "rref_matrix": [[fraction_fmt(x) for x in row] for row in res.matrix],
         "steps": res.steps if keep_steps else []
     }
+    if res.stats:
+        out["sparsity"] = res.stats
+    if res.refinement_rounds is not None:
+        out["refinement_rounds"] = res.refinement_rounds
     return out
 
+def solution_space(A: List[List[Any]], b: Optional[List[Any]] = None,
+                   engine: str = "fracciones",
+                   use_cache: bool = True) -> SolutionSpace:
+    """Rank, pivot columns, particular solution, null-space and column-space
+    bases of A x = b as exact numbers (b defaults to 0: homogeneous system).
+
+    With an exact engine the factorization of A comes from the shared
+    cache, like gauss_jordan_solve.
+    """
+    Af = [[to_fraction(x) for x in row] for row in A]
+    if b is None:
+        b = [0] * len(Af)
+    if use_cache and engine in MOTORES_EXACTOS:
+        fact = CACHE.obtener(Af, engine)
+        M, pivots = fact.aumentada([to_fraction(x) for x in b]), fact.pivotes
+    else:
+        res = rref(augment(Af, b), engine=engine)
+        M, pivots = res.matrix, res.pivots
+    return solution_space_from_rref(M, pivots, Af)
+
+def _factor_with_rhs(A: List[List[Any]], B: List[List[Any]], engine: str):
+    """Check B against A and return (A as Fractions, cached factorization of A)."""
+    if len(B) != len(A):
+        raise ValueError("B must have one row per row of A")
+    k = len(B[0]) if B else 0
+    if any(len(row) != k for row in B):
+        raise ValueError("B must be rectangular")
+    Af = [[to_fraction(x) for x in row] for row in A]
+    return Af, CACHE.obtener(Af, engine)
+
+def _spaces_from_factorization(Af, fact, B: List[List[Any]]) -> List[SolutionSpace]:
+    return [
+        solution_space_from_rref(
+            fact.aumentada([to_fraction(row[j]) for row in B]), fact.pivotes, Af)
+        for j in range(len(B[0]) if B else 0)
+    ]
+
+def solution_spaces(A: List[List[Any]], B: List[List[Any]],
+                    engine: str = "fracciones") -> List[SolutionSpace]:
+    """solution_space for every column b of B, with one factorization of A
+    (B has one row per row of A and one column per right-hand side)."""
+    Af, fact = _factor_with_rhs(A, B, engine)
+    return _spaces_from_factorization(Af, fact, B)
+
+def gauss_jordan_solve_multi(A: List[List[Any]], B: List[List[Any]],
+                             engine: str = "fracciones") -> Dict[str, Any]:
+    """Solve A x = b for every column b of B with a single factorization of A.
+
+    A is eliminated once (recording its row operations); each column of B
+    only replays those operations. B has one row per row of A and one
+    column per right-hand side.
+
+    Returns dict with:
+        - pivots: List[int], free_vars: List[int] (shared by all columns)
+        - rref_matrix: RREF of A (pretty fractions)
+        - columns: one {status, lines, free_vars} per column of B
+
+    engine: "fracciones", "bareiss" or "dispersa" (exact engines only).
+    """
+    # one cache lookup for both the per-column spaces and the shared RREF
+    Af, fact = _factor_with_rhs(A, B, engine)
+    spaces = _spaces_from_factorization(Af, fact, B)
+    free = [j for j in range(fact.n) if j not in set(fact.pivotes)]
+
+    columns = [{
+        "status": sp.status,
+        "lines": sp.lines(),
+        "free_vars": [] if sp.status == "inconsistent" else sp.free_vars,
+    } for sp in spaces]
+
+    return {
+        "pivots": fact.pivotes,
+        "free_vars": free,
+        "rref_matrix": [[fraction_fmt(x) for x in row] for row in fact.rref],
+        "columns": columns,
+    }
+
 # ---------- Optional: Local AI Explainer (no-auth) ----------
 
 def ai_explainer(context: str,
@@ -0,0 +1,143 @@
+# app/matrices/gauss/racional.py
+# -*- coding: utf-8 -*-
+"""
+Matriz racional compacta: cada fila es una lista de enteros de Python más
+un denominador común (la entrada (r, j) vale ``filas[r][j] / den[r]``).
+
+Con una Fraction por celda cada suma o producto calcula un gcd y crea un
+objeto nuevo. Aquí las operaciones de fila se hacen en el sitio con
+aritmética entera y la normalización es perezosa: la fila solo se divide
+por el gcd común cuando su denominador pasa de LIMITE_BITS bits (o cuando
+se pide con ``reducir``). Las Fracciones se crean solo al leer valores.
+
+La aceptan ``eliminacion.crear_motor`` (el motor Bareiss toma las filas
+enteras tal cual), ``pygauss_ext`` (``augment_rows``, ``ref``, ``rref``),
+``operaciones.inversa_alg`` y ``operaciones.determinantes``.
+"""
+import sys
+from fractions import Fraction
+from math import gcd
+
+from .bareiss import fila_a_enteros
+
+# Denominador a partir del cual se reduce la fila por su gcd común
+LIMITE_BITS = 64
+
+
+class MatrizRacional:
+    """Matriz de racionales exactos con filas enteras y denominador por fila."""
+
+    __slots__ = ("m", "ncols", "filas", "den")
+
+    def __init__(self, datos):
+        self.m = len(datos)
+        self.ncols = len(datos[0]) if datos else 0
+        self.filas = []
+        self.den = []
+        for fila in datos:
+            if len(fila) != self.ncols:
+                raise ValueError("La matriz debe ser rectangular.")
+            enteros, escala = fila_a_enteros(
+                [v if isinstance(v, (int, Fraction)) else Fraction(v) for v in fila]
+            )
+            self.filas.append(enteros)
+            self.den.append(escala)
+
+    # ----- lectura -----
+
+    def __len__(self):
+        return self.m
+
+    def __getitem__(self, r):
+        return self.fila(r)
+
+    def __iter__(self):
+        return (self.fila(r) for r in range(self.m))
+
+    def valor(self, r, c):
+        return Fraction(self.filas[r][c], self.den[r])
+
+    def es_cero(self, r, c):
+        return self.filas[r][c] == 0
+
+    def fila(self, r, desde=0, hasta=None):
+        d = self.den[r]
+        return [Fraction(v, d) for v in self.filas[r][desde:hasta]]
+
+    def fracciones(self):
+        return [self.fila(r) for r in range(self.m)]
+
+    def copiar(self):
+        nueva = MatrizRacional.__new__(MatrizRacional)
+        nueva.m, nueva.ncols = self.m, self.ncols
+        nueva.filas = [f[:] for f in self.filas]
+        nueva.den = self.den[:]
+        return nueva
+
+    def tamano_bytes(self):
+        """Memoria ocupada por las listas y los enteros (sys.getsizeof)."""
+        total = sys.getsizeof(self.filas) + sys.getsizeof(self.den)
+        for fila, d in zip(self.filas, self.den):
+            total += sys.getsizeof(fila) + sys.getsizeof(d)
+            total += sum(sys.getsizeof(v) for v in fila)
+        return total
+
+    # ----- operaciones de fila (en el sitio) -----
+
+    def intercambiar(self, i, j):
+        self.filas[i], self.filas[j] = self.filas[j], self.filas[i]
+        self.den[i], self.den[j] = self.den[j], self.den[i]
+
+    def multiplicar_fila(self, r, k):
+        """F_r ← k·F_r."""
+        k = Fraction(k)
+        if k.numerator != 1:
+            p = k.numerator
+            self.filas[r] = [v * p for v in self.filas[r]]
+        self.den[r] *= k.denominator
+        self._quizas_reducir(r)
+
+    def dividir_fila(self, r, k):
+        """F_r ← F_r / k (k ≠ 0)."""
+        k = Fraction(k)
+        self.multiplicar_fila(r, Fraction(k.denominator, k.numerator))
+
+    def restar_multiplo(self, r, f, k, desde=0):
+        """
+        F_r ← F_r - k·F_f solo en las columnas desde ``desde``; las
+        anteriores conservan su valor en F_r.
+        """
+        k = Fraction(k)
+        if not k:
+            return
+        dr, df = self.den[r], self.den[f]
+        # a/dr - (p/q)·(b/df) = (a·q·df - p·dr·b) / (dr·q·df)
+        ca, cb = k.denominator * df, k.numerator * dr
+        g = gcd(ca, cb)
+        ca //= g
+        cb //= g
+        fr, ff = self.filas[r], self.filas[f]
+        if ca == 1:
+            for j in range(desde, self.ncols):
+                if ff[j]:
+                    fr[j] -= cb * ff[j]
+        else:
+            for j in range(desde):
+                fr[j] *= ca
+            for j in range(desde, self.ncols):
+                fr[j] = fr[j] * ca - cb * ff[j]
+        self.den[r] = dr * ca
+        self._quizas_reducir(r)
+
+    def _quizas_reducir(self, r):
+        if self.den[r].bit_length() > LIMITE_BITS:
+            self.reducir(r)
+
+    def reducir(self, r=None):
+        """Divide la fila (o todas) por el gcd de sus enteros y su denominador."""
+        for i in range(self.m) if r is None else (r,):
+            fila, d = self.filas[i], self.den[i]
+            g = gcd(d, *fila)
+            if g > 1:
+                self.filas[i] = [v // g for v in fila]
+                self.den[i] = d // g
@@ -0,0 +1,180 @@
+# app/matrices/gauss/refinamiento.py
+# -*- coding: utf-8 -*-
+"""
+Solución exacta por refinamiento iterativo en precisión mixta.
+
+A (escalada a enteros por filas) se factoriza una sola vez en float64 y
+cada ronda hace:
+
+    x̂ = A⁻¹·r              (float64, O(n²))
+    c = round(2^k · x̂)     (enteros)
+    r ← 2^k · r - A·c      (residuo EXACTO con enteros de Python)
+    N ← 2^k · N + c,  D ← 2^k · D
+
+de modo que A·(N/D) = b - r/D con r acotado: cada ronda gana k bits de la
+solución. k sale del número de condición (los bits que float64 acierta).
+Cada vez que D crece un 25 % se intenta la reconstrucción racional de N/D (fracciones
+continuas con un denominador común, ver ``_candidata``); en cuanto hay una
+candidata se comprueba de forma exacta A·x = b y se devuelve.
+
+Para sistemas cuadrados bien condicionados el costo es el de float64 más
+unos pocos productos enteros O(n²), en lugar de la eliminación con
+Fracciones O(n³) con numeradores crecientes. Si el sistema no es cuadrado,
+es singular o mal condicionado, o el residuo deja de bajar, se devuelve
+None y quien llama usa el motor exacto (como ``modular.rref_modular``).
+"""
+from fractions import Fraction
+from math import isqrt, lcm, log2
+
+from .bareiss import fila_a_enteros
+from .flotante import np, HAY_NUMPY, MAX_CONDICION
+from .racional import MatrizRacional
+
+# Bits de margen respecto a lo que float64 acierta según la condición
+MARGEN_BITS = 4
+
+
+def _a_enteros(Ab):
+    if isinstance(Ab, MatrizRacional):
+        return [fila[:] for fila in Ab.filas]
+    return [fila_a_enteros([Fraction(v) for v in fila])[0] for fila in Ab]
+
+
+def _producto(A, A64, cota, c):
+    """A·c exacto; en int64 si no puede desbordar."""
+    mayor = max(abs(v) for v in c)
+    if A64 is not None and mayor * cota < 2**62:
+        return (A64 @ np.array(c, dtype=np.int64)).tolist()
+    return [sum(a * v for a, v in zip(fila, c) if a) for fila in A]
+
+
+def _candidata(N, D, error):
+    """
+    Reconstrucción racional de N/D (|D·x - N| <= error) con denominador
+    común: las entradas de x comparten denominador (un divisor de det A),
+    así que se redondea q·N_j/D con el q ya conocido y solo se reconstruye
+    por fracciones continuas la entrada que no encaja (q crece). Si q pasa
+    de sqrt(D/2) todavía faltan rondas: None.
+    """
+    cota = isqrt(D // 2)
+    q = 1
+    x = []
+    for v in N:
+        p = (2 * q * v + D) // (2 * D)      # round(q·v/D)
+        if abs(q * v - p * D) > q * error:
+            if q > cota:
+                return None
+            f = Fraction(q * v, D).limit_denominator(cota // q)
+            q *= f.denominator
+            p = f.numerator
+            if abs(q * v - p * D) > q * error:
+                return None
+        x.append(Fraction(p, q))
+    return x
+
+
+def _verificar(A, b, x):
+    """A·x == b exacto (con el mínimo común denominador de x)."""
+    den = lcm(*(v.denominator for v in x))
+    num = [v.numerator * (den // v.denominator) for v in x]
+    return all(
+        sum(a * v for a, v in zip(fila, num) if a) == bi * den
+        for fila, bi in zip(A, b)
+    )
+
+
+def resolver_refinado(Ab):
+    """
+    Solución exacta de [A | b] cuadrada (Fracciones o MatrizRacional).
+
+    Devuelve ``(x, rondas)`` con x lista de Fracciones, o None si el
+    refinamiento no es aplicable o se estanca. Las rondas se limitan con la
+    cota de Hadamard de det A (el denominador común de x la divide): con D
+    de más del doble de bits la reconstrucción ya es única.
+    """
+    if not HAY_NUMPY or not len(Ab):
+        return None
+    filas = _a_enteros(Ab)
+    n = len(filas)
+    if len(filas[0]) != n + 1:
+        return None
+    A = [fila[:n] for fila in filas]
+    b = [fila[n] for fila in filas]
+
+    # cada fila dividida por su máximo (equilibrado): la escala entera de
+    # las filas no cambia la solución pero sí la condición en float64
+    maximos = [max((abs(a) for a in fila), default=0) for fila in A]
+    if not all(maximos):
+        return None
+    Af = np.array([[a / mx for a in fila] for fila, mx in zip(A, maximos)])
+    try:
+        inversa = np.linalg.inv(Af)
+    except np.linalg.LinAlgError:
+        return None
+    condicion = float(np.linalg.norm(Af, 1) * np.linalg.norm(inversa, 1))
+    if not np.isfinite(condicion) or condicion > MAX_CONDICION:
+        return None
+    # bits correctos de x̂ en float64 (≈ 52 - log2(κ·n)) menos un margen
+    k = min(52 - int(log2(max(condicion, 1.0) * n)) - MARGEN_BITS, 50)
+    if k < 2:
+        return None
+
+    # log2 de la cota de Hadamard: Σ log2 ||fila_i|| <= Σ bits(max_i) + (n/2)·log2 n
+    bits_hadamard = sum(mx.bit_length() for mx in maximos) + int(n * log2(n) / 2) + 1
+    max_rondas = (2 * bits_hadamard + 2) // k + 3
+
+    norma_inversa = float(np.abs(inversa).sum(axis=1).max())
+    cota = max(maximos) * n
+    A64 = np.array(A, dtype=np.int64) if cota < 2**62 else None
+    # ruido de redondeo de A·round(·): el residuo no debe pasar de esto
+    ruido = cota
+
+    r = b[:]
+    N = [0] * n
+    D = 1
+    intento = 0
+    for ronda in range(1, max_rondas + 1):
+        if not any(r):
+            x = [Fraction(v, D) for v in N]
+            return (x, ronda - 1) if _verificar(A, b, x) else None
+        escala_r = max(abs(v) for v in r)
+        rf = np.array([v / mx for v, mx in zip(r, maximos)])
+        x_hat = inversa @ rf
+        c = [int(v) for v in np.rint(x_hat * 2.0**k)]
+        Ac = _producto(A, A64, cota, c)
+        r_nuevo = [(ri << k) - v for ri, v in zip(r, Ac)]
+        if max(abs(v) for v in r_nuevo) > max(escala_r, ruido):
+            return None     # el residuo no baja: se estanca
+        r = r_nuevo
+        N = [(v << k) + ci for v, ci in zip(N, c)]
+        D <<= k
+
+        # la reconstrucción cuesta O(bits(D)²): se intenta cada vez que D
+        # crece un 25 % (y siempre en la última ronda)
+        if D.bit_length() < intento and ronda < max_rondas:
+            continue
+        intento = D.bit_length() * 5 // 4
+        # |D·x - N| = |A⁻¹·r| <= ||(SA)⁻¹||·||S·r|| (con holgura)
+        error = int(2 * norma_inversa * max(abs(v / mx) for v, mx in zip(r, maximos))) + 2
+        candidata = _candidata(N, D, error)
+        if candidata is not None and _verificar(A, b, candidata):
+            return candidata, ronda
+    return None
+
+
+def rref_refinada(Ab):
+    """
+    RREF [I | x] de un sistema cuadrado con solución única, por
+    refinamiento iterativo. Devuelve ``(matriz, pivotes, rondas)`` o None
+    (entonces se usa el motor exacto).
+    """
+    res = resolver_refinado(Ab)
+    if res is None:
+        return None
+    x, rondas = res
+    n = len(x)
+    R = [
+        [Fraction(int(i == j)) for j in range(n)] + [x[i]]
+        for i in range(n)
+    ]
+    return R, list(range(n)), rondas
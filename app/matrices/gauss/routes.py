@@ -1,4 +1,10 @@
-from flask import Blueprint, render_template, request, jsonify, send_file
+import json
+import time
+
+from flask import (
+    Blueprint, render_template, request, jsonify, send_file,
+    Response, stream_with_context,
+)
 from .algebra import (
     ResolverGaussJordan,
     ResolverGauss,            
@@ -6,25 +12,23 @@ from .algebra import (
     MatrizAumentada,
     FormateadorNumeros,
     sistema_a_matriz_aumentada,   
+    expandir_pasos,
 )
+from .eliminacion import PIVOTEOS
+from .despacho import MOTORES, decidir_motor
+from .pygauss_ext import gauss_jordan_solve_multi
+from .factorizacion import CACHE, MOTORES_EXACTOS
+from .sesiones import guardar_solucion, obtener_pasos
+from .incremental import sesion_para
 from io import BytesIO
 from reportlab.lib.pagesizes import letter
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 
-from .pygauss_ext import gauss_solve, gauss_jordan_solve
 from .hf_client import hf_generate, load_hf_config
 
 
-def pivot_to_1based_int(p):
-    if isinstance(p, int):
-        return p + 1
-    s = str(p).strip().lower()
-    if s.startswith("x"):
-        s = s[1:]
-    return int(s) + 1
-
 def _lineas_a_solucion(lineas):
     """
     Convierte un arreglo de líneas tipo 'x1 = 60 + x6' y 'Variable libre: x6'
@@ -51,6 +55,44 @@ def _lineas_a_solucion(lineas):
                 sol[left.strip()] = right.strip()
     return sol
 
+def _completar_final(final):
+    """Añade solución por líneas y nombres de pivotes al resultado del resolvedor."""
+    final["solucion"] = _lineas_a_solucion(final.get("lineas", []))
+    final["pivotes_vars"] = [f"x{i}" for i in final.get("pivotes", [])]
+    return final
+
+def _formato_pasos(datos):
+    # pasos="diferidos": no se formatea ningún paso ahora (ver /pasos/<id>)
+    if datos.get("pasos") == "diferidos":
+        return "ninguno"
+    return datos.get("formato_pasos", "completo")
+
+def _pasos_diferidos(datos):
+    # con pasos diferidos no se formatean ahora, pero se pedirán después
+    return datos.get("pasos") == "diferidos"
+
+def _decidir_motor(datos, matriz, formateador, formato_pasos, reducida=True):
+    con_pasos = formato_pasos != "ninguno" or _pasos_diferidos(datos)
+    return decidir_motor(
+        matriz.a, formateador.modo, datos.get("motor"),
+        con_pasos=con_pasos, reducida=reducida,
+    )
+
+def _diferir_pasos(resultado, metodo, matriz, solver, modo_precision, decimales):
+    """
+    Añade total de pasos e id para pedirlos luego por páginas, si el motor
+    los contó: "refinamiento" y "modular" sin pasos="diferidos" no
+    registran operaciones, y un id con 0 pasos no serviría.
+    """
+    if not solver.pasos_contados:
+        return resultado
+    resultado["total_pasos"] = solver.total_pasos
+    resultado["id"] = guardar_solucion(
+        metodo, matriz, modo_precision, decimales, solver.motor, solver.total_pasos,
+        pivoteo=solver.pivoteo,
+    )
+    return resultado
+
 
 gauss_bp = Blueprint("gauss", __name__, template_folder="../../../templates")
 
@@ -131,134 +173,324 @@ def sistema_matriz():
         }), 400
 
 
-@gauss_bp.route("/resolver", methods=["POST"])
-def resolver_gauss_jordan():
-    datos = request.get_json(force=True)
+def _leer_matriz(datos):
+    """
+    Valida y evalúa la tabla enviada. Devuelve (matriz, None) o
+    (None, respuesta_de_error).
+    """
     tabla = datos.get("tabla", [])
     filas = len(tabla)
     if filas == 0:
-        return jsonify({"ok": False, "error": "No se recibieron filas."}), 400
+        return None, (jsonify({"ok": False, "error": "No se recibieron filas."}), 400)
     columnas = len(tabla[0]) - 1
     if columnas < 0:
-        return jsonify({"ok": False, "error": "Formato de tabla inválido."}), 400
+        return None, (jsonify({"ok": False, "error": "Formato de tabla inválido."}), 400)
     if any(len(f) != columnas + 1 for f in tabla):
-        return jsonify({"ok": False, "error": "Las filas no tienen el mismo número de columnas."}), 400
-
-    modo_precision = datos.get("modo_precision", "fraccion")
-    decimales = int(datos.get("decimales", 6))
+        return None, (jsonify({"ok": False, "error": "Las filas no tienen el mismo número de columnas."}), 400)
 
-    evaluador = EvaluadorSeguro()
     try:
-        matriz_num = []
-        for fila in tabla:
-            fila_vals = []
-            for val in fila:
-                expr = str(val).strip()
-                if expr == "":
-                    raise ValueError("Hay celdas vacías en la matriz.")
-                fila_vals.append(evaluador.evaluar(expr))
-            matriz_num.append(fila_vals)
+        matriz_num = _evaluar_celdas(tabla)
     except Exception as e:
-        return jsonify({"ok": False, "error": f"Error al evaluar expresiones: {e}"}), 400
+        return None, (jsonify({"ok": False, "error": f"Error al evaluar expresiones: {e}"}), 400)
+
+    return MatrizAumentada(matriz_num), None
+
+def _leer_pivoteo(datos):
+    """Estrategia de pivoteo pedida (None = la del motor) o respuesta de error."""
+    pivoteo = datos.get("pivoteo") or None
+    if pivoteo is not None and pivoteo not in PIVOTEOS:
+        return None, (jsonify({
+            "ok": False,
+            "error": f"Pivoteo desconocido: {pivoteo}. Opciones: {', '.join(PIVOTEOS)}.",
+        }), 400)
+    return pivoteo, None
+
+def _leer_motor(datos):
+    """Motor pedido (None = elección automática) o respuesta de error."""
+    motor = datos.get("motor") or None
+    if motor is not None and motor not in MOTORES:
+        return None, (jsonify({
+            "ok": False,
+            "error": f"Motor desconocido: {motor}. Opciones: {', '.join(MOTORES)}.",
+        }), 400)
+    return motor, None
+
+def _evaluar_celdas(tabla):
+    return EvaluadorSeguro().evaluar_tabla(tabla)
+
+def _evento_stream(evento, sse):
+    texto = json.dumps(evento, ensure_ascii=False)
+    if sse:
+        return f"event: {evento['tipo']}\ndata: {texto}\n\n"
+    return texto + "\n"
 
-    matriz = MatrizAumentada(matriz_num)
+def _respuesta_stream(solver, matriz, decision=None):
+    """
+    Envía cada paso en cuanto se produce (NDJSON, o SSE si se pide
+    ?formato=sse o Accept: text/event-stream). El último evento es el final
+    (con el motor elegido y los tiempos si se pasa ``decision``).
+    """
+    sse = (
+        request.args.get("formato") == "sse"
+        or "text/event-stream" in request.headers.get("Accept", "")
+    )
+
+    def generar():
+        indice = 0
+        inicio = time.perf_counter()
+        try:
+            for tipo, dato in solver.iterar(matriz):
+                if tipo == "paso":
+                    evento = {"tipo": "paso", "indice": indice, "paso": dato}
+                    indice += 1
+                else:
+                    evento = {
+                        "tipo": "final",
+                        "total_pasos": solver.total_pasos,
+                        "final": _completar_final(dato),
+                    }
+                    if decision is not None:
+                        decision.ms_resolucion = (time.perf_counter() - inicio) * 1000
+                        evento["motor"] = decision.como_dict()
+                yield _evento_stream(evento, sse)
+        except Exception as e:
+            yield _evento_stream({"tipo": "error", "error": str(e)}, sse)
+
+    return Response(
+        stream_with_context(generar()),
+        mimetype="text/event-stream" if sse else "application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@gauss_bp.route("/resolver", methods=["POST"])
+def resolver_gauss_jordan():
+    datos = request.get_json(force=True)
+    matriz, error = _leer_matriz(datos)
+    if error:
+        return error
+    pivoteo, error = _leer_pivoteo(datos)
+    if error:
+        return error
+    _, error = _leer_motor(datos)
+    if error:
+        return error
+
+    modo_precision = datos.get("modo_precision", "fraccion")
+    decimales = int(datos.get("decimales", 6))
     formateador = FormateadorNumeros(modo=modo_precision, decimales=decimales)
-    solver = ResolverGaussJordan(formateador)
+    # motor "bareiss": eliminación entera libre de fracciones (misma salida);
+    # motor "refinamiento" sin pasos: float64 + correcciones exactas
+    # motor "modular" sin pasos: imágenes módulo primos en varios procesos
+    # sin motor explícito se elige según tamaño, pasos y condición (despacho.py)
+    # formato_pasos "delta": solo filas modificadas + matriz completa periódica
+    formato_pasos = _formato_pasos(datos)
+    decision = _decidir_motor(datos, matriz, formateador, formato_pasos)
+    solver = ResolverGaussJordan(
+        formateador,
+        motor=decision.motor,
+        formato_pasos=formato_pasos,
+        pivoteo=pivoteo,
+        pasos_diferidos=_pasos_diferidos(datos),
+    )
+    # Un solo recorrido: pasos, RREF, pivotes y líneas x1=..., libres
+    inicio = time.perf_counter()
     resultado = solver.resolver(matriz)
-
-    # Añadir líneas x1=..., libres, etc. con Gauss-Jordan (pygauss_ext)
-    A = [fila[:-1] for fila in matriz_num]
-    b = [fila[-1] for fila in matriz_num]
-    gj = gauss_jordan_solve(A, b, keep_steps=False)
-    pivotes_raw = gj.get("pivots", [])
-    pivotes_num = [pivot_to_1based_int(p) for p in pivotes_raw]
-    pivotes_vars = [f"x{i}" for i in pivotes_num]
-
-    # Normaliza estructura
-    if isinstance(resultado.get("final"), dict):
-        resultado["final"]["lineas"] = gj.get("lines", [])
-        resultado["final"]["solucion"] = _lineas_a_solucion(gj.get("lines", []))
-        resultado["final"]["pivotes"] = pivotes_num
-        resultado["final"]["pivotes_vars"] = pivotes_vars
-        libres_idx = gj.get("free_vars", [])
-        resultado["final"]["variables_libres"] = [f"x{i+1}" for i in libres_idx]
-    else:
-        resultado["final"] = {
-            "lineas": gj.get("lines", []),
-            "pivotes": pivotes_num,
-            "pivotes_vars": pivotes_vars,
-            "variables_libres": [f"x{i+1}" for i in gj.get("free_vars", [])],
-            "solucion": _lineas_a_solucion(gj.get("lines", [])),
-        }
+    decision.ms_resolucion = (time.perf_counter() - inicio) * 1000
+    resultado["motor"] = decision.como_dict()
+    _completar_final(resultado["final"])
+    if solver.formato_pasos == "ninguno":
+        _diferir_pasos(resultado, "gauss_jordan", matriz, solver, modo_precision, decimales)
     return jsonify({"ok": True, **resultado})
 
 
+@gauss_bp.route("/resolver_incremental", methods=["POST"])
+def resolver_incremental():
+    """
+    Solo el resultado final, reutilizando la sesión de la última tabla
+    resuelta: {"tabla": [[...]], "sesion": "<id>" (opcional)}. Si cambió
+    solo b se reproducen las operaciones guardadas; si cambiaron pocas
+    celdas de A se actualiza la solución por rango uno.
+    """
+    datos = request.get_json(force=True)
+    matriz, error = _leer_matriz(datos)
+    if error:
+        return error
+
+    modo_precision = datos.get("modo_precision", "fraccion")
+    decimales = int(datos.get("decimales", 6))
+    formateador = FormateadorNumeros(modo=modo_precision, decimales=decimales)
+    motor, error = _leer_motor(datos)
+    if error:
+        return error
+    if motor not in MOTORES_EXACTOS:
+        motor = "fracciones"
+    try:
+        sid, (R, pivotes), cambios = sesion_para(datos.get("sesion"), matriz.a, motor)
+    except (TypeError, ValueError) as e:
+        return jsonify({"ok": False, "error": str(e)}), 400
+
+    solver = ResolverGaussJordan(formateador, motor=motor, formato_pasos="ninguno")
+    final = _completar_final(solver.final_desde_rref(matriz, R, pivotes))
+    return jsonify({
+        "ok": True,
+        "sesion": sid,
+        "modo": "completo" if cambios is None else "incremental",
+        "celdas_cambiadas": cambios,
+        "final": final,
+    })
+
+
 @gauss_bp.route("/resolver_simple", methods=["POST"])
 def resolver_gauss_simple():
     datos = request.get_json(force=True)
-    tabla = datos.get("tabla", [])
-    filas = len(tabla)
-    if filas == 0:
-        return jsonify({"ok": False, "error": "No se recibieron filas."}), 400
-    columnas = len(tabla[0]) - 1
-    if columnas < 0:
-        return jsonify({"ok": False, "error": "Formato de tabla inválido."}), 400
-    if any(len(f) != columnas + 1 for f in tabla):
-        return jsonify({"ok": False, "error": "Las filas no tienen el mismo número de columnas."}), 400
+    matriz, error = _leer_matriz(datos)
+    if error:
+        return error
+    pivoteo, error = _leer_pivoteo(datos)
+    if error:
+        return error
+    _, error = _leer_motor(datos)
+    if error:
+        return error
 
     modo_precision = datos.get("modo_precision", "fraccion")
     decimales = int(datos.get("decimales", 6))
+    formateador = FormateadorNumeros(modo=modo_precision, decimales=decimales)
+    formato_pasos = _formato_pasos(datos)
+    decision = _decidir_motor(datos, matriz, formateador, formato_pasos, reducida=False)
+    solver = ResolverGauss(
+        formateador,
+        motor=decision.motor,
+        formato_pasos=formato_pasos,
+        pivoteo=pivoteo,
+        pasos_diferidos=_pasos_diferidos(datos),
+    )
+    # Un solo recorrido: pasos, forma escalonada y sustitución hacia atrás
+    inicio = time.perf_counter()
+    resultado = solver.resolver(matriz)
+    decision.ms_resolucion = (time.perf_counter() - inicio) * 1000
+    resultado["motor"] = decision.como_dict()
+    _completar_final(resultado["final"])
+    if solver.formato_pasos == "ninguno":
+        _diferir_pasos(resultado, "gauss", matriz, solver, modo_precision, decimales)
+    return jsonify({"ok": True, **resultado})
+
 
-    evaluador = EvaluadorSeguro()
+@gauss_bp.route("/resolver_multiple", methods=["POST"])
+def resolver_multiple():
+    """
+    Varios lados derechos con una sola factorización de A.
+    Cuerpo: {"A": [[...]], "B": [[...]]} (B: una columna por sistema).
+    """
+    datos = request.get_json(force=True)
+    A_raw = datos.get("A", [])
+    B_raw = datos.get("B", [])
+    if not A_raw or not B_raw:
+        return jsonify({"ok": False, "error": "Faltan la matriz A o los lados derechos B."}), 400
+    motor, error = _leer_motor(datos)
+    if error:
+        return error
     try:
-        matriz_num = []
-        for fila in tabla:
-            fila_vals = []
-            for val in fila:
-                expr = str(val).strip()
-                if expr == "":
-                    raise ValueError("Hay celdas vacías en la matriz.")
-                fila_vals.append(evaluador.evaluar(expr))
-            matriz_num.append(fila_vals)
+        A = _evaluar_celdas(A_raw)
+        B = _evaluar_celdas(B_raw)
     except Exception as e:
         return jsonify({"ok": False, "error": f"Error al evaluar expresiones: {e}"}), 400
+    try:
+        res = gauss_jordan_solve_multi(A, B, engine=motor or "fracciones")
+    except ValueError as e:
+        return jsonify({"ok": False, "error": str(e)}), 400
+    for col in res["columns"]:
+        col["solucion"] = _lineas_a_solucion(col["lines"])
+    return jsonify({"ok": True, **res})
 
-    matriz = MatrizAumentada(matriz_num)
-    formateador = FormateadorNumeros(modo=modo_precision, decimales=decimales)
-    solver = ResolverGauss(formateador)
-    resultado = solver.resolver(matriz)
 
-    # Añadir líneas x1=..., libres, etc. con Gauss-Jordan (pygauss_ext)
-    A = [fila[:-1] for fila in matriz_num]
-    b = [fila[-1] for fila in matriz_num]
-    gj = gauss_jordan_solve(A, b, keep_steps=False)
-    pivotes_raw = gj.get("pivots", [])
-    pivotes_num = [pivot_to_1based_int(p) for p in pivotes_raw]
-    pivotes_vars = [f"x{i}" for i in pivotes_num]
-
-    # Normaliza estructura
-    if isinstance(resultado.get("final"), dict):
-        resultado["final"]["lineas"] = gj.get("lines", [])
-        resultado["final"]["solucion"] = _lineas_a_solucion(gj.get("lines", []))
-        resultado["final"]["pivotes"] = pivotes_num
-        resultado["final"]["pivotes_vars"] = pivotes_vars
-        libres_idx = gj.get("free_vars", [])
-        resultado["final"]["variables_libres"] = [f"x{i+1}" for i in libres_idx]
-    else:
-        resultado["final"] = {
-            "lineas": gj.get("lines", []),
-            "pivotes": pivotes_num,
-            "pivotes_vars": pivotes_vars,
-            "variables_libres": [f"x{i+1}" for i in gj.get("free_vars", [])],
-            "solucion": _lineas_a_solucion(gj.get("lines", [])),
-        }
-    return jsonify({"ok": True, **resultado})
+@gauss_bp.route("/cache", methods=["GET"])
+def estado_cache():
+    """Contadores de la caché de factorizaciones (aciertos, fallos, desalojos)."""
+    return jsonify({"ok": True, **CACHE.estadisticas()})
+
+
+@gauss_bp.route("/resolver/stream", methods=["POST"])
+def resolver_gauss_jordan_stream():
+    datos = request.get_json(force=True)
+    matriz, error = _leer_matriz(datos)
+    if error:
+        return error
+    pivoteo, error = _leer_pivoteo(datos)
+    if error:
+        return error
+    _, error = _leer_motor(datos)
+    if error:
+        return error
+    formateador = FormateadorNumeros(
+        modo=datos.get("modo_precision", "fraccion"),
+        decimales=int(datos.get("decimales", 6)),
+    )
+    formato_pasos = datos.get("formato_pasos", "completo")
+    decision = _decidir_motor(datos, matriz, formateador, formato_pasos)
+    solver = ResolverGaussJordan(
+        formateador,
+        motor=decision.motor,
+        formato_pasos=formato_pasos,
+        pivoteo=pivoteo,
+    )
+    return _respuesta_stream(solver, matriz, decision)
+
+
+@gauss_bp.route("/resolver_simple/stream", methods=["POST"])
+def resolver_gauss_simple_stream():
+    datos = request.get_json(force=True)
+    matriz, error = _leer_matriz(datos)
+    if error:
+        return error
+    pivoteo, error = _leer_pivoteo(datos)
+    if error:
+        return error
+    _, error = _leer_motor(datos)
+    if error:
+        return error
+    formateador = FormateadorNumeros(
+        modo=datos.get("modo_precision", "fraccion"),
+        decimales=int(datos.get("decimales", 6)),
+    )
+    formato_pasos = datos.get("formato_pasos", "completo")
+    decision = _decidir_motor(datos, matriz, formateador, formato_pasos, reducida=False)
+    solver = ResolverGauss(
+        formateador,
+        motor=decision.motor,
+        formato_pasos=formato_pasos,
+        pivoteo=pivoteo,
+    )
+    return _respuesta_stream(solver, matriz, decision)
+
+
+@gauss_bp.route("/pasos/<sid>", methods=["GET"])
+def pasos_solucion(sid):
+    """Pasos [desde, hasta) de una solución resuelta con pasos="diferidos"."""
+    try:
+        desde = int(request.args.get("desde", 0))
+        hasta = request.args.get("hasta")
+        hasta = int(hasta) if hasta not in (None, "") else None
+    except ValueError:
+        return jsonify({"ok": False, "error": "desde/hasta deben ser enteros."}), 400
+    try:
+        pasos, total = obtener_pasos(sid, desde, hasta)
+    except KeyError:
+        return jsonify({"ok": False, "error": "La solución ya no está disponible; vuelve a resolver el sistema."}), 404
+    except ValueError as e:
+        return jsonify({"ok": False, "error": str(e)}), 400
+    return jsonify({"ok": True, "id": sid, "desde": desde, "total_pasos": total, "pasos": pasos})
 
 
 @gauss_bp.route("/pdf", methods=["POST"])
 def pdf():
     datos = request.get_json(force=True)
-    pasos = datos.get("pasos", [])
+    # Acepta pasos completos o delta (se reconstruye cada matriz intermedia)
+    try:
+        pasos = expandir_pasos(datos.get("pasos", []))
+    except ValueError as e:
+        return jsonify({"ok": False, "error": str(e)}), 400
     final = datos.get("final", {})
     pivotes = final.get("pivotes", [])
     libres = final.get("variables_libres", [])
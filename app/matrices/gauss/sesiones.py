@@ -0,0 +1,124 @@
+# app/matrices/gauss/sesiones.py
+# -*- coding: utf-8 -*-
+"""
+Soluciones guardadas para pedir los pasos por páginas.
+
+Con ``pasos="diferidos"`` la ruta de resolución devuelve solo el resultado
+final, el total de pasos y un identificador. Los pasos se piden después por
+rangos ``[desde, hasta)``:
+
+  - primero se buscan en una caché acotada de rangos ya formateados;
+  - si no están, se reproduce la eliminación (es determinista) a partir de
+    la receta guardada y solo se formatean los pasos del rango.
+
+Ambas cachés viven en el proceso y descartan lo menos usado (LRU).
+"""
+from collections import OrderedDict
+from hashlib import sha1
+from threading import Lock
+
+from .algebra import ResolverGaussJordan, ResolverGauss, FormateadorNumeros
+
+RESOLVEDORES = {
+    "gauss_jordan": ResolverGaussJordan,
+    "gauss": ResolverGauss,
+}
+
+MAX_RECETAS = 256     # soluciones que se pueden seguir paginando
+MAX_RANGOS = 64       # páginas de pasos ya formateadas
+MAX_POR_PAGINA = 200  # pasos como máximo en una sola petición
+
+
+class CacheLRU:
+    """Diccionario acotado: al pasar de ``capacidad`` sale lo menos usado."""
+
+    def __init__(self, capacidad):
+        self.capacidad = capacidad
+        self._datos = OrderedDict()
+        self._lock = Lock()
+
+    def obtener(self, clave):
+        with self._lock:
+            if clave not in self._datos:
+                return None
+            self._datos.move_to_end(clave)
+            return self._datos[clave]
+
+    def guardar(self, clave, valor):
+        with self._lock:
+            self._datos[clave] = valor
+            self._datos.move_to_end(clave)
+            while len(self._datos) > self.capacidad:
+                self._datos.popitem(last=False)
+
+    def __len__(self):
+        return len(self._datos)
+
+
+_recetas = CacheLRU(MAX_RECETAS)
+_rangos = CacheLRU(MAX_RANGOS)
+
+
+def _crear_resolvedor(receta):
+    formateador = FormateadorNumeros(
+        modo=receta["modo_precision"], decimales=receta["decimales"]
+    )
+    return RESOLVEDORES[receta["metodo"]](
+        formateador, motor=receta["motor"], pivoteo=receta.get("pivoteo")
+    )
+
+
+def guardar_solucion(
+    metodo, matriz, modo_precision, decimales, motor, total_pasos, pivoteo=None
+):
+    """
+    Registra la receta de una solución y devuelve su identificador.
+
+    El identificador depende solo del contenido, así que el mismo sistema
+    con las mismas opciones reutiliza la entrada (y sus páginas en caché).
+    """
+    clave = repr(
+        (metodo, motor, pivoteo, modo_precision, int(decimales), [[str(v) for v in f] for f in matriz.a])
+    )
+    sid = sha1(clave.encode("utf-8")).hexdigest()[:16]
+    _recetas.guardar(
+        sid,
+        {
+            "metodo": metodo,
+            "matriz": matriz,
+            "modo_precision": modo_precision,
+            "decimales": int(decimales),
+            "motor": motor,
+            "pivoteo": pivoteo,
+            "total_pasos": total_pasos,
+        },
+    )
+    return sid
+
+
+def obtener_pasos(sid, desde, hasta=None):
+    """
+    Pasos ``[desde, hasta)`` (matriz completa en cada uno) de la solución
+    ``sid``. Devuelve ``(pasos, total)``; lanza KeyError si la solución ya
+    no está guardada y ValueError si el rango no es válido.
+    """
+    receta = _recetas.obtener(sid)
+    if receta is None:
+        raise KeyError(sid)
+
+    total = receta["total_pasos"]
+    if hasta is None:
+        hasta = desde + 20
+    if desde < 0 or hasta < desde:
+        raise ValueError("Rango de pasos inválido.")
+    if hasta - desde > MAX_POR_PAGINA:
+        raise ValueError(f"Se pueden pedir como máximo {MAX_POR_PAGINA} pasos a la vez.")
+    hasta = min(hasta, total)
+    desde = min(desde, hasta)
+
+    pasos = _rangos.obtener((sid, desde, hasta))
+    if pasos is None:
+        solver = _crear_resolvedor(receta)
+        pasos = solver.pasos_en_rango(receta["matriz"], desde, hasta)
+        _rangos.guardar((sid, desde, hasta), pasos)
+    return pasos, total
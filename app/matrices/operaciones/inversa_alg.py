@@ -2,6 +2,7 @@
 from __future__ import annotations
 from fractions import Fraction
 from typing import List, Dict, Any, Tuple
+from app.matrices.gauss.racional import MatrizRacional
 
 def to_fraction(x) -> Fraction:
     if isinstance(x, Fraction):
@@ -83,51 +84,63 @@ def inverse_2x2(A: List[List[Any]]) -> Dict[str, Any]:
         "pasos": pasos
     }
 def gauss_jordan_inverse(A: List[List[Any]]) -> Dict[str, Any]:
-    """Gauss-Jordan sobre [A | I] con pasos y snapshots."""
+    """Gauss-Jordan sobre [A | I] con pasos y snapshots.
+
+    [A | I] se guarda como MatrizRacional (enteros por fila + denominador) y
+    en cada paso solo se vuelven a formatear las filas que cambiaron.
+    A puede ser una lista de filas o una MatrizRacional.
+    """
     n = len(A)
-    Ab = [[to_fraction(A[i][j]) for j in range(n)] + [Fraction(1 if i==j else 0) for j in range(n)] for i in range(n)]
-    steps = [{"op":"Inicio","matriz_izq": format_matrix([row[:n] for row in Ab]), "matriz_der": format_matrix([row[n:] for row in Ab])}]
+    filas = [A[i] for i in range(n)]
+    Ab = MatrizRacional([[to_fraction(filas[i][j]) for j in range(n)] + [Fraction(1 if i==j else 0) for j in range(n)] for i in range(n)])
+    izq, der = [None] * n, [None] * n
+
+    def refrescar(r):
+        izq[r] = [fraction_fmt(x) for x in Ab.fila(r, 0, n)]
+        der[r] = [fraction_fmt(x) for x in Ab.fila(r, n)]
+
+    for r in range(n):
+        refrescar(r)
+
+    def paso(op):
+        return {"op": op, "matriz_izq": izq[:], "matriz_der": der[:]}
+
+    steps = [paso("Inicio")]
     row = 0
     for col in range(n):
         # buscar pivote
         pivot = None
         for r in range(row, n):
-            if Ab[r][col] != 0:
+            if not Ab.es_cero(r, col):
                 pivot = r; break
         if pivot is None:
             return {"ok": False, "motivo": f"No hay pivote en columna {col+1} → matriz no invertible.", "pasos": steps}
         if pivot != row:
-            Ab[row], Ab[pivot] = Ab[pivot], Ab[row]
-            steps.append({"op": f"R{row+1} ↔ R{pivot+1}",
-                          "matriz_izq": format_matrix([r[:n] for r in Ab]),
-                          "matriz_der": format_matrix([r[n:] for r in Ab])})
-        piv = Ab[row][col]
+            Ab.intercambiar(row, pivot)
+            izq[row], izq[pivot] = izq[pivot], izq[row]
+            der[row], der[pivot] = der[pivot], der[row]
+            steps.append(paso(f"R{row+1} ↔ R{pivot+1}"))
+        piv = Ab.valor(row, col)
         # escalar fila para que pivote sea 1
         if piv != 1:
-            for c in range(2*n):
-                Ab[row][c] /= piv
-            steps.append({"op": f"R{row+1} := R{row+1} / {fraction_fmt(piv)}",
-                          "matriz_izq": format_matrix([r[:n] for r in Ab]),
-                          "matriz_der": format_matrix([r[n:] for r in Ab])})
+            Ab.dividir_fila(row, piv)
+            refrescar(row)
+            steps.append(paso(f"R{row+1} := R{row+1} / {fraction_fmt(piv)}"))
         # eliminar en otras filas
         for r in range(n):
             if r == row: continue
-            if Ab[r][col] != 0:
-                factor = Ab[r][col]
-                for c in range(2*n):
-                    Ab[r][c] -= factor * Ab[row][c]
-                steps.append({"op": f"R{r+1} := R{r+1} - ({fraction_fmt(factor)})·R{row+1}",
-                              "matriz_izq": format_matrix([rr[:n] for rr in Ab]),
-                              "matriz_der": format_matrix([rr[n:] for rr in Ab])})
+            if not Ab.es_cero(r, col):
+                factor = Ab.valor(r, col)
+                Ab.restar_multiplo(r, row, factor)
+                refrescar(r)
+                steps.append(paso(f"R{r+1} := R{r+1} - ({fraction_fmt(factor)})·R{row+1}"))
         row += 1
 
     # Comprobar que izquierda es identidad
-    izq = [row[:n] for row in Ab]
-    der = [row[n:] for row in Ab]
     # si no es identidad exacta (por fracciones lo será), fallamos
     for i in range(n):
         for j in range(n):
-            val = izq[i][j]
-            if val != (Fraction(1) if i==j else Fraction(0)):
+            if Ab.valor(i, j) != (Fraction(1) if i==j else Fraction(0)):
                 return {"ok": False, "motivo":"No se pudo reducir A a I_n → no invertible.", "pasos": steps}
+    der = [Ab.fila(r, n) for r in range(n)]
     return {"ok": True, "metodo":"gauss_jordan", "inversa": format_matrix(der), "pasos": steps}
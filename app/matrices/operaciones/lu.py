@@ -0,0 +1,309 @@
+# app/matrices/operaciones/lu.py
+# -*- coding: utf-8 -*-
+"""
+Factorización PA = LU (exacta con Fracciones o en flotante) con registro de
+pasos, y una caché pequeña para que determinante, inversa y Cramer salgan de
+una misma factorización en lugar de eliminar otra vez.
+
+- exacta: U se guarda como MatrizRacional y el pivote es el primer elemento
+  no nulo de la columna (el mismo recorrido que la reducción por filas del
+  determinante, así que sus pasos salen de este registro);
+- flotante: pivoteo parcial (mayor |valor|) con la tolerancia es_casi_cero.
+
+Con A singular la factorización existe igual (U escalonada, con ceros en la
+diagonal): el determinante es 0 y resolver/inversa no se aplican.
+"""
+from __future__ import annotations
+from collections import OrderedDict
+from fractions import Fraction
+from threading import Lock
+from typing import List, Dict, Any, Optional
+
+from app.matrices.gauss.algebra import es_casi_cero, a_fraccion_si_aplica
+from app.matrices.gauss.racional import MatrizRacional
+
+# Factorizaciones que se conservan (las más recientes)
+MAX_ENTRADAS_CACHE = 32
+
+INICIO = "inicio"
+INTERCAMBIO = "intercambio"
+ELIMINACION = "eliminacion"
+
+_cache: "OrderedDict[Any, FactorizacionPLU]" = OrderedDict()
+_cache_candado = Lock()
+
+
+class _MatrizFlotante:
+    """Las operaciones de MatrizRacional que usa la factorización, con float."""
+
+    def __init__(self, datos):
+        self.filas = [[float(a_fraccion_si_aplica(v)) for v in fila] for fila in datos]
+
+    def valor(self, r, c):
+        return self.filas[r][c]
+
+    def es_cero(self, r, c):
+        return es_casi_cero(self.filas[r][c])
+
+    def fila(self, r, desde=0, hasta=None):
+        return self.filas[r][desde:hasta]
+
+    def intercambiar(self, i, j):
+        self.filas[i], self.filas[j] = self.filas[j], self.filas[i]
+
+    def restar_multiplo(self, r, f, k, desde=0):
+        fr, ff = self.filas[r], self.filas[f]
+        for j in range(desde, len(fr)):
+            fr[j] -= k * ff[j]
+        fr[desde] = 0.0     # la entrada eliminada es cero, sin residuo
+
+
+class FactorizacionPLU:
+    """
+    PA = LU de una matriz n×n. ``perm[i]`` es la fila de A que quedó en la
+    posición i (PA = A[perm]); L es unitaria triangular inferior y U
+    escalonada. ``registro`` (si se pidieron pasos) guarda cada operación con
+    la fila de U que cambió; las matrices de cada paso se reconstruyen al
+    formatear, reproduciendo las operaciones.
+    """
+
+    def __init__(self, n, perm, L, U, signo, pivotes, flotante, registro=None):
+        self.n = n
+        self.perm = perm
+        self.L = L
+        self.U = U
+        self.signo = signo
+        self.pivotes = pivotes
+        self.flotante = flotante
+        self.registro = registro
+
+    @property
+    def rango(self):
+        return len(self.pivotes)
+
+    def es_invertible(self):
+        return self.rango == self.n
+
+    def determinante(self):
+        det = Fraction(self.signo) if not self.flotante else float(self.signo)
+        for i in range(self.n):
+            det *= self.U[i][i]
+        return det
+
+    def matriz_p(self):
+        uno, cero = (1.0, 0.0) if self.flotante else (Fraction(1), Fraction(0))
+        return [[uno if j == self.perm[i] else cero for j in range(self.n)] for i in range(self.n)]
+
+    def _convertir(self, v):
+        v = a_fraccion_si_aplica(v)
+        return float(v) if self.flotante else v
+
+    def resolver(self, b):
+        """x con A·x = b: L·y = P·b (hacia adelante) y U·x = y (hacia atrás)."""
+        if not self.es_invertible():
+            raise ValueError("La matriz es singular: A·x = b no tiene solución única.")
+        n, L, U = self.n, self.L, self.U
+        y = [self._convertir(b[self.perm[i]]) for i in range(n)]
+        for i in range(n):
+            for j in range(i):
+                if L[i][j]:
+                    y[i] -= L[i][j] * y[j]
+        x = y
+        for i in range(n - 1, -1, -1):
+            for j in range(i + 1, n):
+                if U[i][j]:
+                    x[i] -= U[i][j] * x[j]
+            x[i] /= U[i][i]
+        return x
+
+    def inversa(self):
+        """A⁻¹ columna a columna (A·X = I), o None si A es singular."""
+        if not self.es_invertible():
+            return None
+        uno, cero = (1.0, 0.0) if self.flotante else (Fraction(1), Fraction(0))
+        columnas = [
+            self.resolver([uno if i == j else cero for i in range(self.n)])
+            for j in range(self.n)
+        ]
+        return [[columnas[j][i] for j in range(self.n)] for i in range(self.n)]
+
+    def cramer(self, b):
+        """
+        (det A, [det Aᵢ(b)], x) sin eliminar otra vez: Aᵢ(b) = A + (b - aᵢ)eᵢᵀ,
+        así que por el lema del determinante det Aᵢ(b) = det A · (A⁻¹b)ᵢ.
+        """
+        det = self.determinante()
+        x = self.resolver(b)
+        return det, [det * xi for xi in x], x
+
+    # ----- pasos -----
+
+    def _recorrer(self, fmt):
+        """
+        Reproduce el registro con las filas formateadas: produce (operación,
+        U, L) después de cada una. Solo se formatea la fila que cambió.
+        """
+        cero = fmt(0.0 if self.flotante else Fraction(0))
+        U, L = [], [[cero] * self.n for _ in range(self.n)]
+        for r in self.registro:
+            if r["tipo"] == INICIO:
+                U = [[fmt(v) for v in fila] for fila in r["U"]]
+            elif r["tipo"] == INTERCAMBIO:
+                i, j = r["fila"], r["otra"]
+                U[i], U[j] = U[j], U[i]
+                L[i], L[j] = L[j], L[i]
+            else:
+                U[r["fila"]] = [fmt(v) for v in r["nueva"]]
+                L[r["fila"]] = L[r["fila"]][:]
+                L[r["fila"]][r["otra"]] = fmt(r["factor"])
+            yield r, U[:], L
+
+    def _l_completa(self, L, fmt):
+        """L formateada con la diagonal unitaria."""
+        uno = fmt(1.0 if self.flotante else Fraction(1))
+        return [fila[:i] + [uno] + fila[i + 1:] for i, fila in enumerate(L)]
+
+    def pasos(self, fmt) -> List[Dict[str, Any]]:
+        """Pasos de la factorización: U a la izquierda y L a la derecha."""
+        if self.registro is None:
+            return []
+        pasos = []
+        for r, U, L in self._recorrer(fmt):
+            if r["tipo"] == INICIO:
+                op = "Inicio: U = A, L = I, P = I."
+            elif r["tipo"] == INTERCAMBIO:
+                op = (f"R{r['fila']+1} ↔ R{r['otra']+1} en U, en P y en las "
+                      "columnas ya calculadas de L.")
+            else:
+                f = fmt(r["factor"])
+                op = (f"R{r['fila']+1} := R{r['fila']+1} - ({f})·R{r['otra']+1} "
+                      f"en U  ⇒  l{r['fila']+1},{r['otra']+1} = {f}")
+            pasos.append({"op": op, "matriz_izq": U, "matriz_der": self._l_completa(L, fmt)})
+        return pasos
+
+    def pasos_determinante(self, fmt) -> List[Dict[str, Any]]:
+        """
+        Los mismos pasos vistos como reducción por filas para det(A): U a la
+        izquierda y el factor acumulado por los intercambios a la derecha.
+        """
+        if self.registro is None:
+            return []
+        pasos = []
+        U = []
+        for r, U, _ in self._recorrer(fmt):
+            factor = fmt(Fraction(r["signo"]))
+            if r["tipo"] == INICIO:
+                pasos.append({"op": "Inicio de reducción por filas.",
+                              "matriz_izq": U,
+                              "matriz_der": [["det(A) = 1"]]})
+            elif r["tipo"] == INTERCAMBIO:
+                pasos.append({"op": f"Fila {r['otra']+1} ⇄ Fila {r['fila']+1}. det(A) ≔ -det(A). Factor acumulado: {factor}",
+                              "matriz_izq": U,
+                              "matriz_der": [["Intercambio", f"Factor: {factor}"]]})
+            else:
+                pasos.append({"op": f"Fila {r['fila']+1} ← Fila {r['fila']+1} - ({fmt(r['factor'])})·Fila {r['otra']+1}. det(A) NO cambia.",
+                              "matriz_izq": U,
+                              "matriz_der": [["Reemplazo", f"Factor: {factor}"]]})
+        det = self.determinante()
+        factor = fmt(Fraction(self.signo))
+        diag_str = " * ".join(fmt(self.U[i][i]) for i in range(self.n))
+        pasos.append({
+            "op": f"Matriz en forma escalonada. det(A) = ({factor}) · Producto(Diagonal)",
+            "matriz_izq": U[:],
+            "matriz_der": [[f"{factor} · ({diag_str}) = {fmt(det)}"]],
+            "resultado": fmt(det),
+        })
+        return pasos
+
+
+def factorizar_plu(A: List[List[Any]], flotante: bool = False,
+                   con_pasos: bool = False) -> FactorizacionPLU:
+    """PA = LU de la matriz cuadrada A (lista de filas). Ver el módulo."""
+    n = len(A)
+    if n == 0:
+        raise ValueError("La matriz está vacía.")
+    if any(len(fila) != n for fila in A):
+        raise ValueError("La matriz debe ser cuadrada.")
+    if flotante:
+        M = _MatrizFlotante(A)
+        cero = 0.0
+    else:
+        M = MatrizRacional([[a_fraccion_si_aplica(v) for v in fila] for fila in A])
+        cero = Fraction(0)
+    L = [[cero] * n for _ in range(n)]
+    perm = list(range(n))
+    signo = 1
+    pivotes: List[int] = []
+
+    registro: Optional[List[Dict[str, Any]]] = [] if con_pasos else None
+
+    def anotar(tipo, **datos):
+        datos.update(tipo=tipo, signo=signo)
+        registro.append(datos)
+
+    if con_pasos:
+        anotar(INICIO, U=[M.fila(r) for r in range(n)])
+
+    row = 0
+    for col in range(n):
+        if row >= n:
+            break
+        if flotante:
+            pivot = max(range(row, n), key=lambda r: abs(M.valor(r, col)))
+        else:
+            pivot = next((r for r in range(row, n) if not M.es_cero(r, col)), row)
+        if M.es_cero(pivot, col):
+            continue        # columna sin pivote: A es singular
+
+        if pivot != row:
+            M.intercambiar(row, pivot)
+            L[row], L[pivot] = L[pivot], L[row]
+            perm[row], perm[pivot] = perm[pivot], perm[row]
+            signo = -signo
+            if con_pasos:
+                anotar(INTERCAMBIO, fila=pivot, otra=row)
+
+        piv_val = M.valor(row, col)
+        for r in range(row + 1, n):
+            if M.es_cero(r, col):
+                continue
+            factor = M.valor(r, col) / piv_val
+            M.restar_multiplo(r, row, factor, desde=col)
+            L[r][row] = factor
+            if con_pasos:
+                anotar(ELIMINACION, fila=r, otra=row, factor=factor, nueva=M.fila(r))
+
+        pivotes.append(col)
+        row += 1
+
+    U = [M.fila(r) for r in range(n)]
+    return FactorizacionPLU(n, perm, L, U, signo, pivotes, flotante, registro)
+
+
+def obtener_plu(A: List[List[Any]], flotante: bool = False,
+                con_pasos: bool = False) -> FactorizacionPLU:
+    """
+    Como factorizar_plu, reutilizando la factorización de la misma matriz si
+    está en la caché (una con pasos sirve también cuando no se piden).
+    """
+    if flotante:
+        clave = (True, tuple(tuple(float(a_fraccion_si_aplica(v)) for v in fila) for fila in A))
+    else:
+        clave = (False, tuple(tuple(a_fraccion_si_aplica(v) for v in fila) for fila in A))
+    with _cache_candado:
+        fact = _cache.get(clave)
+        if fact is not None and (fact.registro is not None or not con_pasos):
+            _cache.move_to_end(clave)
+            return fact
+    fact = factorizar_plu(A, flotante=flotante, con_pasos=con_pasos)
+    with _cache_candado:
+        _cache[clave] = fact
+        _cache.move_to_end(clave)
+        while len(_cache) > MAX_ENTRADAS_CACHE:
+            _cache.popitem(last=False)
+    return fact
+
+
+def limpiar_cache():
+    with _cache_candado:
+        _cache.clear()
@@ -1,5 +1,7 @@
 from fractions import Fraction
-import math, ast
+
+from app.expresiones import compilar
+from app.matrices.gauss.algebra import evaluar_tabla
 
 def es_casi_cero(x, tol=1e-12):
     try: return abs(float(x)) < tol
@@ -36,65 +38,17 @@ def a_fraccion_si_aplica(x):
         except: return float(x)
     return x
 
-class EvaluadorSeguro:
-    nombres={'pi':math.pi,'e':math.e,'sin':math.sin,'cos':math.cos,'tan':math.tan,'sqrt':math.sqrt,'raiz':math.sqrt,'frac':lambda a,b:Fraction(a,b)}
-    ops_bin=(ast.Add,ast.Sub,ast.Mult,ast.Div,ast.Pow); ops_uni=(ast.UAdd,ast.USub)
-    def evaluar(self,expr:str):
-        tree=ast.parse(expr,mode='eval'); return self._eval(tree.body)
-    def _eval(self,node):
-        if isinstance(node,ast.Num): return a_fraccion_si_aplica(node.n)
-        if isinstance(node,ast.Constant):
-            v=node.value
-            if isinstance(v,(int,float)): return a_fraccion_si_aplica(v)
-            raise ValueError("Constante no permitida")
-        if isinstance(node,ast.BinOp) and isinstance(node.op,self.ops_bin):
-            a=self._eval(node.left); b=self._eval(node.right); return self._binop(a,b,node.op)
-        if isinstance(node,ast.UnaryOp) and isinstance(node.op,self.ops_uni):
-            v=self._eval(node.operand); return v if isinstance(node.op,ast.UAdd) else -v
-        if isinstance(node,ast.Name):
-            if node.id in self.nombres: return self.nombres[node.id]
-            raise ValueError(f"Nombre no permitido: {node.id}")
-        if isinstance(node,ast.Call):
-            if isinstance(node.func,ast.Name) and node.func.id in self.nombres:
-                fn=self.nombres[node.func.id]; args=[self._eval(a) for a in node.args]; return fn(*args)
-            raise ValueError("Función no permitida")
-        raise ValueError("Expresión no permitida")
-    def _binop(self,a,b,op):
-        if isinstance(a,Fraction) and isinstance(b,Fraction):
-            if isinstance(op,ast.Add): return a+b
-            if isinstance(op,ast.Sub): return a-b
-            if isinstance(op,ast.Mult): return a*b
-            if isinstance(op,ast.Div):
-                if b==0: raise ZeroDivisionError("División por cero")
-                return a/b
-            if isinstance(op,ast.Pow):
-                if b.denominator==1 and b.numerator>=0: return a**b.numerator
-                return float(a)**float(b)
-        else:
-            af=float(a) if isinstance(a,Fraction) else a; bf=float(b) if isinstance(b,Fraction) else b
-            if isinstance(op,ast.Add): return af+bf
-            if isinstance(op,ast.Sub): return af-bf
-            if isinstance(op,ast.Mult): return af*bf
-            if isinstance(op,ast.Div):
-                if bf==0: raise ZeroDivisionError("División por cero")
-                return af/bf
-            if isinstance(op,ast.Pow): return af**bf
-        raise ValueError("Operación no soportada")
+def evaluar_celda(expr: str):
+    """
+    Valor de una celda escrita con sintaxis de Python (1e-3, 2**-1, frac(1,3)...)
+    con el motor de expresiones compartido (Fraction cuando es exacto).
+    """
+    return compilar(expr, bonita=False).valor()
 
 def evaluar_matriz_str(matriz_str):
     """Evalúa los valores de una matriz desde strings a números o fracciones."""
-    evaluador = EvaluadorSeguro()
     try:
-        matriz_evaluada = []
-        for fila in matriz_str:
-            fila_evaluada = []
-            for val_str in fila:
-                if val_str.strip() == "":
-                    raise ValueError("Hay celdas vacías en la matriz.")
-                val = evaluador.evaluar(val_str)
-                fila_evaluada.append(val)
-            matriz_evaluada.append(fila_evaluada)
-        return matriz_evaluada
+        return evaluar_tabla(matriz_str, evaluar_celda)
     except Exception as e:
         raise ValueError(f"Error al evaluar expresiones: {e}")
 
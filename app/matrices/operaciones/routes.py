@@ -17,6 +17,7 @@ from .inversa_alg import (
 )
 
 from .determinantes import calculate_determinant, cramer_solve
+from .lu import obtener_plu
 
 # BLUEPRINT
 
@@ -262,6 +263,21 @@ def resolver_inversa():
                 400,
             )
 
+        if datos.get("metodo") == "lu":
+            # A⁻¹ columna a columna con la factorización PA = LU (en caché,
+            # compartida con determinante y Cramer)
+            form = FormateadorNumeros(modo=modo, decimales=dec)
+            fact = obtener_plu(A, con_pasos=True)
+            inv = fact.inversa()
+            return jsonify(
+                {
+                    "ok": True,
+                    "mensaje": None if inv else "det(A) = 0 → A no es invertible.",
+                    "inversa": [[form.fmt(x) for x in fila] for fila in inv] if inv else None,
+                    "pasos": fact.pasos(form.fmt),
+                }
+            )
+
         if n == 2:
             res = _inverse_2x2(A)
             if not res.get("ok"):
@@ -304,6 +320,91 @@ def resolver_inversa():
         )
 
 
+# RUTAS DE FACTORIZACIÓN LU
+
+
+@operaciones_bp.route("/lu", methods=["GET"])
+def vista_lu():
+    return render_template("lu.html", title="Factorización LU")
+
+
+@operaciones_bp.route("/lu/resolver", methods=["POST"])
+def resolver_lu():
+    """
+    PA = LU de una matriz n×n, exacta (Fracciones) o en flotante
+    ("aritmetica": "flotante"), con pasos. Si llega "vector_b_str" se
+    resuelve también A·x = b con las mismas L y U.
+    """
+    datos = request.get_json(force=True)
+    matriz_str = datos.get("matriz_str")
+    vector_b_str = datos.get("vector_b_str") or None
+    flotante = datos.get("aritmetica") == "flotante"
+    form = FormateadorNumeros(
+        modo=datos.get("modo_precision", "decimal" if flotante else "fraccion"),
+        decimales=int(datos.get("decimales", 6)),
+    )
+
+    try:
+        A = evaluar_matriz_str(matriz_str)
+        n = len(A)
+        if n == 0 or any(len(fila) != n for fila in A):
+            return (
+                jsonify(
+                    {
+                        "ok": False,
+                        "error": "La matriz debe ser cuadrada (n×n) y no vacía.",
+                    }
+                ),
+                400,
+            )
+        fact = obtener_plu(A, flotante=flotante, con_pasos=True)
+
+        def fmt_matriz(M):
+            return [[form.fmt(x) for x in fila] for fila in M]
+
+        uno = 1.0 if flotante else 1
+        L = [
+            [uno if i == j else fact.L[i][j] for j in range(n)]
+            for i in range(n)
+        ]
+        resultado = {
+            "ok": True,
+            "P": fmt_matriz(fact.matriz_p()),
+            "L": fmt_matriz(L),
+            "U": fmt_matriz(fact.U),
+            "permutacion": [p + 1 for p in fact.perm],
+            "det": form.fmt(fact.determinante()),
+            "rango": fact.rango,
+            "pasos": fact.pasos(form.fmt),
+        }
+        if vector_b_str:
+            b = evaluar_matriz_str([vector_b_str])[0]
+            if len(b) != n:
+                return jsonify({"ok": False, "error": "El vector b debe tener n entradas."}), 400
+            if fact.es_invertible():
+                x = fact.resolver(b)
+                resultado["solucion"] = {f"x{i+1}": form.fmt(v) for i, v in enumerate(x)}
+            else:
+                resultado["mensaje"] = "A es singular: A·x = b no tiene solución única."
+        return jsonify(resultado)
+
+    except ValueError as e:
+        return jsonify({"ok": False, "error": str(e)}), 400
+    except Exception:
+        import traceback
+
+        traceback.print_exc()
+        return (
+            jsonify(
+                {
+                    "ok": False,
+                    "error": "Ocurrió un error inesperado al factorizar la matriz.",
+                }
+            ),
+            500,
+        )
+
+
 # RUTAS DE DETERMINANTE
 
 
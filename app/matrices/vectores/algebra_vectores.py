@@ -14,9 +14,10 @@ class AnalizadorVectores:
     y otras operaciones básicas (ampliables).
     """
 
-    def __init__(self, modo='fraccion', decimales=6):
+    def __init__(self, modo='fraccion', decimales=6, motor='fracciones'):
         self.formateador = FormateadorNumeros(modo, decimales)
-        self.solver = ResolverGaussJordan(self.formateador)
+        # motor='dispersa' para muchos vectores con pocas entradas no nulas
+        self.solver = ResolverGaussJordan(self.formateador, motor=motor)
         self.evaluador = EvaluadorSeguro()
 
     def verificar_independencia(self, vectores):
@@ -29,7 +30,7 @@ class AnalizadorVectores:
             raise ValueError("Todos los vectores deben tener la misma dimensión.")
 
         # Evalúa entradas numéricamente
-        V = [[self.evaluador.evaluar(x) for x in v] for v in vectores]  # n_vectores x dim
+        V = self.evaluador.evaluar_tabla(vectores)  # n_vectores x dim
 
         n = len(V)        # número de vectores
         d = len(V[0])     # dimensión
@@ -43,16 +44,45 @@ class AnalizadorVectores:
         res = self.solver.resolver(matriz_aum)
 
         pivotes = res["final"]["pivotes"]  # columnas pivote
-        independiente = (len(pivotes) == n)
+        # Rango y núcleo exactos de la misma RREF (sin reeliminar)
+        espacio = self.solver.espacio_solucion()
+        independiente = (espacio.rank == n)
 
-        return {
+        mensaje = "Los vectores son linealmente independientes."
+        relacion = None
+        if not independiente:
+            # Un vector del núcleo da una combinación nula: c1·v1 + ... = 0
+            relacion = [self.formateador.fmt(c) for c in espacio.null_space[0]]
+            mensaje = (
+                "Los vectores son linealmente dependientes: "
+                f"{self._texto_relacion(espacio.null_space[0])} = 0."
+            )
+
+        resultado = {
             "independiente": independiente,
-            "mensaje": (
-                "Los vectores son linealmente independientes."
-                if independiente else
-                "Los vectores son linealmente dependientes."
-            ),
+            "mensaje": mensaje,
             "pasos": res["pasos"],
             "pivotes": pivotes,
-            "n_vectores": n
+            "n_vectores": n,
+            "rango": espacio.rank,
+            "relacion": relacion,
         }
+        if "dispersion" in res["final"]:
+            resultado["dispersion"] = res["final"]["dispersion"]
+        return resultado
+
+    def _texto_relacion(self, coeficientes):
+        """[2, -1, 0, 1] → "2·v1 - v2 + v4"."""
+        partes = []
+        for i, c in enumerate(coeficientes):
+            if c == 0:
+                continue
+            nombre = f"v{i+1}"
+            if c == 1:
+                termino = nombre
+            elif c == -1:
+                termino = f"-{nombre}"
+            else:
+                termino = f"{self.formateador.fmt(c)}·{nombre}"
+            partes.append(termino)
+        return " + ".join(partes).replace("+ -", "- ")
@@ -15,15 +15,20 @@ def verificar_independencia():
     if not vectores:
         return jsonify({"ok": False, "error": "No se recibieron vectores."}), 400
     try:
-        analizador = AnalizadorVectores()
+        analizador = AnalizadorVectores(motor=datos.get("motor", "fracciones"))
         resultado = analizador.verificar_independencia(vectores)
         # Incluimos pasos y pivotes en la respuesta
-        return jsonify({
+        respuesta = {
             "ok": True,
             "independiente": resultado["independiente"],
             "mensaje": resultado["mensaje"],
             "pasos": resultado["pasos"],
-            "pivotes": resultado["pivotes"]
-        })
+            "pivotes": resultado["pivotes"],
+            "rango": resultado["rango"],
+            "relacion": resultado["relacion"],
+        }
+        if "dispersion" in resultado:
+            respuesta["dispersion"] = resultado["dispersion"]
+        return jsonify(respuesta)
     except Exception as e:
         return jsonify({"ok": False, "error": str(e)}), 400
@@ -1,28 +1,4 @@
-import math
-
-def evaluar_funcion(expr, x):
-    """
-    Evalúa f(x) a partir de una cadena como:
-    'x**4 - 5*x**3 + 0.5*x**2 - 11*x + 10'
-    """
-    permitidos = {
-        "x": x,
-        "y": x,              
-        "sin": math.sin,
-        "cos": math.cos,
-        "tan": math.tan,
-        "exp": math.exp,
-        "log": math.log,     
-        "log10": math.log10,
-        "sqrt": math.sqrt,
-        "pi": math.pi,
-        "e": math.e,
-        "abs": abs,
-        "asin": math.asin,
-        "acos": math.acos,
-        "atan": math.atan,
-    }
-    return eval(expr, {"__builtins__": {}}, permitidos)
+from .funcion import compilar_funcion
 
 
 def metodo_biseccion(expr, a_inicial, b_inicial, es=0.0001, max_iter=50):
@@ -34,6 +10,7 @@ def metodo_biseccion(expr, a_inicial, b_inicial, es=0.0001, max_iter=50):
         raiz: último c calculado
         n_iter: número de iteraciones realizadas
     """
+    f = compilar_funcion(expr).flotante()
     resultados = []
     raiz = None
 
@@ -41,11 +18,11 @@ def metodo_biseccion(expr, a_inicial, b_inicial, es=0.0001, max_iter=50):
     b = b_inicial
 
     for i in range(1, max_iter + 1):
-        fa = evaluar_funcion(expr, a)
-        fb = evaluar_funcion(expr, b)
+        fa = f(a)
+        fb = f(b)
 
         c = (a + b) / 2.0
-        fc = evaluar_funcion(expr, c)
+        fc = f(c)
 
         ea = abs(fc)
 
@@ -0,0 +1,346 @@
+# app/metodos_numericos/iterativos.py
+# -*- coding: utf-8 -*-
+"""
+Métodos iterativos para sistemas lineales Ax = b: Jacobi, Gauss-Seidel,
+SOR y Gradiente Conjugado.
+
+A se guarda en formato CSR (valores, columnas e inicio de cada fila) con
+NumPy, así que A·x cuesta O(no nulos) y se hace en una sola operación
+vectorizada: un sistema disperso de 1000×1000 diagonalmente dominante se
+resuelve en milisegundos (ver ``benchmarks/bench_iterativos.py``).
+
+  - Jacobi y Gradiente Conjugado son totalmente vectoriales (un producto
+    A·x por iteración).
+  - Gauss-Seidel y SOR usan los valores ya actualizados de la misma
+    iteración, así que recorren las filas en orden; cada fila es un
+    producto escalar sobre sus no nulos.
+
+Criterio de paro, como en los métodos de raíces: error relativo
+aproximado ea = ||x_k - x_{k-1}||∞ / ||x_k||∞ < es. Cada iteración guarda
+también el residuo ||b - A·x_k||∞ para la tabla.
+"""
+from fractions import Fraction
+
+try:
+    import numpy as np
+except ImportError:  # sin NumPy la página muestra un error en lugar de la tabla
+    np = None
+
+HAY_NUMPY = np is not None
+
+METODOS = ("jacobi", "gauss_seidel", "sor", "gradiente_conjugado")
+
+NOMBRES = {
+    "jacobi": "Jacobi",
+    "gauss_seidel": "Gauss-Seidel",
+    "sor": "SOR (sobrerrelajación sucesiva)",
+    "gradiente_conjugado": "Gradiente Conjugado",
+}
+
+# Componentes de x que se guardan por iteración en la tabla
+MAX_COMPONENTES = 8
+# Hasta este tamaño se prueba Cholesky (denso) para detectar SPD
+LIMITE_CHOLESKY = 2000
+# ||x|| por encima de esto se considera divergencia
+LIMITE_DIVERGENCIA = 1e12
+
+
+class MatrizCSR:
+    """Matriz cuadrada dispersa por filas (CSR) con su diagonal aparte."""
+
+    __slots__ = ("n", "valores", "columnas", "inicio", "filas", "diagonal")
+
+    def __init__(self, datos):
+        A = np.asarray(datos, dtype=float)
+        if A.ndim != 2 or A.shape[0] != A.shape[1]:
+            raise ValueError("La matriz de coeficientes debe ser cuadrada.")
+        self.n = A.shape[0]
+        self.filas, self.columnas = np.nonzero(A)
+        self.valores = A[self.filas, self.columnas]
+        self.inicio = np.searchsorted(self.filas, np.arange(self.n + 1))
+        self.diagonal = A.diagonal().copy()
+
+    @property
+    def no_nulos(self):
+        return int(self.valores.size)
+
+    def producto(self, x):
+        """A·x en O(no nulos)."""
+        return np.bincount(
+            self.filas, weights=self.valores * x[self.columnas], minlength=self.n
+        )
+
+    def fuera_diagonal(self):
+        """Por fila: (columnas, valores) sin la diagonal (para barridos)."""
+        fuera = self.filas != self.columnas
+        cols, vals = self.columnas[fuera], self.valores[fuera]
+        inicio = np.searchsorted(self.filas[fuera], np.arange(self.n + 1))
+        return [
+            (cols[inicio[i]:inicio[i + 1]], vals[inicio[i]:inicio[i + 1]])
+            for i in range(self.n)
+        ]
+
+    def dominancia(self):
+        """"estricta", "debil" o None (dominancia diagonal por filas)."""
+        suma = np.bincount(self.filas, weights=np.abs(self.valores), minlength=self.n)
+        d = np.abs(self.diagonal)
+        resto = suma - d
+        if np.all(d > resto):
+            return "estricta"
+        if np.all(d >= resto) and np.any(d > resto):
+            return "debil"
+        return None
+
+    def es_simetrica(self, tol=1e-12):
+        if self.no_nulos == 0:
+            return True
+        n = self.n
+        orden_t = np.lexsort((self.filas, self.columnas))
+        if not np.array_equal(self.filas * n + self.columnas,
+                              self.columnas[orden_t] * n + self.filas[orden_t]):
+            return False
+        escala = float(np.abs(self.valores).max())
+        return bool(np.all(np.abs(self.valores - self.valores[orden_t]) <= tol * escala))
+
+    def densa(self):
+        A = np.zeros((self.n, self.n))
+        A[self.filas, self.columnas] = self.valores
+        return A
+
+
+def analizar(A):
+    """Diagonal nula, dominancia diagonal, simetría y definida positiva."""
+    dominancia = A.dominancia()
+    simetrica = A.es_simetrica()
+    definida_positiva = False
+    if simetrica and np.all(A.diagonal > 0):
+        # Gershgorin: simétrica, diagonal positiva y estrictamente dominante ⇒ SPD
+        definida_positiva = dominancia == "estricta"
+        if not definida_positiva and A.n <= LIMITE_CHOLESKY:
+            try:
+                np.linalg.cholesky(A.densa())
+                definida_positiva = True
+            except np.linalg.LinAlgError:
+                pass
+    return {
+        "diagonal_nula": bool(np.any(A.diagonal == 0)),
+        "dominancia": dominancia,
+        "simetrica": simetrica,
+        "definida_positiva": definida_positiva,
+    }
+
+
+def elegir_metodo(analisis):
+    """Método automático y el motivo (texto para la página)."""
+    if analisis["definida_positiva"]:
+        return "gradiente_conjugado", (
+            "A es simétrica y definida positiva: el Gradiente Conjugado "
+            "converge en a lo sumo n iteraciones (en aritmética exacta)."
+        )
+    if analisis["dominancia"] == "estricta":
+        return "gauss_seidel", (
+            "A es estrictamente diagonal dominante: Jacobi y Gauss-Seidel "
+            "convergen; Gauss-Seidel suele necesitar menos iteraciones."
+        )
+    return "gauss_seidel", (
+        "A no es diagonal dominante ni simétrica definida positiva: la "
+        "convergencia no está garantizada (prueba a reordenar las filas)."
+    )
+
+
+# ----- métodos -----
+
+def _error_relativo(x_nuevo, x):
+    dif = float(np.abs(x_nuevo - x).max())
+    norma = float(np.abs(x_nuevo).max())
+    return dif / norma if norma != 0 else dif
+
+
+def _fila_tabla(i, x, ea, residuo):
+    return {
+        "iter": i,
+        "x": x[:MAX_COMPONENTES].tolist(),
+        "ea": ea,
+        "residuo": residuo,
+    }
+
+
+def _iterar(paso, A, b, x, es, max_iter):
+    """Bucle común: aplica ``paso`` hasta ea < es, divergencia o max_iter."""
+    tabla = []
+    ea = None
+    for i in range(1, max_iter + 1):
+        x_nuevo = paso(x)
+        if not np.all(np.isfinite(x_nuevo)) or np.abs(x_nuevo).max() > LIMITE_DIVERGENCIA:
+            return tabla, x, ea, "El método diverge (los valores crecen sin control)."
+        ea = _error_relativo(x_nuevo, x)
+        residuo = float(np.abs(b - A.producto(x_nuevo)).max())
+        tabla.append(_fila_tabla(i, x_nuevo, ea, residuo))
+        x = x_nuevo
+        if ea < es:
+            break
+    return tabla, x, ea, None
+
+
+def jacobi(A, b, x0, es, max_iter):
+    d = A.diagonal
+
+    def paso(x):
+        # x_i ← (b_i - Σ_{j≠i} a_ij x_j) / a_ii = x_i + (b - A·x)_i / a_ii
+        return x + (b - A.producto(x)) / d
+
+    return _iterar(paso, A, b, x0, es, max_iter)
+
+
+def sor(A, b, x0, es, max_iter, omega=1.0):
+    """SOR; con omega = 1 es Gauss-Seidel."""
+    d = A.diagonal.tolist()
+    bl = b.tolist()
+    filas = A.fuera_diagonal()
+
+    def paso(x):
+        x = x.copy()
+        for i, (cols, vals) in enumerate(filas):
+            gs = (bl[i] - vals.dot(x[cols])) / d[i]
+            x[i] = gs if omega == 1.0 else (1.0 - omega) * x[i] + omega * gs
+        return x
+
+    return _iterar(paso, A, b, x0, es, max_iter)
+
+
+def gauss_seidel(A, b, x0, es, max_iter):
+    return sor(A, b, x0, es, max_iter, omega=1.0)
+
+
+def gradiente_conjugado(A, b, x0, es, max_iter):
+    tabla = []
+    x = x0.copy()
+    r = b - A.producto(x)
+    p = r.copy()
+    rr = float(r @ r)
+    ea = None
+    for i in range(1, max_iter + 1):
+        if rr == 0.0:
+            break
+        Ap = A.producto(p)
+        pAp = float(p @ Ap)
+        if pAp <= 0.0:
+            return tabla, x, ea, "A no es definida positiva (p·Ap ≤ 0)."
+        alfa = rr / pAp
+        x_nuevo = x + alfa * p
+        r -= alfa * Ap
+        rr_nuevo = float(r @ r)
+        ea = _error_relativo(x_nuevo, x)
+        tabla.append(_fila_tabla(i, x_nuevo, ea, float(np.abs(r).max())))
+        x = x_nuevo
+        if ea < es:
+            break
+        p = r + (rr_nuevo / rr) * p
+        rr = rr_nuevo
+    return tabla, x, ea, None
+
+
+# ----- entrada -----
+
+def leer_sistema(texto):
+    """
+    Matriz aumentada [A | b] desde texto: una fila por línea, entradas
+    separadas por espacios, comas o punto y coma; admite "|" antes de b y
+    fracciones como 1/3.
+    """
+    filas = []
+    for linea in texto.strip().splitlines():
+        linea = linea.replace("|", " ").replace(",", " ").replace(";", " ")
+        if not linea.strip():
+            continue
+        try:
+            filas.append([float(Fraction(v)) for v in linea.split()])
+        except (ValueError, ZeroDivisionError):
+            raise ValueError(f"Entrada no numérica en la fila {len(filas) + 1}.") from None
+    if not filas:
+        raise ValueError("Debes ingresar la matriz aumentada [A | b].")
+    n = len(filas)
+    if any(len(f) != n + 1 for f in filas):
+        raise ValueError(
+            f"Cada fila debe tener {n + 1} números (n coeficientes y el término independiente)."
+        )
+    A = [f[:-1] for f in filas]
+    b = [f[-1] for f in filas]
+    return A, b
+
+
+def sistema_ejemplo(n):
+    """Tridiagonal 4, -1 (diagonal dominante y SPD) con solución x = 1."""
+    filas = []
+    for i in range(n):
+        fila = [0] * (n + 1)
+        fila[i] = 4
+        if i > 0:
+            fila[i - 1] = -1
+        if i < n - 1:
+            fila[i + 1] = -1
+        fila[n] = sum(fila[:n])
+        filas.append(fila)
+    return filas
+
+
+# ----- punto de entrada -----
+
+def resolver_iterativo(A, b, metodo="auto", x0=None, es=1e-6, max_iter=100, omega=1.25):
+    """
+    Resuelve Ax = b con el método pedido (o el que elija ``elegir_metodo``).
+
+    Devuelve un dict con tabla (iter, x[:MAX_COMPONENTES], ea, residuo),
+    x, n_iter, converge, metodo, nombre_metodo, analisis, motivo y
+    error_metodo (o None).
+    """
+    if not HAY_NUMPY:
+        raise ValueError("Los métodos iterativos necesitan NumPy.")
+    A = A if isinstance(A, MatrizCSR) else MatrizCSR(A)
+    b = np.asarray(b, dtype=float)
+    if b.shape != (A.n,):
+        raise ValueError("El vector b debe tener una entrada por fila de A.")
+    x0 = np.zeros(A.n) if x0 is None else np.asarray(x0, dtype=float)
+    if x0.shape != (A.n,):
+        raise ValueError("El vector inicial x0 debe tener n entradas.")
+
+    analisis = analizar(A)
+    if metodo == "auto":
+        metodo, motivo = elegir_metodo(analisis)
+    elif metodo in METODOS:
+        motivo = None
+    else:
+        raise ValueError(f"Método desconocido: {metodo!r}. Opciones: auto, {', '.join(METODOS)}.")
+
+    if metodo != "gradiente_conjugado" and analisis["diagonal_nula"]:
+        raise ValueError(
+            "Hay ceros en la diagonal de A: reordena las filas antes de usar "
+            f"{NOMBRES[metodo]}."
+        )
+    if metodo == "gradiente_conjugado" and not analisis["simetrica"]:
+        raise ValueError("El Gradiente Conjugado requiere una matriz simétrica.")
+    if metodo == "sor" and not 0 < omega < 2:
+        raise ValueError("El factor de relajación debe cumplir 0 < ω < 2.")
+
+    if metodo == "jacobi":
+        tabla, x, ea, error_metodo = jacobi(A, b, x0, es, max_iter)
+    elif metodo == "gauss_seidel":
+        tabla, x, ea, error_metodo = gauss_seidel(A, b, x0, es, max_iter)
+    elif metodo == "sor":
+        tabla, x, ea, error_metodo = sor(A, b, x0, es, max_iter, omega)
+    else:
+        tabla, x, ea, error_metodo = gradiente_conjugado(A, b, x0, es, max_iter)
+
+    residuo = float(np.abs(b - A.producto(x)).max())
+    return {
+        "tabla": tabla,
+        "x": x.tolist(),
+        "n_iter": len(tabla),
+        "converge": error_metodo is None and (residuo == 0.0 or (ea is not None and ea < es)),
+        "residuo": residuo,
+        "metodo": metodo,
+        "nombre_metodo": NOMBRES[metodo],
+        "analisis": analisis,
+        "motivo": motivo,
+        "error_metodo": error_metodo,
+    }
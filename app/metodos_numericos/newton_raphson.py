@@ -1,38 +1,24 @@
-from sympy import symbols, sympify, diff, lambdify, E
-import math
+from .funcion import compilar_funcion
+
 
 def metodo_newton_raphson(expr_python, x0, es=1e-4, max_iter=50):
     """
-    Aplica el método de Newton-Raphson.
+    Aplica el método de Newton-Raphson. f'(x) sale con f(x) en la misma
+    evaluación (derivación automática del motor de expresiones).
     """
-    x = symbols('x')
-
-    # 1. Interpretar la función
+    # 1. Interpretar la función y su derivada
     try:
-        # Usamos locals para asegurar que 'e' se interprete como la constante matemática
-        f_sym = sympify(expr_python, locals={"e": E})
+        f_y_derivada = compilar_funcion(expr_python).con_derivada()
     except Exception as e:
         return {"error": f"Error de sintaxis en la función: {e}"}
 
-    # 2. Calcular derivada
-    fprime_sym = diff(f_sym, x)
-
-    # 3. Crear funciones numéricas (AQUÍ ESTABA EL ERROR ANTERIOR)
-    # Usamos modules=['math'] para forzar el uso de Python math standard
-    try:
-        f = lambdify(x, f_sym, modules=['math'])
-        fprime = lambdify(x, fprime_sym, modules=['math'])
-    except Exception as e:
-        return {"error": f"No se pudo compilar la función: {e}"}
-
     xi = float(x0)
     tabla = []
     ea = None
 
     for i in range(1, max_iter + 1):
         try:
-            fx = f(xi)
-            fpx = fprime(xi)
+            fx, fpx = f_y_derivada(xi)
         except Exception as e:
             # Capturamos errores como división por cero matemática o dominio
             return {"error": f"Error matemático al evaluar en {xi:.4f}: {e}"}
@@ -74,5 +60,4 @@ def metodo_newton_raphson(expr_python, x0, es=1e-4, max_iter=50):
         "raiz": xi,
         "n_iter": len(tabla),
         "converge": (ea is not None and ea < es),
-        "derivada_latex": str(diff(f_sym, x)) # Simplificado para evitar errores de importación
     }
\ No newline at end of file
@@ -1,12 +1,12 @@
 from flask import Blueprint, render_template, request
-from .biseccion import metodo_biseccion, evaluar_funcion
+from .biseccion import metodo_biseccion
+from .funcion import evaluar_funcion, malla_funcion, raices_en_malla
 from .regla_falsa import metodo_regla_falsa
 from .newton_raphson import metodo_newton_raphson 
 from .secante import metodo_secante 
+from .iterativos import resolver_iterativo, leer_sistema, sistema_ejemplo, MAX_COMPONENTES
 from sympy import symbols, sympify, diff, latex
 
-import re
-import math
 import io
 import base64
 
@@ -20,40 +20,6 @@ metodos_bp = Blueprint(
     url_prefix="/metodos-numericos"
 )
 
-def pretty_to_latex(pretty: str) -> str:
-    if not pretty:
-        return ""
-    tex = pretty.strip()
-
-    # trig
-    tex = re.sub(r'\bsen\(', r'\\sin(', tex, flags=re.I)
-    tex = re.sub(r'\btg\(',  r'\\tan(', tex, flags=re.I)
-    tex = re.sub(r'\btan\(', r'\\tan(', tex, flags=re.I)
-    tex = re.sub(r'\bcos\(', r'\\cos(', tex, flags=re.I)
-    
-    # logs
-    tex = re.sub(r'\bln\(', r'\\ln(', tex, flags=re.I)
-    tex = re.sub(r'log10\(', r'\\log_{10}(', tex, flags=re.I)
-    tex = re.sub(r'log_([0-9A-Za-z]+)\(', r'\\log_{\1}(', tex)
-
-    # raíz cuadrada
-    tex = re.sub(r'√\(([^)]+)\)', r'\\sqrt{\1}', tex)
-    tex = re.sub(r'√([A-Za-z0-9]+)', r'\\sqrt{\1}', tex)
-
-    # pi
-    tex = re.sub(r'π', r'\\pi', tex)
-
-    # fracciones simples
-    tex = re.sub(r'\(([^)]+)\)\s*/\s*\(([^)]+)\)', r'\\frac{\1}{\2}', tex)
-    tex = re.sub(r'(\d+)\s*/\s*(\d+)', r'\\frac{\1}{\2}', tex)
-
-    # potencias:
-    tex = re.sub(r'([A-Za-z0-9\)\]])\^\(([^)]+)\)', r'\1^{ \2 }', tex)
-    tex = re.sub(r'([A-Za-z0-9\)\]])\^(-?[A-Za-z0-9]+)', r'\1^{ \2 }', tex)
-
-    return tex
-
-
 @metodos_bp.route("/biseccion", methods=["GET", "POST"])
 def biseccion():
     resultados = None
@@ -127,26 +93,8 @@ def biseccion():
             
             if gx_i == gx_u: gx_i -= 5; gx_u += 5
 
-            num_puntos = 400
-            xs = []
-            ys = []
-            for i in range(num_puntos + 1):
-                x = gx_i + (gx_u - gx_i) * i / num_puntos
-                try:
-                    y = evaluar_funcion(expr, x)
-                    if not math.isfinite(y): y = float("nan")
-                except: y = float("nan")
-                xs.append(x)
-                ys.append(y)
-
-            roots_x = []
-            for i in range(1, len(xs)):
-                y1, y2 = ys[i-1], ys[i]
-                if not (math.isfinite(y1) and math.isfinite(y2)): continue
-                if y1 == 0: roots_x.append(xs[i-1])
-                if y1 * y2 < 0:
-                    x0 = xs[i-1] - y1 * (xs[i] - xs[i-1]) / (y2 - y1)
-                    roots_x.append(x0)
+            xs, ys = malla_funcion(expr, gx_i, gx_u)
+            roots_x = raices_en_malla(xs, ys)
 
             fig, ax = plt.subplots(figsize=(6, 3))
             ax.axhline(0, color="black", linewidth=0.8)
@@ -234,24 +182,8 @@ def regla_falsa():
             
             if gx_i == gx_u: gx_i -= 5; gx_u += 5
 
-            num_puntos = 400
-            xs, ys = [], []
-            for i in range(num_puntos + 1):
-                x = gx_i + (gx_u - gx_i) * i / num_puntos
-                try:
-                    y = evaluar_funcion(expr, x)
-                    if not math.isfinite(y): y = float("nan")
-                except: y = float("nan")
-                xs.append(x); ys.append(y)
-
-            roots_x = []
-            for i in range(1, len(xs)):
-                y1, y2 = ys[i-1], ys[i]
-                if not (math.isfinite(y1) and math.isfinite(y2)): continue
-                if y1 == 0: roots_x.append(xs[i-1])
-                if y1 * y2 < 0:
-                    x0 = xs[i-1] - y1 * (xs[i] - xs[i-1]) / (y2 - y1)
-                    roots_x.append(x0)
+            xs, ys = malla_funcion(expr, gx_i, gx_u)
+            roots_x = raices_en_malla(xs, ys)
 
             fig, ax = plt.subplots(figsize=(6, 3))
             ax.axhline(0, color="black", linewidth=0.8)
@@ -314,25 +246,8 @@ def newton_raphson():
                 else:
                     gx_i, gx_u = -10.0, 10.0
 
-                num_puntos = 400
-                xs, ys = [], []
-                for i in range(num_puntos + 1):
-                    x = gx_i + (gx_u - gx_i) * i / num_puntos
-                    try:
-                        # evaluar_funcion es segura para gráficas
-                        y = evaluar_funcion(expr, x) 
-                        if not math.isfinite(y): y = float("nan")
-                    except: y = float("nan")
-                    xs.append(x); ys.append(y)
-
-                roots_x = []
-                for i in range(1, len(xs)):
-                    y1, y2 = ys[i-1], ys[i]
-                    if not (math.isfinite(y1) and math.isfinite(y2)): continue
-                    if y1 == 0: roots_x.append(xs[i-1])
-                    if y1 * y2 < 0:
-                        x0_root = xs[i-1] - y1 * (xs[i] - xs[i-1]) / (y2 - y1)
-                        roots_x.append(x0_root)
+                xs, ys = malla_funcion(expr, gx_i, gx_u)
+                roots_x = raices_en_malla(xs, ys)
 
                 # --- GENERAR IMAGEN DE LA GRÁFICA ---
                 fig, ax = plt.subplots(figsize=(6, 3))
@@ -452,24 +367,8 @@ def secante():
                 else:
                     gx_i, gx_u = -10.0, 10.0
 
-                num_puntos = 400
-                xs, ys = [], []
-                for i in range(num_puntos + 1):
-                    x = gx_i + (gx_u - gx_i) * i / num_puntos
-                    try:
-                        y = evaluar_funcion(expr, x)
-                        if not math.isfinite(y): y = float("nan")
-                    except: y = float("nan")
-                    xs.append(x); ys.append(y)
-
-                roots_x = []
-                for i in range(1, len(xs)):
-                    y1, y2 = ys[i-1], ys[i]
-                    if not (math.isfinite(y1) and math.isfinite(y2)): continue
-                    if y1 == 0: roots_x.append(xs[i-1])
-                    if y1 * y2 < 0:
-                        x0_root = xs[i-1] - y1 * (xs[i] - xs[i-1]) / (y2 - y1)
-                        roots_x.append(x0_root)
+                xs, ys = malla_funcion(expr, gx_i, gx_u)
+                roots_x = raices_en_malla(xs, ys)
 
                 # --- GENERAR IMAGEN ---
                 fig, ax = plt.subplots(figsize=(6, 3))
@@ -540,4 +439,61 @@ def secante():
         n_iter=n_iter,
         error_msg=error_msg,
         grafica_png=grafica_png,
-    )
\ No newline at end of file
+    )
+
+
+@metodos_bp.route("/sistemas-iterativos", methods=["GET", "POST"])
+def sistemas_iterativos():
+    resultado = None
+    error_msg = None
+
+    datos = {
+        "sistema": "", "metodo": "auto", "x0": "", "omega": "1.25",
+        "es": "0.000001", "max_iter": "100", "n_ejemplo": "10",
+    }
+
+    if request.method == "POST":
+        try:
+            accion = (request.form.get("accion") or "resolver").strip()
+            datos.update({
+                clave: (request.form.get(clave) or valor).strip()
+                for clave, valor in datos.items()
+            })
+
+            if accion == "ejemplo":
+                n = int(datos["n_ejemplo"])
+                if not 1 <= n <= 1000:
+                    error_msg = "El tamaño del ejemplo debe estar entre 1 y 1000."
+                else:
+                    datos["sistema"] = "\n".join(
+                        " ".join(str(v) for v in fila[:-1]) + " | " + str(fila[-1])
+                        for fila in sistema_ejemplo(n)
+                    )
+                return render_template("iterativos.html", datos=datos, error_msg=error_msg)
+
+            A, b = leer_sistema(datos["sistema"])
+            x0 = None
+            if datos["x0"]:
+                x0 = [float(v) for v in datos["x0"].replace(",", " ").split()]
+
+            resultado = resolver_iterativo(
+                A, b,
+                metodo=datos["metodo"],
+                x0=x0,
+                es=float(datos["es"]),
+                max_iter=int(datos["max_iter"]),
+                omega=float(datos["omega"]),
+            )
+            if resultado["error_metodo"]:
+                error_msg = resultado["error_metodo"]
+
+        except Exception as e:
+            error_msg = f"Ocurrió un error: {e}"
+
+    return render_template(
+        "iterativos.html",
+        datos=datos,
+        resultado=resultado,
+        max_componentes=MAX_COMPONENTES,
+        error_msg=error_msg,
+    )
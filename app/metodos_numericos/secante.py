@@ -1,6 +1,7 @@
-from sympy import symbols, sympify, lambdify, E
 import math
 
+from .funcion import compilar_funcion
+
 def metodo_secante(expr_str, x0, x1, es=0.0001, max_iter=50):
     """
     Método de la Secante:
@@ -8,8 +9,6 @@ def metodo_secante(expr_str, x0, x1, es=0.0001, max_iter=50):
         x_{i+1} = x_i - [ f(x_i)*(x_{i-1} - x_i) ] / [ f(x_{i-1}) - f(x_i) ]
     """
 
-    x = symbols('x')
-
     # Aseguramos que vengan como floats
     x0 = float(x0)
     x1 = float(x1)
@@ -22,18 +21,12 @@ def metodo_secante(expr_str, x0, x1, es=0.0001, max_iter=50):
             "El método de la secante necesita dos puntos distintos."
         )
 
-    # 1) Interpretar la función f(x)
+    # 1) Interpretar la función f(x) y compilarla (una vez, con caché)
     try:
-        f_sym = sympify(expr_str, locals={"e": E})
+        f = compilar_funcion(expr_str).flotante()
     except Exception as e:
         return None, None, 0, f"Error al interpretar la función: {e}"
 
-    # 2) Crear función numérica f(x)
-    try:
-        f = lambdify(x, f_sym, "math")  # usará math.e para la E
-    except Exception as e:
-        return None, None, 0, f"Error al crear la función numérica: {e}"
-
     iteraciones = []
     raiz = None
 
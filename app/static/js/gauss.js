@@ -3,6 +3,7 @@
 let lineasActuales = [];
 let ultimaCeldaActiva = null;  // math-field activo
 let ultimoResultado = null;
+let sesionIncremental = null;  // id de la última tabla resuelta en el servidor
 
 // ========= helpers para convertir LaTeX -> "pretty" (como Newton) =========
 
@@ -198,65 +199,73 @@ function crearTH(txt) {
 }
 
 function mostrarPasos(pasos) {
+  limpiarPasos();
+  pasos.forEach(agregarPaso);
+  document.getElementById("zona-pasos").classList.remove("hidden");
+}
+
+function limpiarPasos() {
+  document.getElementById("contenedor-pasos").innerHTML = "";
+}
+
+// Añade la tarjeta de un paso (se usa también al recibirlos en streaming)
+function agregarPaso(p, i) {
   const cont = document.getElementById("contenedor-pasos");
-  cont.innerHTML = "";
-  pasos.forEach((p, i) => {
-    const card = document.createElement("div");
-    card.className = "card-paso";
-    const titulo = document.createElement("div");
-    titulo.innerHTML = `<span class="badge">Paso ${
-      i + 1
-    }</span> <span class="ml-2 font-medium">${p.descripcion}</span>`;
-    card.appendChild(titulo);
-
-    const wrap = document.createElement("div");
-    wrap.className = "overflow-auto mt-3 rounded-lg";
-    wrap.style.border = "1px solid var(--border)";
-    const tabla = document.createElement("table");
-    tabla.className = "matrix-table w-full";
-    const filas = p.matriz.length,
-      cols = p.matriz[0].length;
-    const thead = document.createElement("thead");
-    const thr = document.createElement("tr");
-    thr.appendChild(crearTH(""));
-    for (let c = 0; c < cols - 1; c++) {
-      thr.appendChild(crearTH("x" + (c + 1)));
-    }
-    thr.appendChild(crearTH("b"));
-    thead.appendChild(thr);
-    tabla.appendChild(thead);
-    const tbody = document.createElement("tbody");
-    for (let r = 0; r < filas; r++) {
-      const tr = document.createElement("tr");
-      const rh = document.createElement("th");
-      rh.className = "row-head";
-      rh.textContent = String(r + 1);
-      tr.appendChild(rh);
-      for (let c = 0; c < cols; c++) {
-        const td = document.createElement("td");
-        td.textContent = p.matriz[r][c];
-        tr.appendChild(td);
-      }
-      tbody.appendChild(tr);
-    }
-    tabla.appendChild(tbody);
-
-    if (p.col_pivote) {
-      const pivotHeaderIdx = 1 + (p.col_pivote - 1);
-      if (thr.children[pivotHeaderIdx])
-        thr.children[pivotHeaderIdx].classList.add("pivot");
-      const rows = tbody.querySelectorAll("tr");
-      rows.forEach((tr) => {
-        const tds = tr.querySelectorAll("td");
-        const idxBody = p.col_pivote - 1;
-        if (tds[idxBody]) tds[idxBody].classList.add("pivot");
-      });
+  const card = document.createElement("div");
+  card.className = "card-paso";
+  const titulo = document.createElement("div");
+  titulo.innerHTML = `<span class="badge">Paso ${
+    i + 1
+  }</span> <span class="ml-2 font-medium">${p.descripcion}</span>`;
+  card.appendChild(titulo);
+
+  const wrap = document.createElement("div");
+  wrap.className = "overflow-auto mt-3 rounded-lg";
+  wrap.style.border = "1px solid var(--border)";
+  const tabla = document.createElement("table");
+  tabla.className = "matrix-table w-full";
+  const filas = p.matriz.length,
+    cols = p.matriz[0].length;
+  const thead = document.createElement("thead");
+  const thr = document.createElement("tr");
+  thr.appendChild(crearTH(""));
+  for (let c = 0; c < cols - 1; c++) {
+    thr.appendChild(crearTH("x" + (c + 1)));
+  }
+  thr.appendChild(crearTH("b"));
+  thead.appendChild(thr);
+  tabla.appendChild(thead);
+  const tbody = document.createElement("tbody");
+  for (let r = 0; r < filas; r++) {
+    const tr = document.createElement("tr");
+    const rh = document.createElement("th");
+    rh.className = "row-head";
+    rh.textContent = String(r + 1);
+    tr.appendChild(rh);
+    for (let c = 0; c < cols; c++) {
+      const td = document.createElement("td");
+      td.textContent = p.matriz[r][c];
+      tr.appendChild(td);
     }
+    tbody.appendChild(tr);
+  }
+  tabla.appendChild(tbody);
 
-    wrap.appendChild(tabla);
-    card.appendChild(wrap);
-    cont.appendChild(card);
-  });
+  if (p.col_pivote) {
+    const pivotHeaderIdx = 1 + (p.col_pivote - 1);
+    if (thr.children[pivotHeaderIdx])
+      thr.children[pivotHeaderIdx].classList.add("pivot");
+    const rows = tbody.querySelectorAll("tr");
+    rows.forEach((tr) => {
+      const tds = tr.querySelectorAll("td");
+      const idxBody = p.col_pivote - 1;
+      if (tds[idxBody]) tds[idxBody].classList.add("pivot");
+    });
+  }
+
+  wrap.appendChild(tabla);
+  card.appendChild(wrap);
+  cont.appendChild(card);
   document.getElementById("zona-pasos").classList.remove("hidden");
 }
 
@@ -522,20 +531,33 @@ document.addEventListener("DOMContentLoaded", () => {
     const decimales =
       parseInt(document.getElementById("inp-decimales").value, 10) || 6;
     try {
-      const resp = await fetch("/matrices/gauss/resolver", {
+      // Resultado final primero: si solo cambiaron algunas celdas el
+      // servidor lo actualiza sin repetir la eliminación
+      const resp = await fetch("/matrices/gauss/resolver_incremental", {
         method: "POST",
         headers: { "Content-Type": "application/json" },
         body: JSON.stringify({
-          filas,
-          columnas,
           tabla: datos,
+          sesion: sesionIncremental,
           modo_precision,
           decimales,
         }),
       });
-      const js = await resp.json();
-      if (!js.ok) throw new Error(js.error || "Error");
-      mostrarPasos(js.pasos);
+      const inc = await resp.json();
+      if (inc.ok) {
+        sesionIncremental = inc.sesion;
+        mostrarFinal(inc.final);
+        lineasActuales = inc.final.lineas || [];
+        setMsg("Calculando pasos...");
+      }
+
+      // Los pasos se pintan a medida que llegan (NDJSON)
+      limpiarPasos();
+      const js = await resolverEnStreaming(
+        "/matrices/gauss/resolver/stream",
+        { filas, columnas, tabla: datos, modo_precision, decimales },
+        agregarPaso
+      );
       mostrarFinal(js.final);
       setMsg("Listo.");
       ultimoResultado = js;
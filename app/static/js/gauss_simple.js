@@ -196,57 +196,63 @@ function leerTabla() {
 // ========= mostrar pasos / resultado =========
 
 function mostrarPasos(pasos) {
+  limpiarPasos();
+  pasos.forEach(agregarPaso);
+  document.getElementById("zona-pasos").classList.remove("hidden");
+}
+
+function limpiarPasos() {
+  document.getElementById("contenedor-pasos").innerHTML = "";
+}
+
+// Añade la tarjeta de un paso (se usa también al recibirlos en streaming)
+function agregarPaso(p, i) {
   const cont = document.getElementById("contenedor-pasos");
-  cont.innerHTML = "";
-
-  pasos.forEach((p, i) => {
-    const card = document.createElement("div");
-    card.className = "card-paso";
-    const titulo = document.createElement("div");
-    titulo.innerHTML = `<span class="badge">Paso ${
-      i + 1
-    }</span> <span class="ml-2 font-medium">${p.descripcion}</span>`;
-    card.appendChild(titulo);
-
-    const wrap = document.createElement("div");
-    wrap.className =
-      "overflow-auto mt-3 rounded-lg border border-slate-200";
-    const tabla = document.createElement("table");
-    tabla.className = "matrix-table w-full";
-
-    const filas = p.matriz.length;
-    const cols = p.matriz[0].length;
-    const thead = document.createElement("thead");
-    const thr = document.createElement("tr");
-    thr.appendChild(document.createElement("th")).textContent = "";
-    for (let c = 0; c < cols - 1; c++) {
-      const th = document.createElement("th");
-      th.textContent = "x" + (c + 1);
-      thr.appendChild(th);
-    }
-    thr.appendChild(document.createElement("th")).textContent = "b";
-    thead.appendChild(thr);
-    tabla.appendChild(thead);
-
-    const tbody = document.createElement("tbody");
-    for (let r = 0; r < filas; r++) {
-      const tr = document.createElement("tr");
-      const rh = document.createElement("th");
-      rh.textContent = String(r + 1);
-      tr.appendChild(rh);
-      for (let c = 0; c < cols; c++) {
-        const td = document.createElement("td");
-        td.textContent = p.matriz[r][c];
-        tr.appendChild(td);
-      }
-      tbody.appendChild(tr);
-    }
-    tabla.appendChild(tbody);
-    wrap.appendChild(tabla);
-    card.appendChild(wrap);
-    cont.appendChild(card);
-  });
+  const card = document.createElement("div");
+  card.className = "card-paso";
+  const titulo = document.createElement("div");
+  titulo.innerHTML = `<span class="badge">Paso ${
+    i + 1
+  }</span> <span class="ml-2 font-medium">${p.descripcion}</span>`;
+  card.appendChild(titulo);
+
+  const wrap = document.createElement("div");
+  wrap.className =
+    "overflow-auto mt-3 rounded-lg border border-slate-200";
+  const tabla = document.createElement("table");
+  tabla.className = "matrix-table w-full";
+
+  const filas = p.matriz.length;
+  const cols = p.matriz[0].length;
+  const thead = document.createElement("thead");
+  const thr = document.createElement("tr");
+  thr.appendChild(document.createElement("th")).textContent = "";
+  for (let c = 0; c < cols - 1; c++) {
+    const th = document.createElement("th");
+    th.textContent = "x" + (c + 1);
+    thr.appendChild(th);
+  }
+  thr.appendChild(document.createElement("th")).textContent = "b";
+  thead.appendChild(thr);
+  tabla.appendChild(thead);
 
+  const tbody = document.createElement("tbody");
+  for (let r = 0; r < filas; r++) {
+    const tr = document.createElement("tr");
+    const rh = document.createElement("th");
+    rh.textContent = String(r + 1);
+    tr.appendChild(rh);
+    for (let c = 0; c < cols; c++) {
+      const td = document.createElement("td");
+      td.textContent = p.matriz[r][c];
+      tr.appendChild(td);
+    }
+    tbody.appendChild(tr);
+  }
+  tabla.appendChild(tbody);
+  wrap.appendChild(tabla);
+  card.appendChild(wrap);
+  cont.appendChild(card);
   document.getElementById("zona-pasos").classList.remove("hidden");
 }
 
@@ -467,20 +473,14 @@ document.addEventListener("DOMContentLoaded", () => {
 
       try {
         setMsg("Calculando...");
-        const resp = await fetch("/matrices/gauss/resolver_simple", {
-          method: "POST",
-          headers: { "Content-Type": "application/json" },
-          body: JSON.stringify({
-            tabla: datos,
-            modo_precision,
-            decimales,
-          }),
-        });
-
-        const js = await resp.json();
-        if (!js.ok) throw new Error(js.error || "Error desconocido");
+        // Los pasos se pintan a medida que llegan (NDJSON)
+        limpiarPasos();
+        const js = await resolverEnStreaming(
+          "/matrices/gauss/resolver_simple/stream",
+          { tabla: datos, modo_precision, decimales },
+          agregarPaso
+        );
 
-        mostrarPasos(js.pasos);
         document.getElementById("final-desc").textContent =
           js.final?.descripcion || "Triangularización completada.";
         document
@@ -265,6 +265,7 @@ document.addEventListener("DOMContentLoaded", () => {
             matriz_str: matriz,
             modo_precision: modo,
             decimales,
+            metodo: document.getElementById("sel-metodo").value,
           }),
         });
 
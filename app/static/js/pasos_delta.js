@@ -0,0 +1,78 @@
+// app/static/js/pasos_delta.js
+// Reconstrucción de pasos "delta" (formato_pasos = "delta").
+// Cada paso trae la matriz completa (fotograma clave) o solo las filas que
+// cambió: { filas: [[indice, [valores...]], ...] }.
+
+// Expansor con estado: sirve para pasos que llegan de uno en uno (streaming).
+function crearExpansorPasos() {
+  let actual = null;
+  return (p) => {
+    if (p.matriz) {
+      actual = p.matriz.map((fila) => fila.slice());
+    } else {
+      if (!actual) throw new Error("El primer paso debe incluir la matriz completa.");
+      actual = actual.slice();
+      (p.filas || []).forEach(([r, fila]) => {
+        actual[r] = fila;
+      });
+    }
+    return {
+      descripcion: p.descripcion,
+      matriz: actual,
+      col_pivote: p.col_pivote,
+    };
+  };
+}
+
+function expandirPasos(pasos) {
+  return (pasos || []).map(crearExpansorPasos());
+}
+
+// Lee una respuesta NDJSON (un evento JSON por línea) y llama a alEvento
+// con cada uno en cuanto llega.
+async function leerEventosNDJSON(resp, alEvento) {
+  const lector = resp.body.getReader();
+  const decoder = new TextDecoder();
+  let resto = "";
+  for (;;) {
+    const { value, done } = await lector.read();
+    if (done) break;
+    resto += decoder.decode(value, { stream: true });
+    const lineas = resto.split("\n");
+    resto = lineas.pop();
+    lineas.forEach((l) => {
+      if (l.trim()) alEvento(JSON.parse(l));
+    });
+  }
+  if (resto.trim()) alEvento(JSON.parse(resto));
+}
+
+// Resuelve en streaming: pinta cada paso al llegar y devuelve
+// { pasos (compactos, para el PDF), final }.
+async function resolverEnStreaming(url, cuerpo, alPaso) {
+  const resp = await fetch(url, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({ ...cuerpo, formato_pasos: "delta" }),
+  });
+  const tipo = resp.headers.get("Content-Type") || "";
+  if (!tipo.includes("ndjson")) {
+    const js = await resp.json();
+    throw new Error(js.error || "Error");
+  }
+  const expandir = crearExpansorPasos();
+  const pasos = [];
+  let final = null;
+  await leerEventosNDJSON(resp, (ev) => {
+    if (ev.tipo === "paso") {
+      pasos.push(ev.paso);
+      alPaso(expandir(ev.paso), ev.indice);
+    } else if (ev.tipo === "final") {
+      final = ev.final;
+    } else if (ev.tipo === "error") {
+      throw new Error(ev.error);
+    }
+  });
+  if (!final) throw new Error("La respuesta terminó sin resultado final.");
+  return { ok: true, pasos, final };
+}
@@ -0,0 +1,56 @@
+# benchmarks/bench_despacho.py
+# -*- coding: utf-8 -*-
+"""
+Elección automática de motor: número de condición estimado (Hager/Higham
+sobre la LU) frente al exacto de ``numpy.linalg.cond``, y tiempo de
+Gauss-Jordan sin pasos con el motor elegido frente a "fracciones" (la
+salida es idéntica salvo la clave "refinamiento").
+
+Uso:  python -m benchmarks.bench_despacho
+"""
+from app.matrices.gauss.algebra import ResolverGaussJordan, MatrizAumentada, FormateadorNumeros
+from app.matrices.gauss.despacho import decidir_motor
+from app.matrices.gauss.factorizacion import CACHE
+from app.matrices.gauss.flotante import np, HAY_NUMPY, estimar_condicion
+
+from .comun import matriz_racional, cronometrar
+
+
+def resolver(matriz, motor):
+    CACHE.limpiar()     # sin reutilizar factorizaciones entre repeticiones
+    solver = ResolverGaussJordan(FormateadorNumeros(), motor=motor, formato_pasos="ninguno")
+    final = solver.resolver(matriz)["final"]
+    final.pop("refinamiento", None)
+    return final
+
+
+def main():
+    if not HAY_NUMPY:
+        print("Se necesita NumPy.")
+        return
+    print(f"{'n':>5} {'κ₁ estimado':>12} {'κ₁ exacto':>12} {'est. (ms)':>10} {'cond (ms)':>10}")
+    rnd = np.random.default_rng(0)
+    for n in (10, 100, 300):
+        A = rnd.standard_normal((n, n)) * np.logspace(0, 4, n)[:, None]
+        est = estimar_condicion(A)
+        exacto = float(np.linalg.cond(A, 1))
+        t_e = cronometrar(lambda: estimar_condicion(A))
+        t_c = cronometrar(lambda: np.linalg.cond(A, 1))
+        print(f"{n:>5} {est:>12.4g} {exacto:>12.4g} {t_e * 1000:>10.2f} {t_c * 1000:>10.2f}")
+
+    print()
+    print(f"{'n':>5} {'motor':>13} {'decisión (ms)':>14} {'auto (s)':>9} {'fracciones (s)':>15} {'aceleración':>12}")
+    for n in (5, 20, 40):
+        matriz = MatrizAumentada(matriz_racional(n, n, semilla=n))
+        decision = decidir_motor(matriz.a, con_pasos=False)
+        assert resolver(matriz, decision.motor) == resolver(matriz, "fracciones")
+        t_a = cronometrar(lambda: resolver(matriz, decision.motor), repeticiones=1)
+        t_f = cronometrar(lambda: resolver(matriz, "fracciones"), repeticiones=1)
+        print(
+            f"{n:>5} {decision.motor:>13} {decision.ms_decision:>14.2f} "
+            f"{t_a:>9.3f} {t_f:>15.3f} {t_f / t_a:>11.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# benchmarks/bench_evaluador.py
+# -*- coding: utf-8 -*-
+"""
+Evaluación de tablas de 10 000 celdas con EvaluadorSeguro: caché de
+expresiones compiladas frente a compilar cada celda (normalizar, ast.parse
+y validar cada vez, como antes). Tres tablas: valores repetidos ("0", "1",
+"1/2", ...), expresiones "bonitas" repetidas y celdas todas distintas (más
+que MAX_EXPRESIONES_CACHE, el peor caso de la LRU). Se comprueba que los
+valores son idénticos.
+
+Después, la tabla completa como la reciben las rutas (caché vacía, cada
+petición nueva): celda a celda con ``evaluar`` frente a ``evaluar_tabla``
+(textos repetidos una vez, enteros y a/b sin ast), junto al tiempo de
+resolver el sistema 100×100 sin pasos como referencia.
+
+Uso:  python -m benchmarks.bench_evaluador
+"""
+import random
+
+from app.expresiones import CACHE, Expresion
+from app.matrices.gauss.algebra import EvaluadorSeguro, evaluar_tabla
+from app.matrices.gauss.pygauss_ext import rref
+
+from .comun import matriz_racional, cronometrar
+
+N = 100
+
+
+def tabla_repetida():
+    return [[str(v) for v in fila[:N]] for fila in matriz_racional(N, N, semilla=1)]
+
+
+def tabla_bonita():
+    rnd = random.Random(2)
+    celdas = ["sen(π/2)", "2√3", "log_2(8)", "|-3/4|", "2^10", "3(1/2+1)", "frac(1,3)", "-0.25"]
+    return [[rnd.choice(celdas) for _ in range(N)] for _ in range(N)]
+
+
+def tabla_distinta():
+    return [[f"{i * N + j + 1}/{i + j + 7}" for j in range(N)] for i in range(N)]
+
+
+def sin_cache(tabla):
+    # cada celda se analiza y valida de nuevo, sin pasar por la caché
+    return [[Expresion(c).valor() for c in fila] for fila in tabla]
+
+
+def con_cache(tabla):
+    ev = EvaluadorSeguro()
+    return [[ev.evaluar(c) for c in fila] for fila in tabla]
+
+
+def celda_a_celda(tabla):
+    CACHE.limpiar()
+    ev = EvaluadorSeguro()
+    return [[ev.evaluar(str(c).strip()) for c in fila] for fila in tabla]
+
+
+def en_bloque(tabla):
+    CACHE.limpiar()
+    return evaluar_tabla(tabla)
+
+
+def main():
+    print(f"{'tabla':>10} {'distintas':>10} {'sin caché (s)':>14} {'con caché (s)':>14} {'aceleración':>12}")
+    for nombre, tabla in (
+        ("repetida", tabla_repetida()),
+        ("bonita", tabla_bonita()),
+        ("distinta", tabla_distinta()),
+    ):
+        distintas = len({c for fila in tabla for c in fila})
+        CACHE.limpiar()
+        assert sin_cache(tabla) == con_cache(tabla)
+        t_s = cronometrar(lambda: sin_cache(tabla))
+        # la primera pasada de cada repetición ya encuentra la caché llena
+        # salvo en la tabla distinta, que no cabe
+        t_c = cronometrar(lambda: con_cache(tabla))
+        print(f"{nombre:>10} {distintas:>10} {t_s:>14.3f} {t_c:>14.3f} {t_s / t_c:>11.2f}x")
+
+    print()
+    datos = matriz_racional(N, N - 1, semilla=3)
+    t_r = cronometrar(lambda: rref(datos, engine="bareiss"), repeticiones=1)
+    print(f"RREF {N}×{N} (bareiss): {t_r:.3f} s")
+    print(f"{'tabla':>10} {'celda a celda (s)':>18} {'evaluar_tabla (s)':>18} {'aceleración':>12}")
+    for nombre, tabla in (
+        ("repetida", tabla_repetida()),
+        ("bonita", tabla_bonita()),
+        ("distinta", tabla_distinta()),
+    ):
+        assert celda_a_celda(tabla) == en_bloque(tabla)
+        t_u = cronometrar(lambda: celda_a_celda(tabla))
+        t_b = cronometrar(lambda: en_bloque(tabla))
+        print(f"{nombre:>10} {t_u:>18.3f} {t_b:>18.3f} {t_u / t_b:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
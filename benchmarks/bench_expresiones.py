@@ -0,0 +1,87 @@
+# benchmarks/bench_expresiones.py
+# -*- coding: utf-8 -*-
+"""
+Sustitución hacia atrás con muchas variables libres: LinExpr (índices
+ordenados + coeficientes, axpy en el sitio) frente al esquema anterior
+(un dict de Fracciones nuevo en cada suma, resta y escala).
+
+La forma escalonada se calcula una vez fuera del cronómetro; se mide
+solve_from_ref + solution_to_strings y se comprueba que las líneas son
+idénticas.
+
+Uso:  python -m benchmarks.bench_expresiones
+"""
+from fractions import Fraction
+
+from app.matrices.gauss.pygauss_ext import (
+    ref,
+    solve_from_ref,
+    solution_to_strings,
+    fraction_fmt,
+)
+
+from .comun import matriz_racional, cronometrar
+
+
+# ----- esquema anterior: dict {'const' | ('x', j): Fraction} -----
+
+def _sumar(a, b, signo):
+    out = {}
+    for k in set(a).union(b):
+        out[k] = a.get(k, Fraction(0)) + signo * b.get(k, Fraction(0))
+    out.setdefault("const", Fraction(0))
+    return {k: v for k, v in out.items() if v != 0 or k == "const"}
+
+
+def _escalar(a, k):
+    return {key: v * k for key, v in a.items()}
+
+
+def _a_texto(e):
+    parts = []
+    if e["const"] != 0:
+        parts.append(fraction_fmt(e["const"]))
+    for key in sorted((k for k in e if k != "const"), key=lambda t: t[1]):
+        c, name = e[key], f"x{key[1]+1}"
+        parts.append(name if c == 1 else f"-{name}" if c == -1 else f"{fraction_fmt(c)}*{name}")
+    return (" + ".join(parts) or "0").replace("+ -", "- ")
+
+
+def lineas_dict(M, pivots):
+    n = len(M[0]) - 1
+    free = [j for j in range(n) if j not in set(pivots)]
+    exprs = {j: {"const": Fraction(0), ("x", j): Fraction(1)} for j in free}
+    for i in range(len(pivots) - 1, -1, -1):
+        col = pivots[i]
+        rhs = {"const": Fraction(M[i][-1])}
+        for j in range(col + 1, n):
+            if M[i][j] != 0:
+                ej = exprs.get(j, {"const": Fraction(0)})
+                rhs = _sumar(rhs, _escalar(ej, M[i][j]), -1)
+        exprs[col] = _escalar(rhs, 1 / M[i][col])
+    lines = []
+    for j in range(n):
+        if j in free:
+            lines.append(f"Variable libre: x{j+1}")
+        lines.append(f"x{j+1} = {_a_texto(exprs[j])}")
+    return lines
+
+
+def lineas_linexpr(M, pivots):
+    return solution_to_strings(solve_from_ref(M, pivots))
+
+
+def main():
+    print(f"{'m×n':>8} {'libres':>7} {'dict (s)':>9} {'LinExpr (s)':>12} {'aceleración':>12}")
+    for m, n in ((20, 130), (30, 160), (40, 200)):
+        datos = matriz_racional(m, n, semilla=m, densidad=0.5)
+        res = ref(datos)
+        libres = n - len(res.pivots)
+        assert lineas_dict(res.matrix, res.pivots) == lineas_linexpr(res.matrix, res.pivots)
+        t_d = cronometrar(lambda: lineas_dict(res.matrix, res.pivots), repeticiones=1)
+        t_l = cronometrar(lambda: lineas_linexpr(res.matrix, res.pivots), repeticiones=1)
+        print(f"{f'{m}×{n}':>8} {libres:>7} {t_d:>9.3f} {t_l:>12.3f} {t_d / t_l:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# benchmarks/bench_iterativos.py
+# -*- coding: utf-8 -*-
+"""
+Métodos iterativos sobre sistemas dispersos diagonalmente dominantes de
+n×n (5 no nulos por fila, no simétricos, y el tridiagonal 4, -1 de la
+página, que es SPD): iteraciones, error ||x - x*||∞ y tiempo de cada
+método, con la eliminación densa de NumPy (LAPACK) como referencia.
+
+Uso:  python -m benchmarks.bench_iterativos
+"""
+from app.metodos_numericos.iterativos import (
+    np,
+    HAY_NUMPY,
+    METODOS,
+    MatrizCSR,
+    resolver_iterativo,
+    sistema_ejemplo,
+)
+
+from .comun import cronometrar
+
+
+def dispersa_dominante(n, por_fila=5, semilla=0):
+    rnd = np.random.default_rng(semilla)
+    A = np.zeros((n, n))
+    for i in range(n):
+        cols = rnd.choice(n, por_fila - 1, replace=False)
+        A[i, cols] = rnd.uniform(-1, 1, por_fila - 1)
+        A[i, i] = np.abs(A[i]).sum() + 1
+    x = rnd.uniform(-1, 1, n)
+    return A, A @ x, x
+
+
+def tridiagonal(n):
+    S = np.array(sistema_ejemplo(n), dtype=float)
+    return S[:, :-1], S[:, -1], np.ones(n)
+
+
+def main():
+    if not HAY_NUMPY:
+        print("Se necesita NumPy.")
+        return
+    print(f"{'sistema':>12} {'n':>5} {'método':>26} {'iter':>5} {'error':>10} {'tiempo (s)':>11}")
+    for nombre, generar in (("dispersa", dispersa_dominante), ("tridiagonal", tridiagonal)):
+        for n in (1000, 3000):
+            A, b, x = generar(n)
+            csr = MatrizCSR(A)
+            for metodo in ("auto",) + METODOS:
+                if metodo == "gradiente_conjugado" and not csr.es_simetrica():
+                    continue
+                res = resolver_iterativo(csr, b, metodo, es=1e-10, max_iter=1000)
+                error = float(np.abs(np.array(res["x"]) - x).max())
+                t = cronometrar(
+                    lambda: resolver_iterativo(csr, b, metodo, es=1e-10, max_iter=1000),
+                    repeticiones=1,
+                )
+                etiqueta = f"auto→{res['metodo']}" if metodo == "auto" else metodo
+                print(f"{nombre:>12} {n:>5} {etiqueta:>26} {res['n_iter']:>5} {error:>10.1e} {t:>11.3f}")
+            t = cronometrar(lambda: np.linalg.solve(A, b), repeticiones=1)
+            print(f"{nombre:>12} {n:>5} {'numpy.linalg.solve':>26} {'-':>5} {'-':>10} {t:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
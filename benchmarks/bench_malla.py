@@ -0,0 +1,81 @@
+# benchmarks/bench_malla.py
+# -*- coding: utf-8 -*-
+"""
+Malla de la gráfica de f(x) y búsqueda de cambios de signo, como en las
+rutas de bisección, regla falsa, Newton-Raphson y secante: el bucle
+anterior (``eval`` por punto con try/except y otro bucle para las raíces)
+frente a ``malla_funcion`` + ``raices_en_malla`` (evaluador vectorial del
+motor de expresiones), con 400, 10 000 y 100 000 intervalos. Se comprueba
+con 400 que los valores (NaN incluidos) y las raíces coinciden.
+
+Uso:  python -m benchmarks.bench_malla
+"""
+import math
+
+from app.expresiones import HAY_NUMPY
+from app.metodos_numericos.funcion import malla_funcion, raices_en_malla
+
+from .bench_motor import evaluar_eval
+from .comun import cronometrar
+
+FUNCIONES = (
+    "x**4 - 5*x**3 + 0.5*x**2 - 11*x + 10",
+    "log(x) - 1/x + sqrt(x)",
+    "tan(x) - exp(-x**2)*sin(3*x)",
+)
+
+
+def malla_eval(expr, a, b, num_puntos):
+    """El bucle que tenía cada ruta."""
+    xs, ys = [], []
+    for i in range(num_puntos + 1):
+        x = a + (b - a) * i / num_puntos
+        try:
+            y = evaluar_eval(expr, x)
+            if not math.isfinite(y):
+                y = float("nan")
+        except Exception:
+            y = float("nan")
+        xs.append(x)
+        ys.append(y)
+    raices = []
+    for i in range(1, len(xs)):
+        y1, y2 = ys[i - 1], ys[i]
+        if not (math.isfinite(y1) and math.isfinite(y2)):
+            continue
+        if y1 == 0:
+            raices.append(xs[i - 1])
+        if y1 * y2 < 0:
+            raices.append(xs[i - 1] - y1 * (xs[i] - xs[i - 1]) / (y2 - y1))
+    return ys, raices
+
+
+def malla_motor(expr, a, b, num_puntos):
+    xs, ys = malla_funcion(expr, a, b, num_puntos)
+    return ys, raices_en_malla(xs, ys)
+
+
+def iguales(u, v):
+    return len(u) == len(v) and all(
+        (p != p and q != q) or math.isclose(p, q, rel_tol=1e-12, abs_tol=1e-12)
+        for p, q in zip(u, v)
+    )
+
+
+def main():
+    if not HAY_NUMPY:
+        print("Se necesita NumPy.")
+        return
+    print(f"{'función':>36} {'puntos':>8} {'bucle (ms)':>11} {'vectorial (ms)':>15} {'aceleración':>12}")
+    for expr in FUNCIONES:
+        ys, raices = malla_eval(expr, -10.0, 10.0, 400)
+        ys_v, raices_v = malla_motor(expr, -10.0, 10.0, 400)
+        assert iguales(ys, ys_v.tolist()) and iguales(raices, raices_v)
+        for n in (400, 10_000, 100_000):
+            t_b = cronometrar(lambda: malla_eval(expr, -10.0, 10.0, n), repeticiones=1)
+            t_v = cronometrar(lambda: malla_motor(expr, -10.0, 10.0, n))
+            print(f"{expr:>36} {n + 1:>8} {t_b * 1000:>11.2f} {t_v * 1000:>15.2f} {t_b / t_v:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# benchmarks/bench_motor.py
+# -*- coding: utf-8 -*-
+"""
+f(x) de los métodos numéricos con el motor de expresiones compartido frente
+a lo que había antes en cada calculadora:
+
+- 401 evaluaciones (la malla de la gráfica): ``eval`` del texto en cada
+  punto con un diccionario de nombres nuevo, como el antiguo
+  ``evaluar_funcion``, frente al evaluador flotante compilado una vez. Se
+  comprueba que los valores son idénticos;
+- Newton-Raphson: f y f' con ``sympify`` + ``diff`` + ``lambdify`` (solo
+  si SymPy está instalado) frente a la derivación automática del motor,
+  preparación incluida.
+
+Uso:  python -m benchmarks.bench_motor
+"""
+import math
+
+from app.expresiones import CACHE
+from app.metodos_numericos.funcion import compilar_funcion
+
+from .comun import cronometrar
+
+try:
+    import sympy
+except ImportError:
+    sympy = None
+
+FUNCIONES = (
+    "x**4 - 5*x**3 + 0.5*x**2 - 11*x + 10",
+    "exp(-x/4)*sin(3*x) - 0.1*x",
+    "sqrt(abs(x)) - cos(x)**2 + log10(x**2 + 1)",
+)
+PUNTOS = [-10.0 + 20.0 * i / 400 for i in range(401)]
+
+
+def evaluar_eval(expr, x):
+    """El antiguo evaluar_funcion (biseccion.py / regla_falsa.py)."""
+    permitidos = {
+        "x": x, "y": x, "sin": math.sin, "cos": math.cos, "tan": math.tan,
+        "exp": math.exp, "log": math.log, "log10": math.log10, "sqrt": math.sqrt,
+        "pi": math.pi, "e": math.e, "abs": abs, "asin": math.asin,
+        "acos": math.acos, "atan": math.atan,
+    }
+    return eval(expr, {"__builtins__": {}}, permitidos)
+
+
+def malla_eval(expr):
+    return [evaluar_eval(expr, x) for x in PUNTOS]
+
+
+def malla_motor(expr):
+    f = compilar_funcion(expr).flotante()
+    return [f(x) for x in PUNTOS]
+
+
+def newton_sympy(expr):
+    # x real (si no, d|x|/dx queda sin evaluar); SymPy no tiene log10
+    x = sympy.symbols("x", real=True)
+    f_sym = sympy.sympify(
+        expr, locals={"x": x, "e": sympy.E, "log10": lambda a: sympy.log(a, 10)}
+    )
+    f = sympy.lambdify(x, f_sym, modules=["math"])
+    fprime = sympy.lambdify(x, sympy.diff(f_sym, x), modules=["math"])
+    return [(f(v), fprime(v)) for v in PUNTOS[:50]]
+
+
+def newton_motor(expr):
+    CACHE.limpiar()     # la preparación se cuenta, como con SymPy
+    f = compilar_funcion(expr).con_derivada()
+    return [f(v) for v in PUNTOS[:50]]
+
+
+def main():
+    print(f"{'función':>44} {'eval (ms)':>10} {'motor (ms)':>11} {'aceleración':>12}")
+    for expr in FUNCIONES:
+        assert malla_eval(expr) == malla_motor(expr)
+        t_e = cronometrar(lambda: malla_eval(expr))
+        t_m = cronometrar(lambda: malla_motor(expr))
+        print(f"{expr:>44} {t_e * 1000:>10.2f} {t_m * 1000:>11.2f} {t_e / t_m:>11.2f}x")
+
+    print()
+    print(f"{'Newton: f y df/dx':>44} {'sympy (ms)':>10} {'motor (ms)':>11} {'aceleración':>12}")
+    for expr in FUNCIONES:
+        t_m = cronometrar(lambda: newton_motor(expr))
+        if sympy is None:
+            print(f"{expr:>44} {'-':>10} {t_m * 1000:>11.2f} {'(sin SymPy)':>12}")
+            continue
+        for (v, d), (v_s, d_s) in zip(newton_motor(expr), newton_sympy(expr)):
+            assert math.isclose(v, v_s, rel_tol=1e-9, abs_tol=1e-12)
+            assert math.isclose(d, d_s, rel_tol=1e-9, abs_tol=1e-12)
+        t_s = cronometrar(lambda: newton_sympy(expr), repeticiones=1)
+        print(f"{expr:>44} {t_s * 1000:>10.2f} {t_m * 1000:>11.2f} {t_s / t_m:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
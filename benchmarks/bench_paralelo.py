@@ -0,0 +1,41 @@
+# benchmarks/bench_paralelo.py
+# -*- coding: utf-8 -*-
+"""
+Escalado de la RREF modular con 1..N procesos (N = núcleos disponibles,
+o el primer argumento): tiempo, primos usados y aceleración frente a un
+solo proceso, con Bareiss (un proceso, sin primos) como referencia. Se
+comprueba que la RREF es la misma con cualquier número de procesos.
+
+Uso:  python -m benchmarks.bench_paralelo [N]
+"""
+import os
+import sys
+
+from app.matrices.gauss.modular import rref_modular
+from app.matrices.gauss.pygauss_ext import rref
+
+from .comun import matriz_racional, cronometrar
+
+
+def main():
+    maximo = int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 1)
+    print(f"núcleos disponibles: {os.cpu_count()}")
+    print(f"{'n':>5} {'procesos':>9} {'primos':>7} {'tiempo (s)':>11} {'aceleración':>12}")
+    for n in (60, 100):
+        datos = matriz_racional(n, n, semilla=n)
+        t_b = cronometrar(lambda: rref(datos, engine="bareiss"), repeticiones=1)
+        print(f"{n:>5} {'bareiss':>9} {'-':>7} {t_b:>11.3f} {'-':>12}")
+        referencia = None
+        t_1 = None
+        for procesos in range(1, maximo + 1):
+            R, pivotes, primos = rref_modular(datos, trabajadores=procesos)
+            if referencia is None:
+                referencia = (R, pivotes)
+            assert (R, pivotes) == referencia
+            t = cronometrar(lambda: rref_modular(datos, trabajadores=procesos), repeticiones=1)
+            t_1 = t_1 or t
+            print(f"{n:>5} {procesos:>9} {primos:>7} {t:>11.3f} {t_1 / t:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# benchmarks/bench_pivoteo.py
+# -*- coding: utf-8 -*-
+"""
+Estrategias de pivoteo: crecimiento de coeficientes y tiempo.
+
+  - exacto (motor "fracciones"): bits máximos (numerador + denominador) de
+    una entrada durante la eliminación de Gauss (la forma escalonada sí
+    depende del pivote; la RREF final no), y tiempo de Gauss-Jordan;
+  - flotante (motor "flotante"): factor de crecimiento de Gauss sin
+    normalizar (max|a_ij| durante la eliminación / max|a_ij| inicial),
+    residuo relativo ||Ax - b|| / ||b|| de Gauss-Jordan y tiempo, sobre una
+    matriz con escalas de fila distintas.
+
+Uso:  python -m benchmarks.bench_pivoteo
+"""
+import random
+
+from app.matrices.gauss.eliminacion import crear_motor, Eliminacion
+from app.matrices.gauss.flotante import np, HAY_NUMPY
+from app.matrices.gauss.pivoteo import ESTRATEGIAS
+
+from .comun import matriz_racional, cronometrar
+
+
+def bits_maximos(datos, pivoteo):
+    M = crear_motor(datos, "fracciones")
+    maximo = 0
+    for op in Eliminacion(M, reducida=False, normalizar=False, pivoteo=pivoteo):
+        for v in M.fila(op.fila):
+            maximo = max(maximo, v.numerator.bit_length() + v.denominator.bit_length())
+    return maximo
+
+
+def eliminar(datos, motor, pivoteo):
+    M = crear_motor(datos, motor)
+    Eliminacion(M, pivoteo=pivoteo).ejecutar()
+    return M
+
+
+def matriz_mal_escalada(n, semilla=0):
+    """Filas con escalas de 1e-3 a 1e3 (sensibles al pivote en float64)."""
+    rnd = random.Random(semilla)
+    datos = []
+    for _ in range(n):
+        escala = 10.0 ** rnd.randint(-3, 3)
+        datos.append([escala * rnd.uniform(-1, 1) for _ in range(n + 1)])
+    return datos
+
+
+def crecimiento_y_residuo(datos, pivoteo):
+    A0 = np.array(datos)
+    M = crear_motor(datos, "flotante")
+    maximo = 0.0
+    for op in Eliminacion(M, reducida=False, normalizar=False, pivoteo=pivoteo):
+        maximo = max(maximo, float(np.abs(M.a[op.fila]).max()))
+    x = eliminar(datos, "flotante", pivoteo).a[:, -1]
+    b = A0[:, -1]
+    residuo = np.linalg.norm(A0[:, :-1] @ x - b) / np.linalg.norm(b)
+    return maximo / np.abs(A0).max(), residuo
+
+
+def main():
+    print("Exacto (fracciones):")
+    print(f"{'n':>4} {'pivoteo':>11} {'bits máx':>9} {'tiempo (s)':>11}")
+    for n in (15, 30):
+        datos = matriz_racional(n, n, semilla=n, densidad=0.6)
+        for nombre in ESTRATEGIAS:
+            bits = bits_maximos(datos, nombre)
+            t = cronometrar(lambda: eliminar(datos, "fracciones", nombre), repeticiones=1)
+            print(f"{n:>4} {nombre:>11} {bits:>9} {t:>11.3f}")
+
+    if not HAY_NUMPY:
+        return
+    print("\nFlotante (float64, filas mal escaladas):")
+    print(f"{'n':>4} {'pivoteo':>11} {'crecimiento':>12} {'residuo':>10} {'tiempo (s)':>11}")
+    for n in (50, 100):
+        datos = matriz_mal_escalada(n, semilla=n)
+        for nombre in ESTRATEGIAS:
+            if nombre == "bits":
+                continue  # solo tiene sentido en modo exacto (en flotante es parcial)
+            g, res = crecimiento_y_residuo(datos, nombre)
+            t = cronometrar(lambda: eliminar(datos, "flotante", nombre), repeticiones=1)
+            print(f"{n:>4} {nombre:>11} {g:>12.3g} {res:>10.2e} {t:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
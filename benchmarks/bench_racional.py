@@ -0,0 +1,99 @@
+# benchmarks/bench_racional.py
+# -*- coding: utf-8 -*-
+"""
+Memoria y tiempo de MatrizRacional (enteros por fila + denominador) frente
+a la lista de Fracciones (una Fraction por celda).
+
+  - memoria: bytes de la matriz aumentada (sys.getsizeof de listas, objetos
+    Fraction y sus enteros);
+  - tiempo: la misma reducción de Gauss-Jordan sobre [A | I] con cada
+    representación, y calculate_determinant / gauss_jordan_inverse (que
+    ya usan MatrizRacional) como referencia.
+
+Uso:  python -m benchmarks.bench_racional
+"""
+import sys
+from fractions import Fraction
+
+from app.matrices.gauss.racional import MatrizRacional
+from app.matrices.operaciones.determinantes import calculate_determinant
+from app.matrices.operaciones.inversa_alg import gauss_jordan_inverse
+
+from .comun import matriz_racional, cronometrar
+
+
+def bytes_fracciones(datos):
+    total = sys.getsizeof(datos)
+    for fila in datos:
+        total += sys.getsizeof(fila)
+        for v in fila:
+            total += sys.getsizeof(v)
+            total += sys.getsizeof(v.numerator) + sys.getsizeof(v.denominator)
+    return total
+
+
+def con_identidad(datos):
+    n = len(datos)
+    return [
+        fila[:n] + [Fraction(int(i == j)) for j in range(n)]
+        for i, fila in enumerate(datos)
+    ]
+
+
+def gj_fracciones(Ab):
+    Ab = [fila[:] for fila in Ab]
+    n = len(Ab)
+    for col in range(n):
+        piv = next((r for r in range(col, n) if Ab[r][col] != 0), None)
+        if piv is None:
+            continue
+        Ab[col], Ab[piv] = Ab[piv], Ab[col]
+        pv = Ab[col][col]
+        Ab[col] = [v / pv for v in Ab[col]]
+        for r in range(n):
+            if r != col and Ab[r][col] != 0:
+                k = Ab[r][col]
+                Ab[r] = [a - k * b for a, b in zip(Ab[r], Ab[col])]
+    return Ab
+
+
+def gj_racional(Ab):
+    M = MatrizRacional(Ab)
+    n = M.m
+    for col in range(n):
+        piv = next((r for r in range(col, n) if not M.es_cero(r, col)), None)
+        if piv is None:
+            continue
+        M.intercambiar(col, piv)
+        M.dividir_fila(col, M.valor(col, col))
+        for r in range(n):
+            if r != col and not M.es_cero(r, col):
+                M.restar_multiplo(r, col, M.valor(r, col))
+    return M.fracciones()
+
+
+def main():
+    print(
+        f"{'n':>4} {'KB Fraction':>12} {'KB racional':>12} "
+        f"{'GJ Fraction (s)':>16} {'GJ racional (s)':>16} {'aceleración':>12} "
+        f"{'det (s)':>8} {'inversa (s)':>12}"
+    )
+    for n in (10, 20, 40, 60):
+        datos = matriz_racional(n, n, semilla=n)
+        Ab = con_identidad(datos)
+        kb_f = bytes_fracciones(Ab) / 1024
+        kb_r = MatrizRacional(Ab).tamano_bytes() / 1024
+        assert gj_fracciones(Ab) == gj_racional(Ab)
+        t_f = cronometrar(lambda: gj_fracciones(Ab), repeticiones=1)
+        t_r = cronometrar(lambda: gj_racional(Ab), repeticiones=1)
+        A = [fila[:n] for fila in datos]
+        t_det = cronometrar(lambda: calculate_determinant(A), repeticiones=1)
+        t_inv = cronometrar(lambda: gauss_jordan_inverse(A), repeticiones=1)
+        print(
+            f"{n:>4} {kb_f:>12.1f} {kb_r:>12.1f} {t_f:>16.3f} {t_r:>16.3f} "
+            f"{t_f / t_r:>11.2f}x {t_det:>8.3f} {t_inv:>12.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
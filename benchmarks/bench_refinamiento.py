@@ -0,0 +1,69 @@
+# benchmarks/bench_refinamiento.py
+# -*- coding: utf-8 -*-
+"""
+Refinamiento iterativo en precisión mixta frente a la eliminación exacta:
+gauss_jordan_solve con engine="refinamiento" (float64 + correcciones con
+residuo entero), "modular" y "fracciones" (sin caché) sobre sistemas
+cuadrados de Fracciones. Se comprueba que las líneas coinciden y se
+muestran las rondas de corrección usadas. Con pasos="diferidos" se
+comprueba además que "refinamiento" y "modular" cuentan y reproducen los
+mismos pasos que el motor exacto.
+
+Uso:  python -m benchmarks.bench_refinamiento
+"""
+from app.matrices.gauss.algebra import (
+    FormateadorNumeros, MatrizAumentada, ResolverGauss, ResolverGaussJordan,
+)
+from app.matrices.gauss.pygauss_ext import gauss_jordan_solve
+
+from .comun import matriz_racional, cronometrar
+
+
+def resolver(datos, engine):
+    A = [fila[:-1] for fila in datos]
+    b = [fila[-1] for fila in datos]
+    return gauss_jordan_solve(A, b, engine=engine, use_cache=False)
+
+
+def pasos_diferidos(datos, clase, motor):
+    """total_pasos y pasos paginados como en /pasos/<id>."""
+    matriz = MatrizAumentada(datos)
+    solver = clase(
+        FormateadorNumeros(), motor=motor, formato_pasos="ninguno", pasos_diferidos=True
+    )
+    final = solver.resolver(matriz)["final"]
+    return final["lineas"], solver.total_pasos, solver.pasos_en_rango(matriz, 0, solver.total_pasos)
+
+
+def comprobar_pasos_diferidos():
+    for n in (4, 12):
+        datos = matriz_racional(n, n, semilla=n)
+        for clase in (ResolverGaussJordan, ResolverGauss):
+            exacto = pasos_diferidos(datos, clase, "fracciones")
+            assert exacto[1] > 0
+            for motor in ("refinamiento", "modular"):
+                assert pasos_diferidos(datos, clase, motor) == exacto, (motor, clase.__name__, n)
+
+
+def main():
+    comprobar_pasos_diferidos()
+    print(
+        f"{'n':>4} {'datos':>8} {'rondas':>7} {'fracciones (s)':>15} "
+        f"{'modular (s)':>12} {'refinamiento (s)':>17} {'aceleración':>12}"
+    )
+    for n, dens in ((20, (1, 2, 3, 5, 7)), (40, (1, 2, 3, 5, 7)), (80, (1,)), (80, (1, 2, 3, 5, 7))):
+        datos = matriz_racional(n, n, semilla=n, dens=dens)
+        ref = resolver(datos, "refinamiento")
+        assert ref["lines"] == resolver(datos, "fracciones")["lines"]
+        t_f = cronometrar(lambda: resolver(datos, "fracciones"), repeticiones=1)
+        t_m = cronometrar(lambda: resolver(datos, "modular"), repeticiones=1)
+        t_r = cronometrar(lambda: resolver(datos, "refinamiento"), repeticiones=1)
+        etiqueta = "enteros" if dens == (1,) else "racional"
+        print(
+            f"{n:>4} {etiqueta:>8} {ref.get('refinement_rounds', '-'):>7} {t_f:>15.3f} "
+            f"{t_m:>12.3f} {t_r:>17.3f} {t_f / t_r:>11.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
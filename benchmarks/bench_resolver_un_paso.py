@@ -0,0 +1,38 @@
+# benchmarks/bench_resolver_un_paso.py
+# -*- coding: utf-8 -*-
+"""
+/matrices/gauss/resolver: un solo recorrido de eliminación frente al esquema
+anterior (ResolverGaussJordan + gauss_jordan_solve sobre la misma matriz).
+
+Uso:  python -m benchmarks.bench_resolver_un_paso
+"""
+from app.matrices.gauss.algebra import (
+    ResolverGaussJordan,
+    MatrizAumentada,
+    FormateadorNumeros,
+)
+from app.matrices.gauss.pygauss_ext import gauss_jordan_solve
+
+from .comun import matriz_racional, cronometrar
+
+
+def dos_pasadas(datos):
+    ResolverGaussJordan(FormateadorNumeros()).resolver(MatrizAumentada(datos))
+    gauss_jordan_solve([f[:-1] for f in datos], [f[-1] for f in datos])
+
+
+def una_pasada(datos):
+    ResolverGaussJordan(FormateadorNumeros()).resolver(MatrizAumentada(datos))
+
+
+def main():
+    print(f"{'n':>4} {'2 pasadas (s)':>14} {'1 pasada (s)':>13} {'aceleración':>12}")
+    for n in (10, 20, 30, 40, 50):
+        datos = matriz_racional(n, n, semilla=n)
+        t2 = cronometrar(lambda: dos_pasadas(datos), repeticiones=1)
+        t1 = cronometrar(lambda: una_pasada(datos), repeticiones=1)
+        print(f"{n:>4} {t2:>14.3f} {t1:>13.3f} {t2 / t1:>11.2f}x")
+
+
+if __name__ == "__main__":
+    main()
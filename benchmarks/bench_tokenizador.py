@@ -0,0 +1,107 @@
+# benchmarks/bench_tokenizador.py
+# -*- coding: utf-8 -*-
+"""
+Reescritura de expresiones pegadas largas: una pasada con tokens
+(app/expresiones/reescritura.py, Python y LaTeX a la vez) frente a la cadena anterior
+de ``re.sub`` (``normalizar_expresion`` más ``pretty_to_latex``, cada regla
+recorriendo la cadena entera).
+
+Antes de medir se comprueba que en el corpus de regresión (CASOS de
+corpus_expresiones) la cadena anterior da exactamente lo mismo.
+
+Uso:  python -m benchmarks.bench_tokenizador
+"""
+import random
+import re
+
+from app.expresiones import reescribir
+
+from .comun import cronometrar
+from .corpus_expresiones import CASOS, comprobar
+
+
+# ----- cadena anterior de expresiones regulares -----
+
+def normalizar_regex(expr):
+    s = expr.strip()
+    s = re.sub(r"asen", "asin", s, flags=re.IGNORECASE)
+    s = re.sub(r"acos", "acos", s, flags=re.IGNORECASE)
+    s = re.sub(r"atan", "atan", s, flags=re.IGNORECASE)
+    s = re.sub(r"sen", "sin", s, flags=re.IGNORECASE)
+    s = re.sub(r"\btg", "tan", s, flags=re.IGNORECASE)
+    s = re.sub(r"cos", "cos", s, flags=re.IGNORECASE)
+    s = re.sub(r"\bln\(", "log(", s, flags=re.IGNORECASE)
+    s = re.sub(r"log10\(", "log10(", s, flags=re.IGNORECASE)
+    s = s.replace("log₁₀(", "log10(")
+    s = re.sub(r"log_([0-9A-Za-z]+)\s*\(\s*([^)]+)\s*\)", r"log(\2, \1)", s, flags=re.IGNORECASE)
+    s = s.replace("√(", "sqrt(")
+    s = re.sub(r"√([A-Za-z0-9.]+)", r"sqrt(\1)", s)
+    s = s.replace("π", "pi")
+    s = s.replace("×", "*").replace("·", "*").replace("÷", "/")
+    s = s.replace("^", "**")
+    s = re.sub(r"\|([^|]+)\|", r"abs(\1)", s)
+    s = re.sub(r"(^|[^0-9A-Za-z_.])(\d+(?:\.\d+)?)\s*([A-Za-z(])", r"\1\2*\3", s)
+    s = re.sub(r"(^|[^A-Za-z0-9_])([A-Za-z])\s*\(", r"\1\2*(", s)
+    s = re.sub(r"\)\s*\(", ")*(", s)
+    s = re.sub(r"\)\s*([A-Za-z])", r")*\1", s)
+    return s
+
+
+def latex_regex(pretty):
+    tex = pretty.strip()
+    tex = re.sub(r'\bsen\(', r'\\sin(', tex, flags=re.I)
+    tex = re.sub(r'\btg\(', r'\\tan(', tex, flags=re.I)
+    tex = re.sub(r'\btan\(', r'\\tan(', tex, flags=re.I)
+    tex = re.sub(r'\bcos\(', r'\\cos(', tex, flags=re.I)
+    tex = re.sub(r'\bln\(', r'\\ln(', tex, flags=re.I)
+    tex = re.sub(r'log10\(', r'\\log_{10}(', tex, flags=re.I)
+    tex = re.sub(r'log_([0-9A-Za-z]+)\(', r'\\log_{\1}(', tex)
+    tex = re.sub(r'√\(([^)]+)\)', r'\\sqrt{\1}', tex)
+    tex = re.sub(r'√([A-Za-z0-9]+)', r'\\sqrt{\1}', tex)
+    tex = re.sub(r'π', r'\\pi', tex)
+    tex = re.sub(r'\(([^)]+)\)\s*/\s*\(([^)]+)\)', r'\\frac{\1}{\2}', tex)
+    tex = re.sub(r'(\d+)\s*/\s*(\d+)', r'\\frac{\1}{\2}', tex)
+    tex = re.sub(r'([A-Za-z0-9\)\]])\^\(([^)]+)\)', r'\1^{ \2 }', tex)
+    tex = re.sub(r'([A-Za-z0-9\)\]])\^(-?[A-Za-z0-9]+)', r'\1^{ \2 }', tex)
+    return tex
+
+
+def regex(expr):
+    return normalizar_regex(expr), latex_regex(expr)
+
+
+TERMINOS = ["3x^2", "sen(x)", "2√3", "log_2(x+1)", "|x-1|", "(x+1)(x-2)", "1/2", "π", "e^(2x)", "ln(x)"]
+
+
+def expresion(longitud, semilla=0):
+    """Suma "pegada" de términos variados de unos ``longitud`` caracteres."""
+    rnd = random.Random(semilla)
+    partes = []
+    total = 0
+    while total < longitud:
+        t = rnd.choice(TERMINOS)
+        partes.append(t)
+        total += len(t) + 3
+    return " + ".join(partes)
+
+
+def main():
+    fallos = comprobar()
+    assert not fallos, fallos
+    for entrada, python, latex in CASOS:
+        assert regex(entrada) == (python, latex), entrada
+
+    print(f"{'caracteres':>11} {'regex (ms)':>11} {'una pasada (ms)':>16} {'Mcar/s':>8} {'aceleración':>12}")
+    for longitud in (100, 1_000, 10_000, 100_000):
+        expr = expresion(longitud)
+        repeticiones = max(3, 20_000 // longitud)
+        t_r = cronometrar(lambda: regex(expr), repeticiones=repeticiones)
+        t_p = cronometrar(lambda: reescribir(expr), repeticiones=repeticiones)
+        print(
+            f"{len(expr):>11} {t_r * 1000:>11.3f} {t_p * 1000:>16.3f} "
+            f"{len(expr) / t_p / 1e6:>8.2f} {t_r / t_p:>11.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
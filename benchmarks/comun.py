@@ -0,0 +1,31 @@
+# benchmarks/comun.py
+# -*- coding: utf-8 -*-
+"""Utilidades compartidas por los benchmarks (matrices de prueba y cronómetro)."""
+import random
+import time
+from fractions import Fraction
+
+
+def matriz_racional(m, n, semilla=0, densidad=1.0, max_num=9, dens=(1, 2, 3, 5, 7)):
+    """Matriz aumentada m×(n+1) de Fracciones "desordenadas" reproducible."""
+    rnd = random.Random(semilla)
+    datos = []
+    for _ in range(m):
+        fila = []
+        for _ in range(n + 1):
+            if rnd.random() < densidad:
+                fila.append(Fraction(rnd.randint(-max_num, max_num), rnd.choice(dens)))
+            else:
+                fila.append(Fraction(0))
+        datos.append(fila)
+    return datos
+
+
+def cronometrar(fn, repeticiones=3):
+    """Mejor tiempo (segundos) de ``repeticiones`` llamadas a ``fn``."""
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        t0 = time.perf_counter()
+        fn()
+        mejor = min(mejor, time.perf_counter() - t0)
+    return mejor
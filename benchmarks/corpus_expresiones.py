@@ -0,0 +1,116 @@
+# benchmarks/corpus_expresiones.py
+# -*- coding: utf-8 -*-
+"""
+Corpus de regresión de la reescritura de expresiones (app/expresiones/reescritura.py):
+(entrada, expresión de Python, LaTeX) para cada regla que aplicaba la
+cadena de ``re.sub`` de ``normalizar_expresion`` y ``pretty_to_latex``.
+
+En CASOS las dos salidas son exactamente las de la cadena anterior (lo
+comprueba bench_tokenizador). En CORRECCIONES la salida cambia a propósito:
+paréntesis anidados, potencias y fracciones que las expresiones regulares
+cortaban mal; el comentario indica lo que daban antes.
+
+Uso:  python -m benchmarks.corpus_expresiones
+"""
+from app.expresiones import reescribir
+
+CASOS = [
+    ('sen(x)', 'sin(x)', '\\sin(x)'),
+    ('SEN(x)', 'sin(x)', '\\sin(x)'),
+    ('asen(1)', 'asin(1)', 'asen(1)'),
+    ('cos(0)', 'cos(0)', '\\cos(0)'),
+    ('COS(0)', 'cos(0)', '\\cos(0)'),
+    ('tan(x)', 'tan(x)', '\\tan(x)'),
+    ('ln(x)', 'log(x)', '\\ln(x)'),
+    ('log10(100)', 'log10(100)', '\\log_{10}(100)'),
+    ('log_2(8)', 'log(8, 2)', '\\log_{2}(8)'),
+    ('log_b(x)', 'log(x, b)', '\\log_{b}(x)'),
+    ('√(x+1)', 'sqrt(x+1)', '\\sqrt{x+1}'),
+    ('√x', 'sqrt(x)', '\\sqrt{x}'),
+    ('√2x', 'sqrt(2*x)', '\\sqrt{2x}'),
+    ('2√3', '2*sqrt(3)', '2\\sqrt{3}'),
+    ('π', 'pi', '\\pi'),
+    ('2π', '2*pi', '2\\pi'),
+    ('π^2', 'pi**2', '\\pi^{ 2 }'),
+    ('6×7', '6*7', '6×7'),
+    ('2·3', '2*3', '2·3'),
+    ('6÷4', '6/4', '6÷4'),
+    ('x^2', 'x**2', 'x^{ 2 }'),
+    ('2^10', '2**10', '2^{ 10 }'),
+    ('x^(n+1)', 'x**(n+1)', 'x^{ n+1 }'),
+    ('x^-1', 'x**-1', 'x^{ -1 }'),
+    ('|x|', 'abs(x)', '|x|'),
+    ('|-3/4|', 'abs(-3/4)', '|-\\frac{3}{4}|'),
+    ('2|x|', '2*abs(x)', '2|x|'),
+    ('2x', '2*x', '2x'),
+    ('2.5x', '2.5*x', '2.5x'),
+    ('3(x+1)', '3*(x+1)', '3(x+1)'),
+    ('x(x+1)', 'x*(x+1)', 'x(x+1)'),
+    ('(x+1)(x-1)', '(x+1)*(x-1)', '(x+1)(x-1)'),
+    ('(x+1)x', '(x+1)*x', '(x+1)x'),
+    ('2 x', '2*x', '2 x'),
+    ('1/2', '1/2', '\\frac{1}{2}'),
+    ('-3/4', '-3/4', '-\\frac{3}{4}'),
+    ('1 / 2', '1 / 2', '\\frac{1}{2}'),
+    ('(1)/(2)', '(1)/(2)', '\\frac{1}{2}'),
+    ('(x+1)/(x-1)', '(x+1)/(x-1)', '\\frac{x+1}{x-1}'),
+    ('x/2', 'x/2', 'x/2'),
+    ('sen(x)^2 + cos(x)^2', 'sin(x)**2 + cos(x)**2', '\\sin(x)^{ 2 } + \\cos(x)^{ 2 }'),
+    ('3x^2 + 2x - 1', '3*x**2 + 2*x - 1', '3x^{ 2 } + 2x - 1'),
+    ('e^x', 'e**x', 'e^{ x }'),
+    ('x^4 - 5*x^3 + 0.5*x^2 - 11*x + 10', 'x**4 - 5*x**3 + 0.5*x**2 - 11*x + 10', 'x^{ 4 } - 5*x^{ 3 } + 0.5*x^{ 2 } - 11*x + 10'),
+    ('frac(1,3)', 'frac(1,3)', 'frac(1,3)'),
+    ('ln(x)/x', 'log(x)/x', '\\ln(x)/x'),
+    ('  x + 1  ', 'x + 1', 'x + 1'),
+    ('|x|y', 'abs(x)*y', '|x|y'),
+]
+
+CORRECCIONES = [
+    # antes: 'log(sqrt(4, 2))' '\\log_{2}(sqrt(4))'
+    ('log_2(sqrt(4))', 'log(sqrt(4), 2)', '\\log_{2}(sqrt(4))'),
+    # antes: 'sqrt(1+(2))' '\\sqrt{1+(2})'
+    ('√(1+(2))', 'sqrt(1+(2))', '\\sqrt{1+(2)}'),
+    # antes: '(a+(b))/(c)' '(a+(b))/(c)'
+    ('(a+(b))/(c)', '(a+(b))/(c)', '\\frac{a+(b)}{c}'),
+    # antes: 'x**2/3' 'x^\\frac{2}{3}'
+    ('x^2/3', 'x**2/3', 'x^{ 2 }/3'),
+    # antes: 'x**2*x' 'x^{ 2x }'
+    ('x^2x', 'x**2*x', 'x^{ 2 }x'),
+    # antes: 'x**2.5' 'x^{ 2 }.5'
+    ('x^2.5', 'x**2.5', 'x^{ 2.5 }'),
+    # antes: 'sqrt(2.5)' '\\sqrt{2}.5'
+    ('√2.5', 'sqrt(2.5)', '\\sqrt{2.5}'),
+    # antes: '2*sin(x)' '2sen(x)'
+    ('2sen(x)', '2*sin(x)', '2\\sin(x)'),
+    # antes: 'tan(x)' '\\\\tan(x)'
+    ('tg(x)', 'tan(x)', '\\tan(x)'),
+    # antes: 'log10(100)' 'log₁₀(100)'
+    ('log₁₀(100)', 'log10(100)', '\\log_{10}(100)'),
+    # antes: 'sin(x)/(2)' '\\sin\\frac{x}{2}'
+    ('sen(x)/(2)', 'sin(x)/(2)', '\\sin(x)/(2)'),
+    # antes: 'pix' '\\pix'
+    ('πx', 'pi*x', '\\pi x'),
+    # antes: 'abs(x + )*y||' '|x + |y||'
+    ('|x + |y||', 'abs(x + abs(y))', '|x + |y||'),
+]
+
+
+def comprobar():
+    """Lista de (entrada, esperado, obtenido) que no coinciden."""
+    fallos = []
+    for entrada, python, latex in CASOS + CORRECCIONES:
+        obtenido = reescribir(entrada)
+        if obtenido != (python, latex):
+            fallos.append((entrada, (python, latex), obtenido))
+    return fallos
+
+
+def main():
+    fallos = comprobar()
+    for entrada, esperado, obtenido in fallos:
+        print(f"{entrada!r}: se esperaba {esperado!r}, se obtuvo {obtenido!r}")
+    print(f"{len(CASOS) + len(CORRECCIONES) - len(fallos)}/{len(CASOS) + len(CORRECCIONES)} casos correctos")
+
+
+if __name__ == "__main__":
+    main()